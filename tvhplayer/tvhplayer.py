@@ -8,12 +8,20 @@ from PyQt5.QtWidgets import (
     QListWidget, QDialog, QFormLayout, QLineEdit,
     QDialogButtonBox, QMessageBox, QApplication,
     QPushButton, QLabel, QSlider, QStatusBar, QGridLayout, QMenuBar, QRadioButton, QSpinBox, QGraphicsOpacityEffect, QFileDialog,
-    QMenu, QListWidgetItem, QTableWidget, QTableWidgetItem, QHeaderView, QTabWidget, QTextEdit, QSizePolicy, QToolButton, QShortcut, QCheckBox, QGroupBox  # Added QGroupBox here
+    QMenu, QTableWidget, QTableWidgetItem, QHeaderView, QTabWidget, QTextEdit, QSizePolicy, QToolButton, QShortcut, QCheckBox, QGroupBox,  # Added QGroupBox here
+    QTableView, QAbstractItemView, QStyledItemDelegate, QAbstractScrollArea, QToolTip,
+    QListView, QStyle, QStackedLayout
 )
-from PyQt5.QtCore import Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve, QAbstractAnimation, QRect, QCoreApplication
-from PyQt5.QtGui import QIcon, QPainter, QColor, QKeySequence, QPalette
+from PyQt5.QtCore import (
+    Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve, QAbstractAnimation, QRect, QCoreApplication,
+    QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractTableModel, QAbstractListModel,
+    QModelIndex, QEvent, QFile
+)
+from PyQt5.QtGui import QIcon, QPainter, QColor, QKeySequence, QPalette, QFont, QFontMetrics, QImage, QImageReader, QPixmap
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 # Replace this line:
 #from . import resources_rc
 
@@ -27,30 +35,46 @@ except ImportError:
 import time
 import subprocess
 import os
-import traceback
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import platform
+import hashlib
+import sqlite3
+import bisect
+import unicodedata
+from array import array
+from collections import OrderedDict, deque
 
 
 
 
 class Logger:
-    def __init__(self, name="TVHplayer"):
+    """Sets up the application log.
+
+    Records go through a QueueHandler to a QueueListener thread, which writes
+    them to the console and a rotating log file, so logging never blocks
+    the GUI thread on I/O. DEBUG records are only kept when debug is on.
+    """
+
+    def __init__(self, name="TVHplayer", debug=False):
+        level = logging.DEBUG if debug else logging.INFO
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(level)
+        self.logger.propagate = False
         
         # Create logs directory
         log_dir = Path.home() / '.tvhplayer' / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = log_dir / 'tvhplayer.log'
         
-        # Create timestamped log file
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = log_dir / f'tvhplayer_{timestamp}.log'
-        
-        # File handler with detailed formatting
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
+        # File handler with detailed formatting, keeping a few old files
+        file_handler = RotatingFileHandler(log_file, maxBytes=2 * 1024 * 1024, backupCount=3,
+                                           encoding='utf-8')
+        file_handler.setLevel(level)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s'
         )
@@ -58,19 +82,26 @@ class Logger:
         
         # Console handler with simpler formatting
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(level)
         console_formatter = logging.Formatter('%(levelname)s: %(message)s')
         console_handler.setFormatter(console_formatter)
         
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Hand records to the listener thread instead of writing them in place
+        log_queue = queue.SimpleQueue()
+        self.listener = QueueListener(log_queue, file_handler, console_handler,
+                                      respect_handler_level=True)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.listener.start()
         
         # Store log file path
         self.log_file = log_file
         
         # Log system info at startup
         self.log_system_info()
+
+    def stop(self):
+        """Flush pending records and stop the listener thread"""
+        self.listener.stop()
     
     def log_system_info(self):
         """Log detailed system information"""
@@ -81,75 +112,2601 @@ class Logger:
         except ImportError:
             psutil = None
         
-        self.logger.info("=== System Information ===")
-        self.logger.info(f"OS: {platform.platform()}")
-        self.logger.info(f"Python: {sys.version}")
-        self.logger.info(f"CPU: {platform.processor()}")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug("=== System Information ===")
+        self.logger.debug(f"OS: {platform.platform()}")
+        self.logger.debug(f"Python: {sys.version}")
+        self.logger.debug(f"CPU: {platform.processor()}")
         
         if psutil:
-            self.logger.info(f"Memory: {psutil.virtual_memory().total / (1024**3):.2f} GB")
-            self.logger.info(f"Disk Space: {psutil.disk_usage('/').free / (1024**3):.2f} GB free")
+            self.logger.debug(f"Memory: {psutil.virtual_memory().total / (1024**3):.2f} GB")
+            self.logger.debug(f"Disk Space: {psutil.disk_usage('/').free / (1024**3):.2f} GB free")
         
         # Log environment variables
-        self.logger.info("=== Environment Variables ===")
+        self.logger.debug("=== Environment Variables ===")
         for key, value in os.environ.items():
             if any(sensitive in key.lower() for sensitive in ['password', 'secret', 'key', 'token']):
-                self.logger.info(f"{key}=<REDACTED>")
+                self.logger.debug(f"{key}=<REDACTED>")
             else:
-                self.logger.info(f"{key}={value}")
+                self.logger.debug(f"{key}={value}")
         
-        self.logger.info("=== Dependencies ===")
+        self.logger.debug("=== Dependencies ===")
         try:
             import PyQt5
-            self.logger.info(f"PyQt5 version: {PyQt5.QtCore.QT_VERSION_STR}")
+            self.logger.debug(f"PyQt5 version: {PyQt5.QtCore.QT_VERSION_STR}")
         except ImportError:
             self.logger.error("PyQt5 not found")
         
         try:
-            import vlc
-            self.logger.info(f"python-vlc version: {vlc.__version__}")
-        except ImportError:
-            self.logger.error("python-vlc not found")
-        
+            import vlc
+            self.logger.debug(f"python-vlc version: {vlc.__version__}")
+        except ImportError:
+            self.logger.error("python-vlc not found")
+        
+        try:
+            import requests
+            self.logger.debug(f"requests version: {requests.__version__}")
+        except ImportError:
+            self.logger.error("requests not found")
+    
+    def debug(self, msg):
+        self.logger.debug(msg)
+    
+    def info(self, msg):
+        self.logger.info(msg)
+    
+    def warning(self, msg):
+        self.logger.warning(msg)
+    
+    def error(self, msg):
+        self.logger.error(msg)
+    
+    def critical(self, msg):
+        self.logger.critical(msg)
+    
+    def exception(self, msg):
+        self.logger.exception(msg)
+
+# Module-wide logger, configured by Logger in main()
+logger = logging.getLogger("TVHplayer")
+
+class ChannelStore:
+    """Column-oriented storage for a server's channel lineup.
+
+    Keeps one list per field instead of a dict per channel, which makes
+    large lineups much cheaper to hold, sort and compare. channel() builds
+    a dict for a single row when a caller needs one.
+    """
+
+    # Channel grid fields that are kept; the rest of the entry is dropped
+    FIELDS = ('uuid', 'name', 'number', 'icon_public_url')
+
+    def __init__(self, channels=()):
+        self.uuids = []
+        self.names = []
+        self.numbers = array('d')  # 0 for unnumbered channels
+        self.icons = []
+        self.extend(channels)
+
+    def extend(self, channels):
+        """Append channel grid entries"""
+        for channel in channels:
+            uuid = channel.get('uuid')
+            if not uuid:
+                continue
+            self.uuids.append(uuid)
+            self.names.append(channel.get('name') or 'Unknown Channel')
+            self.numbers.append(channel.get('number') or 0)
+            self.icons.append(channel.get('icon_public_url') or '')
+
+    def __len__(self):
+        return len(self.uuids)
+
+    def __eq__(self, other):
+        return (isinstance(other, ChannelStore)
+                and self.uuids == other.uuids
+                and self.names == other.names
+                and self.numbers == other.numbers
+                and self.icons == other.icons)
+
+    def number(self, row):
+        number = self.numbers[row]
+        return int(number) if number.is_integer() else number
+
+    def channel(self, row):
+        """Return the channel at a row as a dict"""
+        channel = {
+            'uuid': self.uuids[row],
+            'name': self.names[row],
+            'number': self.number(row),
+        }
+        if self.icons[row]:
+            channel['icon_public_url'] = self.icons[row]
+        return channel
+
+    def to_columns(self):
+        return {
+            'uuid': self.uuids,
+            'name': self.names,
+            'number': self.numbers.tolist(),
+            'icon_public_url': self.icons,
+        }
+
+    @classmethod
+    def from_columns(cls, columns):
+        store = cls()
+        store.uuids = list(columns['uuid'])
+        store.names = list(columns['name'])
+        store.numbers = array('d', columns['number'])
+        store.icons = list(columns['icon_public_url'])
+        if not (len(store.uuids) == len(store.names) == len(store.numbers) == len(store.icons)):
+            raise ValueError("Channel columns differ in length")
+        return store
+
+class ChannelIndex:
+    """Lookup of a server's channels by UUID, name and number"""
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else ChannelStore()
+        self.by_uuid = {}
+        self.by_name = {}
+        self.by_number = {}
+        for row, uuid in enumerate(self.store.uuids):
+            self.by_uuid[uuid] = row
+            # Keep the first channel for duplicate names/numbers, like a linear scan would
+            self.by_name.setdefault(self.store.names[row], row)
+            if self.store.numbers[row]:
+                self.by_number.setdefault(self.store.number(row), row)
+
+    def _channel(self, row):
+        return None if row is None else self.store.channel(row)
+
+    def get(self, uuid):
+        return self._channel(self.by_uuid.get(uuid))
+
+    def find_by_name(self, name):
+        return self._channel(self.by_name.get(name))
+
+    def find_by_number(self, number):
+        return self._channel(self.by_number.get(number))
+
+    def __len__(self):
+        return len(self.by_uuid)
+
+class ChannelLineup:
+    """Channels of several servers merged into one lineup.
+
+    Channels are matched by name, ignoring case and accents, so a channel
+    carried by several servers becomes one row. A server listing the same
+    name more than once is matched occurrence by occurrence, so regional
+    variants stay separate rows. Each row takes its UUID, number and logo
+    from the first server carrying it; sources lists every server that
+    can play it.
+    """
+
+    def __init__(self, stores):
+        self.stores = stores  # (server config, ChannelStore) in config order
+        self.store = ChannelStore()
+        self.sources = {}  # lineup uuid -> [(server config, channel uuid)] in config order
+        rows = {}  # (normalized name, occurrence) -> lineup uuid
+        for server, store in stores:
+            api = TVHeadendAPI.for_server(server)
+            occurrences = {}
+            for row, uuid in enumerate(store.uuids):
+                name = normalize_search_text(store.names[row])
+                occurrence = occurrences.get(name, 0)
+                occurrences[name] = occurrence + 1
+                lineup_uuid = rows.get((name, occurrence))
+                if lineup_uuid is None:
+                    channel = store.channel(row)
+                    # Logos are resolved against the server they came from
+                    icon = channel.get('icon_public_url')
+                    if icon and not icon.startswith(('http://', 'https://')):
+                        channel['icon_public_url'] = api.url(icon)
+                    self.store.extend([channel])
+                    lineup_uuid = rows[(name, occurrence)] = uuid
+                    self.sources[uuid] = []
+                self.sources[lineup_uuid].append((server, uuid))
+        self.index = ChannelIndex(self.store)
+
+class ChannelCache:
+    """On-disk copy of each server's channel list, stored in the config directory"""
+
+    def __init__(self, config_dir):
+        self.config_dir = config_dir
+
+    @staticmethod
+    def server_digest(server):
+        """Return a short file name key for a server (URL and username)"""
+        key = f"{server.get('url', '')}\0{server.get('username', '')}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def path(self, server):
+        return os.path.join(self.config_dir, f'channels_{self.server_digest(server)}.json')
+
+    def load(self, server):
+        """Return the cached ChannelStore of a server, or None"""
+        try:
+            with open(self.path(server), 'r') as f:
+                data = json.load(f)
+            if data.get('url') != server.get('url') or 'columns' not in data:
+                return None
+            return ChannelStore.from_columns(data['columns'])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error loading channel cache: {str(e)}")
+            return None
+
+    def save(self, server, store):
+        """Write the channel list of a server, replacing the file atomically"""
+        path = self.path(server)
+        tmp_path = f'{path}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'url': server.get('url'), 'saved': int(time.time()),
+                           'columns': store.to_columns()}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error saving channel cache: {str(e)}")
+
+def normalize_search_text(text):
+    """Casefold text and strip accents, so 'Télé' matches 'tele'"""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(text.casefold().split())
+
+class ChannelSearchIndex:
+    """Substring search over the channel names of a ChannelStore.
+
+    Names are normalised once and indexed by trigram, so a query of three
+    or more characters only has to check the channels sharing its rarest
+    trigram. Shorter queries scan the normalised names. All digit queries
+    also match channel numbers starting with them.
+    """
+
+    GRAM = 3
+
+    def __init__(self, store):
+        self.store = store
+        self.names = []
+        self.numbers = []
+        self.grams = {}  # trigram -> store rows, ascending
+        self.extend()
+
+    def extend(self):
+        """Index rows added to the store since the last call"""
+        store = self.store
+        for row in range(len(self.names), len(store)):
+            name = normalize_search_text(store.names[row])
+            self.names.append(name)
+            self.numbers.append(str(store.number(row)) if store.numbers[row] else '')
+            for gram in {name[i:i + self.GRAM] for i in range(len(name) - self.GRAM + 1)}:
+                self.grams.setdefault(gram, []).append(row)
+
+    def search(self, query, candidates=None):
+        """Return the set of store rows matching query.
+
+        candidates limits the rows checked, e.g. to the result of a shorter
+        query the new one extends.
+        """
+        query = normalize_search_text(query)
+        if not query:
+            return set(range(len(self.names)))
+        names = self.names
+        if len(query) >= self.GRAM:
+            postings = []
+            for i in range(len(query) - self.GRAM + 1):
+                rows = self.grams.get(query[i:i + self.GRAM])
+                if rows is None:
+                    postings = None
+                    break
+                postings.append(rows)
+            rows = min(postings, key=len) if postings else ()
+            if candidates is not None:
+                rows = candidates if len(candidates) < len(rows) else [row for row in rows if row in candidates]
+        else:
+            rows = candidates if candidates is not None else range(len(names))
+        matches = {row for row in rows if query in names[row]}
+        if query.isdigit():
+            numbers = self.numbers
+            if candidates is not None:
+                matches.update(row for row in candidates if numbers[row].startswith(query))
+            else:
+                matches.update(row for row, number in enumerate(numbers) if number.startswith(query))
+        return matches
+
+class ChannelTableModel(QAbstractTableModel):
+    """Channel list model over a ChannelStore.
+
+    Sorting and filtering work on lists of store rows in Python rather than
+    through a QSortFilterProxyModel, whose per-row data() and
+    filterAcceptsRow() calls are far slower for large lineups. A new
+    search only inserts and removes the rows whose visibility changed.
+    """
+
+    HEADERS = ('', 'Channel Name', 'Now Playing')
+
+    # Above this many changed rows a model reset is cheaper than row updates
+    MAX_DELTA_ROWS = 500
+
+    # Fraction of the current programme that has passed, or None
+    PROGRESS_ROLE = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = ChannelStore()
+        self._search_index = None  # built on the first search
+        self.sorted_rows = []  # all store rows in sort order
+        self.order = []  # display row -> store row, for rows matching the query
+        self.query = ''
+        self.matches = None  # store rows matching query, None when not filtering
+        self.sort_column = 0
+        self.sort_order = Qt.AscendingOrder
+        self.now_next = None  # NowNextSnapshot of the programmes shown
+        self.now_next_time = 0
+        self.now_next_boundary = None  # when the programmes shown change next
+        self.programmes = []  # store row -> (current, next) events in now_next
+        self.logo_loader = None
+        
+        # Logos arrive one at a time; repaint the name column once for a burst of them
+        self.logo_timer = QTimer(self)
+        self.logo_timer.setSingleShot(True)
+        self.logo_timer.setInterval(50)
+        self.logo_timer.timeout.connect(self.logos_changed)
+
+    def set_logo_loader(self, loader):
+        """Show channel logos from a LogoLoader next to the channel names"""
+        self.logo_loader = loader
+        loader.logo_loaded.connect(self.schedule_logos)
+
+    def schedule_logos(self, url):
+        if not self.logo_timer.isActive():
+            self.logo_timer.start()
+
+    def logos_changed(self):
+        if self.order:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self.order) - 1, 1),
+                                  [Qt.DecorationRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.order[index.row()]
+        if index.column() == 2:
+            return self.programme_data(row, role)
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return self.store.number(row)
+            return self.store.names[row]
+        if role == Qt.DecorationRole and index.column() == 1 and self.logo_loader is not None:
+            icon = self.store.icons[row]
+            return self.logo_loader.pixmap(icon) if icon else None
+        if role == Qt.UserRole:
+            return self.store.channel(row)
+        return None
+
+    def programme_data(self, row, role):
+        current, upcoming = self.programmes[row] if row < len(self.programmes) else (-1, -1)
+        snapshot = self.now_next
+        if role == Qt.DisplayRole:
+            return snapshot.title(current) if current >= 0 else ''
+        if role == Qt.ToolTipRole:
+            lines = []
+            if current >= 0:
+                lines.append(f"{datetime.fromtimestamp(snapshot.starts[current]).strftime('%H:%M')} - "
+                             f"{datetime.fromtimestamp(snapshot.stops[current]).strftime('%H:%M')} "
+                             f"{snapshot.title(current)}")
+            if upcoming >= 0:
+                lines.append(f"Next: {datetime.fromtimestamp(snapshot.starts[upcoming]).strftime('%H:%M')} "
+                             f"{snapshot.title(upcoming)}")
+            return '\n'.join(lines) or None
+        if role == self.PROGRESS_ROLE and current >= 0:
+            start, stop = snapshot.starts[current], snapshot.stops[current]
+            return min(1.0, max(0.0, (time.time() - start) / (stop - start))) if stop > start else None
+        if role == Qt.UserRole:
+            return self.store.channel(row)
+        return None
+
+    def set_now_next(self, snapshot, t):
+        """Show the current and next programmes of snapshot at time t"""
+        self.now_next = snapshot
+        self.now_next_time = t
+        self.programmes, self.now_next_boundary = snapshot.lookup(self.store.uuids, t)
+        if self.sort_column == 2:
+            self.sort(self.sort_column, self.sort_order)
+        if self.order:
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self.order) - 1, 2))
+
+    def extend_programmes(self):
+        """Look up the programmes of channels added to the store"""
+        if self.now_next is None:
+            self.programmes = []
+            return
+        uuids = self.store.uuids[len(self.programmes):]
+        programmes, boundary = self.now_next.lookup(uuids, self.now_next_time)
+        self.programmes.extend(programmes)
+        self.now_next_boundary = min(self.now_next_boundary, boundary)
+
+    def store_row(self, row):
+        """Return the store row shown at a model row"""
+        return self.order[row]
+
+    @property
+    def search_index(self):
+        if self._search_index is None:
+            self._search_index = ChannelSearchIndex(self.store)
+        return self._search_index
+
+    def find_row(self, uuid):
+        """Return the model row showing a channel, or -1"""
+        try:
+            return self.order.index(self.store.uuids.index(uuid))
+        except ValueError:
+            return -1
+
+    def visible_rows(self, matches):
+        if matches is None:
+            return list(self.sorted_rows)
+        return [row for row in self.sorted_rows if row in matches]
+
+    def set_store(self, store):
+        """Replace all channels in one model reset"""
+        self.beginResetModel()
+        self.store = store
+        self._search_index = None
+        self.programmes = []
+        self.extend_programmes()
+        self.sorted_rows = list(range(len(store)))
+        self.sorted_rows.sort(key=self.sort_key(self.sort_column),
+                              reverse=self.sort_order == Qt.DescendingOrder)
+        self.matches = self.search_index.search(self.query) if self.query else None
+        self.order = self.visible_rows(self.matches)
+        self.endResetModel()
+
+    def append(self, channels):
+        """Append channel grid entries and keep the current sort order"""
+        first = len(self.store)
+        self.store.extend(channels)
+        last = len(self.store)
+        if last == first:
+            return
+        if self._search_index is not None:
+            self._search_index.extend()
+        self.extend_programmes()
+        new_rows = range(first, last)
+        self.sorted_rows.extend(new_rows)
+        if self.matches is not None:
+            new_matches = self.search_index.search(self.query, new_rows)
+            self.matches.update(new_matches)
+            new_rows = sorted(new_matches)
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), len(self.order), len(self.order) + len(new_rows) - 1)
+            self.order.extend(new_rows)
+            self.endInsertRows()
+        self.sort(self.sort_column, self.sort_order)
+
+    def sort_key(self, column):
+        names = self.store.names
+        numbers = self.store.numbers
+        inf = float('inf')
+        if column == 0:
+            return lambda row: (numbers[row] or inf, names[row].lower())
+        if column == 2:
+            # Channels without a current programme last
+            return lambda row: (self.programme_data(row, Qt.DisplayRole).lower() or '\uffff',
+                                numbers[row] or inf)
+        return lambda row: (names[row].lower(), numbers[row] or inf)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        if column < 0:
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_rows = [self.order[index.row()] for index in persistent]
+        self.sorted_rows.sort(key=self.sort_key(column), reverse=order == Qt.DescendingOrder)
+        self.order = self.visible_rows(self.matches)
+        if persistent:
+            position = {row: i for i, row in enumerate(self.order)}
+            self.changePersistentIndexList(
+                persistent,
+                [self.index(position[row], index.column())
+                 for index, row in zip(persistent, persistent_rows)])
+        self.layoutChanged.emit()
+
+    def set_query(self, query):
+        """Show only channels matching query, updating just the rows that change"""
+        old_matches = self.matches
+        if not normalize_search_text(query):
+            new_matches = None
+        else:
+            candidates = None
+            if old_matches is not None and normalize_search_text(query).startswith(
+                    normalize_search_text(self.query)):
+                # The new query narrows the previous one
+                candidates = old_matches
+            new_matches = self.search_index.search(query, candidates)
+        self.query = query
+        if old_matches is None and new_matches is None:
+            return
+
+        if old_matches is None:
+            changed = len(self.store) - len(new_matches)
+        elif new_matches is None:
+            changed = len(self.store) - len(old_matches)
+        else:
+            changed = len(old_matches ^ new_matches)
+        new_order = self.visible_rows(new_matches)
+        if changed > self.MAX_DELTA_ROWS:
+            self.beginResetModel()
+            self.matches = new_matches
+            self.order = new_order
+            self.endResetModel()
+            return
+
+        # Remove rows that no longer match, last run first so positions stay valid
+        self.matches = new_matches
+        if new_matches is not None:
+            removed = [i for i, row in enumerate(self.order) if row not in new_matches]
+            for first, last in reversed(self.runs(removed)):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self.order[first:last + 1]
+                self.endRemoveRows()
+        # Insert rows that now match at their final positions, first run first
+        if old_matches is not None:
+            added = [i for i, row in enumerate(new_order) if row not in old_matches]
+            for first, last in self.runs(added):
+                self.beginInsertRows(QModelIndex(), first, last)
+                self.order[first:first] = new_order[first:last + 1]
+                self.endInsertRows()
+
+    @staticmethod
+    def runs(positions):
+        """Group ascending positions into (first, last) runs of consecutive values"""
+        runs = []
+        for position in positions:
+            if runs and runs[-1][1] == position - 1:
+                runs[-1][1] = position
+            else:
+                runs.append([position, position])
+        return runs
+
+class NowPlayingDelegate(QStyledItemDelegate):
+    """Paints the current programme with a bar showing how much has passed"""
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        progress = index.data(ChannelTableModel.PROGRESS_ROLE)
+        if progress is None:
+            return
+        rect = option.rect.adjusted(2, option.rect.height() - 4, -2, -1)
+        painter.save()
+        painter.fillRect(rect, option.palette.mid())
+        rect.setWidth(int(rect.width() * progress))
+        painter.fillRect(rect, option.palette.highlight())
+        painter.restore()
+
+class TVHeadendAPI:
+    """HTTP API client for a single TVHeadend server.
+
+    Holds a pooled keep-alive session with the server's credentials, so
+    repeated calls reuse the same TCP connection instead of paying the
+    connect and auth handshake every time. Use for_server() to get the
+    shared instance for a server config dict.
+    """
+
+    _instances = {}
+
+    # DVR entry actions, all taking one uuid or a JSON list of uuids
+    DVR_ACTIONS = {
+        'stop': 'api/dvr/entry/stop',
+        'cancel': 'api/dvr/entry/cancel',
+        'remove': 'api/dvr/entry/remove',
+        'rerecord': 'api/dvr/entry/rerecord/allow',
+    }
+    DVR_BATCH_SIZE = 100
+    # Concurrent requests when the server only accepts a single uuid
+    DVR_CONCURRENCY = 4
+    # Status requests that decide where to play from must not hold up playback
+    STATUS_TIMEOUT = 2
+
+    def __init__(self, server, timeout=10):
+        self.name = server.get('name', '')
+
+        # Normalise the base URL once
+        url = server.get('url', '').strip().rstrip('/')
+        if not url.startswith(('http://', 'https://')):
+            url = f'http://{url}'
+        self.base_url = url
+
+        self.username = server.get('username', '')
+        self.password = server.get('password', '')
+        self.auth = None
+        if self.username or self.password:
+            self.auth = (self.username, self.password)
+
+        self.timeout = timeout
+
+        # Channels of this server, replaced whenever the channel list is refreshed
+        self.channel_index = ChannelIndex()
+        self._notifier = None
+        self.dvr_batches = True  # cleared if the server rejects lists of uuids
+        self.latency = None  # moving average of status round trips, in seconds
+
+        # Retry only idempotent requests, mainly to recover from keep-alive
+        # connections the server has closed in the meantime
+        retry = Retry(total=2, connect=2, read=1, status=0,
+                      allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                      backoff_factor=0.1)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update({'Connection': 'keep-alive'})
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Health probes must report a failure straight away instead of retrying
+        self.probe_session = requests.Session()
+        self.probe_session.auth = self.auth
+        probe_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        self.probe_session.mount('http://', probe_adapter)
+        self.probe_session.mount('https://', probe_adapter)
+
+    @staticmethod
+    def server_key(server):
+        """Return the key identifying a server config (URL and credentials)"""
+        return (server.get('url', ''), server.get('username', ''), server.get('password', ''))
+
+    @classmethod
+    def for_server(cls, server):
+        """Return the shared API client for a server config dict"""
+        key = cls.server_key(server)
+        api = cls._instances.get(key)
+        if api is None:
+            api = cls(server)
+            cls._instances[key] = api
+        return api
+
+    @classmethod
+    def for_url(cls, url):
+        """Return the shared API client of the server a URL belongs to, or None"""
+        for api in list(cls._instances.values()):
+            if url.startswith(api.base_url + '/'):
+                return api
+        return None
+
+    @classmethod
+    def release_unused(cls, servers):
+        """Close clients for servers that are no longer configured"""
+        keep = {cls.server_key(server) for server in servers}
+        for key in list(cls._instances):
+            if key not in keep:
+                cls._instances.pop(key).close()
+
+    def url(self, path):
+        """Return the absolute URL for an API path"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path, params=None, timeout=None):
+        return self.session.get(self.url(path), params=params,
+                                timeout=timeout or self.timeout)
+
+    def post(self, path, data=None, timeout=None):
+        return self.session.post(self.url(path), data=data,
+                                 timeout=timeout or self.timeout)
+
+    def dvr_action(self, action, uuids):
+        """Apply a DVR action ('stop', 'cancel', 'remove' or 'rerecord') to entries.
+
+        Entries are sent in batches of DVR_BATCH_SIZE uuids per request. If
+        the server doesn't accept a uuid list (400 or 404), entries are sent
+        one per request with at most DVR_CONCURRENCY requests running at
+        once. Other errors fail the batch. Blocks, so call it on a worker
+        thread. Returns the uuids that failed.
+        """
+        path = self.DVR_ACTIONS[action]
+        uuids = list(uuids)
+        failed = []
+        single = []
+        for start in range(0, len(uuids), self.DVR_BATCH_SIZE):
+            batch = uuids[start:start + self.DVR_BATCH_SIZE]
+            if not self.dvr_batches or len(batch) == 1:
+                single.extend(batch)
+                continue
+            try:
+                response = self.post(path, data={'uuid': json.dumps(batch)})
+            except requests.RequestException as e:
+                logger.error(f"DVR {action} of {len(batch)} entries failed: {str(e)}")
+                failed.extend(batch)
+                continue
+            if response.status_code == 200:
+                logger.debug(f"DVR {action} of {len(batch)} entries done")
+            elif response.status_code in (400, 404):
+                logger.debug(f"Server rejected a DVR {action} batch ({response.status_code}), "
+                             f"sending one entry per request")
+                self.dvr_batches = False
+                single.extend(batch)
+            else:
+                # Permission and server errors would fail for single entries too
+                logger.error(f"DVR {action} of {len(batch)} entries failed: "
+                             f"HTTP {response.status_code}")
+                failed.extend(batch)
+        if single:
+            with ThreadPoolExecutor(max_workers=self.DVR_CONCURRENCY) as executor:
+                for uuid, ok in zip(single, executor.map(
+                        lambda uuid: self.dvr_entry_action(path, uuid), single)):
+                    if not ok:
+                        failed.append(uuid)
+        return failed
+
+    def dvr_entry_action(self, path, uuid):
+        try:
+            response = self.post(path, data={'uuid': uuid})
+        except requests.RequestException as e:
+            logger.error(f"{path} for {uuid} failed: {str(e)}")
+            return False
+        if response.status_code != 200:
+            logger.error(f"{path} for {uuid} failed: {response.status_code}")
+            return False
+        return True
+
+    def record_latency(self, round_trip):
+        if self.latency is None:
+            self.latency = round_trip
+        else:
+            self.latency = 0.7 * self.latency + 0.3 * round_trip
+
+    def ping(self):
+        """Return the round trip time of a server info request.
+
+        Updates latency. Blocks, so call it on a worker thread.
+        """
+        started = time.perf_counter()
+        response = self.probe_session.get(self.url('api/serverinfo'), timeout=self.STATUS_TIMEOUT)
+        response.raise_for_status()
+        round_trip = time.perf_counter() - started
+        self.record_latency(round_trip)
+        return round_trip
+
+    def input_status(self):
+        """Return the round trip time of an input status request and the idle inputs.
+
+        The idle count is None if the server lists no inputs, e.g. when it
+        only relays IPTV, or if the user may not see them. Updates latency.
+        Blocks, so call it on a worker thread.
+        """
+        started = time.perf_counter()
+        response = self.get('api/status/inputs', timeout=self.STATUS_TIMEOUT)
+        round_trip = time.perf_counter() - started
+        if response.status_code == 403:
+            # Input status needs admin rights; the server still answered
+            self.record_latency(round_trip)
+            return round_trip, None
+        response.raise_for_status()
+        inputs = response.json().get('entries', [])
+        self.record_latency(round_trip)
+        if not inputs:
+            return round_trip, None
+        return round_trip, sum(1 for entry in inputs if not entry.get('subs'))
+
+    def stream_url(self, channel_uuid, with_credentials=False):
+        """Return the HTTP stream URL for a channel"""
+        base_url = self.base_url
+        if with_credentials and self.auth:
+            base_url = base_url.replace('://', f'://{self.username}:{self.password}@', 1)
+        return f'{base_url}/stream/channel/{channel_uuid}'
+
+    def notifier(self):
+        """Return the comet notification subscriber of this server"""
+        if self._notifier is None:
+            self._notifier = ServerNotifier(self)
+        return self._notifier
+
+    def close(self):
+        if self._notifier is not None:
+            self._notifier.stop()
+        self.session.close()
+        self.probe_session.close()
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker, delivered on the GUI thread"""
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    progress = pyqtSignal(object)
+    finished = pyqtSignal()
+
+class Worker(QRunnable):
+    """Run a callable on the thread pool and report back through signals"""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Background task {getattr(self.fn, '__name__', self.fn)} failed: {str(e)}")
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+# Workers that are queued or running. Holding a reference keeps their signal
+# objects alive until the GUI thread has received the finished signal.
+_active_workers = set()
+
+# Workers mostly wait on the network, so don't limit them to the CPU count
+# like the thread pool does by default
+BACKGROUND_THREADS = 8
+
+def run_in_background(fn, *args, on_result=None, on_error=None, on_finished=None,
+                      on_progress=None, **kwargs):
+    """Run fn(*args, **kwargs) off the GUI thread.
+
+    on_result receives the return value and on_error the raised exception;
+    both are called on the GUI thread. If on_progress is given, fn is also
+    passed a progress_callback it can call with partial results.
+    """
+    worker = Worker(fn, *args, **kwargs)
+    if on_progress:
+        worker.kwargs['progress_callback'] = worker.signals.progress.emit
+        worker.signals.progress.connect(on_progress)
+    if on_result:
+        worker.signals.result.connect(on_result)
+    if on_error:
+        worker.signals.error.connect(on_error)
+    if on_finished:
+        worker.signals.finished.connect(on_finished)
+    worker.signals.finished.connect(lambda: _active_workers.discard(worker))
+    _active_workers.add(worker)
+    pool = QThreadPool.globalInstance()
+    if pool.maxThreadCount() < BACKGROUND_THREADS:
+        pool.setMaxThreadCount(BACKGROUND_THREADS)
+    pool.start(worker)
+    return worker
+
+class ServerNotifier(QObject):
+    """Subscriber to a server's comet notifications.
+
+    TVHeadend announces changes to DVR entries, subscriptions, input status
+    and so on through a mailbox that is long-polled at /comet/poll. While at
+    least one listener is subscribed, a thread polls the mailbox and emits
+    each message on the GUI thread. available is emitted with True whenever
+    a new mailbox is opened, since notifications may have been missed before
+    it, and with False when polling fails, so listeners can fall back to
+    polling the API themselves.
+    """
+    notification = pyqtSignal(str, object)  # notificationClass, message
+    available = pyqtSignal(bool)
+
+    # The server holds a poll for about 10 seconds when nothing happens
+    POLL_TIMEOUT = 30
+    MAX_RETRY_DELAY = 60
+
+    def __init__(self, api):
+        super().__init__()
+        self.api = api
+        self.listeners = 0
+        self.is_available = False
+        self.generation = 0  # bumped to stop the running poll loop
+
+    def subscribe(self, on_notification, on_available):
+        self.notification.connect(on_notification)
+        self.available.connect(on_available)
+        self.listeners += 1
+        if self.listeners == 1:
+            self.generation += 1
+            threading.Thread(target=self.poll, args=(self.generation,),
+                             name=f"comet-{self.api.name}", daemon=True).start()
+
+    def unsubscribe(self, on_notification, on_available):
+        self.notification.disconnect(on_notification)
+        self.available.disconnect(on_available)
+        self.listeners -= 1
+        if self.listeners == 0:
+            self.stop()
+
+    def stop(self):
+        self.generation += 1
+        self.is_available = False
+
+    def set_available(self, generation, available):
+        if generation == self.generation and available != self.is_available:
+            self.is_available = available
+            self.available.emit(available)
+
+    def poll(self, generation):
+        """Poll the mailbox until stop() is called (runs on its own thread)"""
+        boxid = None
+        failures = 0
+        while generation == self.generation:
+            data = {'immediate': 0}
+            if boxid:
+                data['boxid'] = boxid
+            try:
+                response = self.api.post('comet/poll', data=data, timeout=self.POLL_TIMEOUT)
+                response.raise_for_status()
+                result = response.json()
+            except Exception as e:
+                failures += 1
+                if failures == 1:
+                    logger.warning(f"Comet notifications from {self.api.base_url} unavailable: {str(e)}")
+                boxid = None
+                self.set_available(generation, False)
+                # Back off, but keep checking whether we've been stopped
+                deadline = time.time() + min(2 ** failures, self.MAX_RETRY_DELAY)
+                while generation == self.generation and time.time() < deadline:
+                    time.sleep(0.5)
+                continue
+            if generation != self.generation:
+                break
+            failures = 0
+            if result.get('boxid') != boxid:
+                boxid = result.get('boxid')
+                logger.debug(f"Opened comet mailbox {boxid} on {self.api.base_url}")
+                self.is_available = False
+                self.set_available(generation, True)
+            for message in result.get('messages', []):
+                notification_class = message.get('notificationClass')
+                if notification_class:
+                    self.notification.emit(notification_class, message)
+
+def percentile(values, p):
+    """Return the p-th percentile of values, or None if there are none"""
+    values = sorted(values)
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+class ServerHealth:
+    """Rolling results of the health probes of one server"""
+
+    SAMPLES = 100
+    # Consecutive failed probes after which a server counts as down
+    DOWN_AFTER = 2
+    # 95th percentile round trip above which a server counts as slow
+    SLOW_AFTER = 1.0
+
+    def __init__(self):
+        self.round_trips = deque(maxlen=self.SAMPLES)  # seconds, None for failed probes
+        self.failures = 0  # consecutive failed probes
+        self.last_error = ''
+        self.checked = None
+
+    def record(self, round_trip, error=None):
+        self.round_trips.append(round_trip)
+        self.checked = time.time()
+        if error is None:
+            self.failures = 0
+        else:
+            self.failures += 1
+            self.last_error = error
+
+    def percentile(self, p):
+        """Return the p-th percentile of the successful round trips, or None"""
+        return percentile([rt for rt in self.round_trips if rt is not None], p)
+
+    def availability(self):
+        if not self.round_trips:
+            return None
+        return sum(1 for rt in self.round_trips if rt is not None) / len(self.round_trips)
+
+    @property
+    def state(self):
+        if self.failures >= self.DOWN_AFTER:
+            return 'down'
+        p95 = self.percentile(95)
+        if p95 is None:
+            # Nothing has succeeded yet, e.g. the first probe failed
+            return 'unknown'
+        if p95 > self.SLOW_AFTER:
+            return 'slow'
+        return 'up'
+
+    def summary(self):
+        """Return a one-line description of the server's health"""
+        state = self.state
+        if state == 'down':
+            return f"down ({self.last_error})"
+        if not self.round_trips:
+            return "not checked yet"
+        
+        def ms(p):
+            value = self.percentile(p)
+            return f"{value * 1000:.0f} ms" if value is not None else "-"
+        
+        if state == 'unknown':
+            return f"not reachable yet ({self.last_error})"
+        return (f"{state}, {ms(50)} median, {ms(95)} p95, {ms(99)} p99, "
+                f"{self.availability():.0%} available")
+
+class HealthProber(QObject):
+    """Checks the configured servers in the background.
+
+    Every INTERVAL each server is sent a server info request on a session
+    without retries, and the round trip or failure is recorded in its
+    ServerHealth. A failed probe is repeated after RECHECK_DELAY instead of
+    waiting for the next round, so an outage is noticed within a few
+    seconds. state_changed is emitted when a server goes up, slow or down.
+    """
+    updated = pyqtSignal()
+    state_changed = pyqtSignal(object, str)  # server config, new state
+
+    INTERVAL = 2000
+    RECHECK_DELAY = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.servers = []
+        self.health = {}  # server key -> ServerHealth
+        self.in_flight = set()  # server keys
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.probe_all)
+
+    def set_servers(self, servers):
+        self.servers = servers
+        keys = {TVHeadendAPI.server_key(server) for server in servers}
+        for key in list(self.health):
+            if key not in keys:
+                del self.health[key]
+
+    def start(self):
+        self.timer.start(self.INTERVAL)
+        self.probe_all()
+
+    def stop(self):
+        self.timer.stop()
+
+    def health_of(self, server):
+        key = TVHeadendAPI.server_key(server)
+        health = self.health.get(key)
+        if health is None:
+            health = self.health[key] = ServerHealth()
+        return health
+
+    def is_down(self, server):
+        key = TVHeadendAPI.server_key(server)
+        return key in self.health and self.health[key].state == 'down'
+
+    def is_healthy(self, server):
+        health = self.health.get(TVHeadendAPI.server_key(server))
+        return health is not None and health.state in ('up', 'slow')
+
+    def summary(self, server):
+        health = self.health.get(TVHeadendAPI.server_key(server))
+        return health.summary() if health is not None else "not checked yet"
+
+    def probe_all(self):
+        for server in self.servers:
+            self.probe(server)
+
+    def probe(self, server):
+        """Check a server now, unless a check of it is already running"""
+        key = TVHeadendAPI.server_key(server)
+        if key in self.in_flight:
+            return
+        self.in_flight.add(key)
+        run_in_background(
+            TVHeadendAPI.for_server(server).ping,
+            on_result=lambda round_trip: self.on_probe_done(server, round_trip, None),
+            on_error=lambda e: self.on_probe_done(server, None, self.describe_error(e)),
+            on_finished=lambda: self.in_flight.discard(key))
+
+    @staticmethod
+    def describe_error(error):
+        if isinstance(error, requests.Timeout):
+            return "timed out"
+        if isinstance(error, requests.ConnectionError):
+            return "connection failed"
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return f"HTTP {error.response.status_code}"
+        return str(error)
+
+    def on_probe_done(self, server, round_trip, error):
+        key = TVHeadendAPI.server_key(server)
+        if key not in {TVHeadendAPI.server_key(s) for s in self.servers}:
+            return
+        health = self.health_of(server)
+        state = health.state
+        health.record(round_trip, error)
+        if error is not None and health.failures == 1:
+            QTimer.singleShot(self.RECHECK_DELAY, lambda: self.probe(server))
+        if health.state != state:
+            logger.info(f"Server {server.get('name', '')} is {health.state}: {health.summary()}")
+            self.state_changed.emit(server, health.state)
+        self.updated.emit()
+
+class ZapStats:
+    """Time to first frame of one channel on one server"""
+
+    # Upper bounds of the histogram buckets in ms; the last bucket has none
+    BUCKETS = (100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000)
+    SAMPLES = 200
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BUCKETS) + 1)
+        self.samples = deque(maxlen=self.SAMPLES)  # ms, most recent last
+        self.failures = 0
+
+    def add(self, ms):
+        self.buckets[bisect.bisect_left(self.BUCKETS, ms)] += 1
+        self.samples.append(round(ms, 1))
+
+    @property
+    def count(self):
+        return sum(self.buckets)
+
+    @classmethod
+    def bucket_label(cls, i):
+        if i == len(cls.BUCKETS):
+            return f">{cls.BUCKETS[-1] / 1000:g}s"
+        bound = cls.BUCKETS[i]
+        return f"<{bound / 1000:g}s" if bound >= 1000 else f"<{bound}"
+
+    def to_json(self):
+        return {'buckets': self.buckets, 'samples': list(self.samples), 'failures': self.failures}
+
+    @classmethod
+    def from_json(cls, data):
+        stats = cls()
+        buckets = data.get('buckets', [])
+        if len(buckets) == len(stats.buckets):
+            stats.buckets = list(buckets)
+        stats.samples.extend(data.get('samples', []))
+        stats.failures = data.get('failures', 0)
+        return stats
+
+class ZapTracker(QObject):
+    """Measures how long each channel switch takes to show its first frame.
+
+    start() is called when a channel is requested. The media player's
+    Opening, Buffering, Playing, Vout and EncounteredError events are
+    timestamped on VLC's threads and handed to the GUI thread through
+    vlc_event. The first video output ends the zap; channels without
+    video end at the Playing event once TIMEOUT has passed, and zaps
+    that fail or never start playing count as failures. Results are
+    kept per server and channel in ZapStats and saved to path.
+    """
+    vlc_event = pyqtSignal(object, str, float)  # player, event name, time.perf_counter() of the event
+    zap_finished = pyqtSignal(object, object)  # zap, ms to first frame or None if it failed
+
+    EVENTS = ('MediaPlayerOpening', 'MediaPlayerBuffering', 'MediaPlayerPlaying',
+              'MediaPlayerVout', 'MediaPlayerEncounteredError')
+    TIMEOUT = 15000
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.stats = {}  # (server name, channel name) -> ZapStats
+        self.zap = None  # zap being measured
+        self.player = None  # player whose events are measured
+        self.vlc_event.connect(self.on_vlc_event)
+        
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.timeout.connect(self.on_timeout)
+        
+        # Write the statistics once for a series of zaps
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(5000)
+        self.save_timer.timeout.connect(self.save)
+        self.load()
+
+    def attach(self, player):
+        """Listen to the events of a media player"""
+        manager = player.event_manager()
+        for name in self.EVENTS:
+            event_type = getattr(vlc.EventType, name, None)
+            if event_type is not None:
+                manager.event_attach(
+                    event_type, lambda event, name=name: self.vlc_event.emit(player, name, time.perf_counter()))
+
+    def set_player(self, player):
+        """Measure the events of one of the attached players"""
+        self.player = player
+
+    def start(self, channel_name, requested=None):
+        """Start measuring a zap to a channel, requested at a time.perf_counter() time"""
+        self.zap = {
+            'channel': channel_name,
+            'server': '',
+            'requested': requested if requested is not None else time.perf_counter(),
+            'events': {},  # event name -> ms after the request
+        }
+        self.timeout_timer.start(self.TIMEOUT)
+
+    def set_server(self, server_name):
+        """Record the server the zap is played from, once it is known"""
+        if self.zap is not None:
+            self.zap['server'] = server_name
+
+    def cancel(self):
+        self.zap = None
+        self.timeout_timer.stop()
+
+    def shown(self):
+        """End the zap now, for players that already showed a frame before it started"""
+        self.on_vlc_event(self.player, 'MediaPlayerVout', time.perf_counter())
+
+    def on_vlc_event(self, player, name, at):
+        zap = self.zap
+        # Events of the previous media may arrive after the next zap has started
+        if zap is None or player is not self.player or at < zap['requested']:
+            return
+        ms = (at - zap['requested']) * 1000
+        zap['events'].setdefault(name, ms)
+        if name == 'MediaPlayerVout':
+            self.finish(ms)
+        elif name == 'MediaPlayerEncounteredError':
+            self.finish(None)
+
+    def on_timeout(self):
+        if self.zap is not None:
+            # Radio channels never get a video output
+            self.finish(self.zap['events'].get('MediaPlayerPlaying'))
+
+    def finish(self, ms):
+        zap = self.zap
+        self.zap = None
+        self.timeout_timer.stop()
+        stats = self.stats.get((zap['server'], zap['channel']))
+        if stats is None:
+            stats = self.stats[(zap['server'], zap['channel'])] = ZapStats()
+        if ms is None:
+            stats.failures += 1
+            logger.debug(f"Zap to {zap['channel']} failed: {zap['events']}")
+        else:
+            stats.add(ms)
+            logger.debug(f"Zap to {zap['channel']} on {zap['server']}: first frame after "
+                         f"{ms:.0f} ms, events {zap['events']}")
+        self.save_timer.start()
+        self.zap_finished.emit(zap, ms)
+
+    def total(self):
+        """Return the statistics of all channels combined"""
+        total = ZapStats()
+        total.samples = deque(maxlen=None)
+        for stats in self.stats.values():
+            total.buckets = [a + b for a, b in zip(total.buckets, stats.buckets)]
+            total.samples.extend(stats.samples)
+            total.failures += stats.failures
+        return total
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            for entry in data.get('channels', []):
+                self.stats[(entry['server'], entry['channel'])] = ZapStats.from_json(entry)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading zap statistics: {str(e)}")
+
+    def save(self):
+        self.save_timer.stop()
+        data = {'channels': [dict(stats.to_json(), server=server, channel=channel)
+                             for (server, channel), stats in self.stats.items()]}
+        run_in_background(self.write, data)
+
+    def write(self, data):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+class ZapBenchmark(QObject):
+    """Zaps through the channel list and reports the time to first frame.
+
+    Plays count channels from the top of the channel list, or the whole
+    list repeatedly, staying DWELL ms on each after its first frame. The
+    report, with the VLC caching settings it ran with, is logged, printed
+    and written to report_path, and finished is emitted.
+    """
+    finished = pyqtSignal(object)  # report dict
+
+    DWELL = 1000
+    # How long to wait for the channel list to load
+    STARTUP_TIMEOUT = 60
+
+    def __init__(self, client, count, report_path, parent=None):
+        super().__init__(parent)
+        self.client = client
+        self.count = count
+        self.report_path = report_path
+        self.results = []  # (server, channel, ms or None)
+        self.started = None
+        self.wait_timer = QTimer(self)
+        self.wait_timer.timeout.connect(self.wait_for_channels)
+
+    def start(self):
+        self.started = time.time()
+        self.client.zap_tracker.zap_finished.connect(self.on_zap_finished)
+        self.wait_timer.start(500)
+
+    def wait_for_channels(self):
+        if self.client.channel_model.rowCount():
+            self.wait_timer.stop()
+            logger.info(f"Zap benchmark: {self.count} zaps")
+            self.next_zap()
+        elif time.time() - self.started > self.STARTUP_TIMEOUT:
+            self.wait_timer.stop()
+            self.report()
+
+    def next_zap(self):
+        if len(self.results) >= self.count:
+            self.report()
+            return
+        model = self.client.channel_model
+        rows = model.rowCount()
+        if not rows:
+            self.report()
+            return
+        channel = model.index(len(self.results) % rows, 1).data(Qt.UserRole)
+        self.client.play_channel_by_data(channel)
+
+    def on_zap_finished(self, zap, ms):
+        self.results.append((zap['server'], zap['channel'], ms))
+        QTimer.singleShot(self.DWELL, self.next_zap)
+
+    def report(self):
+        self.client.zap_tracker.zap_finished.disconnect(self.on_zap_finished)
+        times = [ms for _, _, ms in self.results if ms is not None]
+        report = {
+            'zaps': len(self.results),
+            'failures': len(self.results) - len(times),
+            'p50': percentile(times, 50),
+            'p95': percentile(times, 95),
+            'p99': percentile(times, 99),
+            'network_caching': self.client.network_caching,
+            'servers': sorted({server for server, _, _ in self.results}),
+            'results': [{'server': server, 'channel': channel, 'ms': ms}
+                        for server, channel, ms in self.results],
+        }
+        summary = "Zap benchmark: {} zaps, {} failed, p50 {}, p95 {}, p99 {} (network caching {} ms)".format(
+            report['zaps'], report['failures'],
+            *[f"{report[p]:.0f} ms" if report[p] is not None else "-" for p in ('p50', 'p95', 'p99')],
+            report['network_caching'])
+        logger.info(summary)
+        try:
+            with open(self.report_path, 'w') as f:
+                json.dump(report, f, indent=2)
+            logger.info(f"Zap benchmark report written to {self.report_path}")
+        except OSError as e:
+            logger.error(f"Error writing zap benchmark report: {str(e)}")
+        self.finished.emit(report)
+
+def set_video_output(player, widget):
+    """Make a media player draw into a widget"""
+    handle = widget.winId().__int__()
+    if sys.platform.startswith('linux'):
+        player.set_xwindow(handle)
+    elif sys.platform == "win32":
+        player.set_hwnd(handle)
+    elif sys.platform == "darwin":
+        player.set_nsobject(handle)
+
+def media_read_bytes(player):
+    """Return how many bytes a media player has read of its media, or None if unknown"""
+    media = player.get_media()
+    if not media:
+        return None
+    try:
+        # Different versions of python-vlc have different APIs for get_stats
+        try:
+            stats = media.get_stats()
+        except TypeError:
+            stats = vlc.MediaStats()
+            media.get_stats(stats)
+        return stats.read_bytes
+    except Exception:
+        return None
+
+class ZapEngine(QObject):
+    """Switches channels through media players kept open on the likely next channels.
+
+    Each player draws into its own surface of a QStackedLayout on the
+    video frame, and only the active one is shown. prewarm() opens muted
+    standby players; play() brings the standby open on a channel to the
+    front, and the player it replaces stays open on the previous channel.
+
+    Every standby holds a server subscription. At most tuners are kept
+    (none by default), only on servers that report an idle tuner input.
+    With a bandwidth limit in Mbit/s, only as many as fit at the bit rate
+    of the playing stream are opened.
+    """
+    player_event = pyqtSignal(object, str)  # player, VLC event name
+
+    EVENTS = ('MediaPlayerVout', 'MediaPlayerEncounteredError', 'MediaPlayerEndReached')
+    MAX_TUNERS = 3
+
+    def __init__(self, instance, player, video_frame, tuners=0, bandwidth=0, parent=None):
+        super().__init__(parent)
+        self.instance = instance
+        self.tuners = max(0, min(tuners, self.MAX_TUNERS))
+        self.bandwidth = bandwidth
+        # Tuner checks of earlier prewarm() calls are dropped once this changes
+        self.generation = 0
+        # (time.perf_counter(), bytes read) when the active player started its stream
+        self.rate_start = None
+        self.player_event.connect(self.on_player_event)
+        
+        self.layout = QStackedLayout(video_frame)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.active = self.add_slot(player)
+        self.standbys = [self.add_slot(instance.media_player_new()) for _ in range(self.tuners)]
+        self.layout.setCurrentWidget(self.active['surface'])
+
+    def add_slot(self, player):
+        surface = QWidget()
+        self.layout.addWidget(surface)
+        manager = player.event_manager()
+        for name in self.EVENTS:
+            event_type = getattr(vlc.EventType, name, None)
+            if event_type is not None:
+                manager.event_attach(
+                    event_type, lambda event, name=name: self.player_event.emit(player, name))
+        # key is the (server key, channel uuid) the player is open on
+        return {'player': player, 'surface': surface, 'key': None, 'ready': False}
+
+    @property
+    def player(self):
+        """The media player shown"""
+        return self.active['player']
+
+    @property
+    def players(self):
+        return [self.active['player']] + [slot['player'] for slot in self.standbys]
+
+    def attach_outputs(self):
+        """Point every player at its surface, e.g. after the video frame was reparented"""
+        for slot in [self.active] + self.standbys:
+            set_video_output(slot['player'], slot['surface'])
+
+    def has(self, server, channel_uuid):
+        """Return whether a standby is open on a channel"""
+        key = (TVHeadendAPI.server_key(server), channel_uuid)
+        return any(slot['key'] == key for slot in self.standbys)
+
+    def play(self, server, channel_uuid, url):
+        """Play a channel, switching to the standby open on it if there is one.
+
+        Returns True if a standby was switched to and False if the active
+        player opened the stream.
+        """
+        key = (TVHeadendAPI.server_key(server), channel_uuid)
+        self.generation += 1
+        slot = next((slot for slot in self.standbys if slot['key'] == key), None)
+        if slot is None:
+            player = self.active['player']
+            player.set_media(self.instance.media_new(url))
+            player.play()
+            self.active['key'] = key
+            self.active['ready'] = False
+        else:
+            self.swap(slot)
+            logger.debug(f"Switched to the pre-opened player of {channel_uuid}")
+        self.rate_start = (time.perf_counter(), media_read_bytes(self.active['player']) or 0)
+        return slot is not None
+
+    def swap(self, slot):
+        old = self.active['player']
+        player = slot['player']
+        volume = old.audio_get_volume()
+        if isinstance(volume, int) and volume >= 0:
+            player.audio_set_volume(volume)
+        player.audio_set_mute(bool(old.audio_get_mute()))
+        old.audio_set_mute(True)
+        self.layout.setCurrentWidget(slot['surface'])
+        self.standbys[self.standbys.index(slot)] = self.active
+        self.active = slot
+
+    def is_ready(self):
+        """Return whether the active player has shown a frame of its stream"""
+        return self.active['ready']
+
+    def on_player_event(self, player, name):
+        slot = next((slot for slot in [self.active] + self.standbys if slot['player'] is player), None)
+        if slot is None or slot['key'] is None:
+            return
+        if name == 'MediaPlayerVout':
+            slot['ready'] = True
+        elif slot is not self.active:
+            # A standby that failed or whose stream ended can't be switched to
+            logger.debug(f"Pre-opened player of {slot['key'][1]} stopped: {name}")
+            self.release(slot)
+
+    def release(self, slot):
+        slot['player'].stop()
+        slot['key'] = None
+        slot['ready'] = False
+
+    def release_server(self, server_key):
+        """Close the standbys open on a server"""
+        for slot in self.standbys:
+            if slot['key'] is not None and slot['key'][0] == server_key:
+                self.release(slot)
+
+    def stop(self):
+        """Stop playback and close all standbys"""
+        self.generation += 1
+        self.release(self.active)
+        for slot in self.standbys:
+            if slot['key'] is not None:
+                self.release(slot)
+
+    def stream_rate(self):
+        """Return the bit rate of the stream shown in Mbit/s, or None if unknown"""
+        if self.rate_start is None:
+            return None
+        started, start_bytes = self.rate_start
+        read = media_read_bytes(self.active['player'])
+        elapsed = time.perf_counter() - started
+        if read is None or read <= start_bytes or elapsed <= 0:
+            return None
+        return (read - start_bytes) * 8 / elapsed / 1e6
+
+    def budget(self):
+        """Return how many standbys may be open"""
+        if not self.bandwidth:
+            return self.tuners
+        rate = self.stream_rate()
+        if rate is None:
+            # Without a bit rate the bandwidth limit can't be kept
+            return 0
+        return min(self.tuners, int(self.bandwidth / rate))
+
+    def prewarm(self, candidates):
+        """Open standbys on the first channels of candidates that fit the budget.
+
+        candidates are (server config, channel uuid, stream url) tuples, most
+        likely first. Standbys open on other channels are closed.
+        """
+        self.generation += 1
+        generation = self.generation
+        wanted = []
+        for server, channel_uuid, url in candidates:
+            key = (TVHeadendAPI.server_key(server), channel_uuid)
+            if key != self.active['key'] and all(key != k for _, k, _ in wanted):
+                wanted.append((server, key, url))
+        wanted = wanted[:self.budget()]
+        keys = [key for _, key, _ in wanted]
+        for slot in self.standbys:
+            if slot['key'] is not None and slot['key'] not in keys:
+                self.release(slot)
+        open_keys = [slot['key'] for slot in self.standbys]
+        missing = [candidate for candidate in wanted if candidate[1] not in open_keys]
+        if missing:
+            run_in_background(
+                self.idle_inputs, [server for server, _, _ in missing],
+                on_result=lambda idle: self.open_standbys(generation, missing, idle))
+
+    def idle_inputs(self, servers):
+        """Return server key -> idle tuner inputs, None if unknown (runs on a worker thread)"""
+        idle = {}
+        for server in servers:
+            key = TVHeadendAPI.server_key(server)
+            if key in idle:
+                continue
+            try:
+                idle[key] = TVHeadendAPI.for_server(server).input_status()[1]
+            except (requests.RequestException, ValueError) as e:
+                logger.debug(f"Not pre-opening channels of {server['name']}: {str(e)}")
+                idle[key] = 0
+        return idle
+
+    def open_standbys(self, generation, missing, idle):
+        if generation != self.generation:
+            return
+        for server, key, url in missing:
+            available = idle.get(key[0])
+            if not available:
+                # No idle tuner, or the server doesn't say (IPTV inputs, no admin rights)
+                continue
+            idle[key[0]] = available - 1
+            slot = next((slot for slot in self.standbys if slot['key'] is None), None)
+            if slot is None:
+                break
+            player = slot['player']
+            player.audio_set_mute(True)
+            player.set_media(self.instance.media_new(url))
+            player.play()
+            slot['key'] = key
+            slot['ready'] = False
+            logger.debug(f"Pre-opened {key[1]} on {server['name']}")
+
+def epg_text(value, default=''):
+    """Return an EPG text field, which may be a dict of translations, as a string"""
+    if isinstance(value, dict):
+        return value.get('eng') or next(iter(value.values()), default)
+    return default if value is None else str(value)
+
+class EPGStore(QObject):
+    """Local copy of a server's EPG in an SQLite database.
+
+    The whole guide is downloaded page by page from /api/epg/events/grid in
+    the background, then kept up to date from the server's 'epg' comet
+    notifications and downloaded again every FULL_REFRESH_INTERVAL, so
+    browsing and searching it needs no network calls.
+
+    Events are indexed by (channel, start) and by start. Since no event is
+    longer than the longest one stored, the events overlapping [t0, t1)
+    are found with the index range start >= t0 - max_duration. Titles,
+    subtitles and descriptions are indexed with FTS5 when SQLite has it.
+    """
+    updated = pyqtSignal()
+
+    SCHEMA_VERSION = 1
+    PAGE_SIZE = 2000
+    FULL_REFRESH_INTERVAL = 6 * 3600
+    # Keep events that ended recently, e.g. for the grid around now
+    KEEP_PAST = 6 * 3600
+
+    def __init__(self, api, path, parent=None):
+        super().__init__(parent)
+        self.api = api
+        self.path = path
+        self.reader = None  # connection used on the GUI thread
+        self.fts = False
+        self.max_duration = 0
+        self.refreshed = 0  # time of the last complete download
+        self.refreshing = False
+        # Generation of the complete download running, if any; events stored
+        # meanwhile get it too, so its final prune keeps them
+        self.download_generation = None
+        self.changed_ids = set()  # events announced as created or updated
+        self.deleted_ids = set()
+        self.loaded_channels = set()  # channels downloaded on their own
+        self.changes_pending = False
+        self.notifier = None
+        self.setup()
+        
+        # Batch notifications arriving together into one request
+        self.changes_timer = QTimer(self)
+        self.changes_timer.setSingleShot(True)
+        self.changes_timer.setInterval(500)
+        self.changes_timer.timeout.connect(self.load_changes)
+        
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(15 * 60 * 1000)
+        self.refresh_timer.timeout.connect(self.refresh_if_stale)
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def setup(self):
+        """Create the database, starting over if it has an older schema"""
+        conn = self.connect()
+        with conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                for name, kind in conn.execute(
+                        "SELECT name, type FROM sqlite_master WHERE type IN ('table', 'trigger') "
+                        "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE 'events_fts_%'").fetchall():
+                    conn.execute(f'DROP {kind.upper()} IF EXISTS {name}')
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS events (
+                    event_id INTEGER PRIMARY KEY,
+                    channel TEXT NOT NULL,
+                    start INTEGER NOT NULL,
+                    stop INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    subtitle TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    generation INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS events_channel_start ON events (channel, start);
+                CREATE INDEX IF NOT EXISTS events_start ON events (start);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+            """)
+            self.fts = self.create_fts(conn)
+            conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        self.reader = conn
+        self.load_meta()
+
+    @staticmethod
+    def create_fts(conn):
+        """Create the full-text index if SQLite has FTS5; returns whether it exists"""
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'events_fts'").fetchone():
+            return True
+        for tokenizer in ('unicode61 remove_diacritics 2', 'unicode61'):
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE events_fts USING fts5("
+                    "title, subtitle, description, content='events', content_rowid='event_id', "
+                    f"tokenize='{tokenizer}')")
+                break
+            except sqlite3.OperationalError:
+                continue
+        else:
+            logger.debug("SQLite has no FTS5, EPG search will scan the events")
+            return False
+        conn.executescript("""
+            CREATE TRIGGER events_ai AFTER INSERT ON events BEGIN
+                INSERT INTO events_fts (rowid, title, subtitle, description)
+                VALUES (new.event_id, new.title, new.subtitle, new.description);
+            END;
+            CREATE TRIGGER events_ad AFTER DELETE ON events BEGIN
+                INSERT INTO events_fts (events_fts, rowid, title, subtitle, description)
+                VALUES ('delete', old.event_id, old.title, old.subtitle, old.description);
+            END;
+            CREATE TRIGGER events_au AFTER UPDATE OF title, subtitle, description ON events BEGIN
+                INSERT INTO events_fts (events_fts, rowid, title, subtitle, description)
+                VALUES ('delete', old.event_id, old.title, old.subtitle, old.description);
+                INSERT INTO events_fts (rowid, title, subtitle, description)
+                VALUES (new.event_id, new.title, new.subtitle, new.description);
+            END;
+            INSERT INTO events_fts (events_fts) VALUES ('rebuild');
+        """)
+        return True
+
+    def load_meta(self):
+        meta = dict(self.reader.execute('SELECT key, value FROM meta'))
+        self.max_duration = int(meta.get('max_duration') or 0)
+        self.refreshed = int(meta.get('refreshed') or 0)
+
+    def start(self):
+        """Follow the server's EPG notifications, downloading the guide if it is stale"""
+        if self.notifier is None:
+            self.notifier = self.api.notifier()
+            self.notifier.subscribe(self.on_notification, self.on_notifications_available)
+            self.refresh_timer.start()
+        self.refresh_if_stale()
+
+    def stop(self):
+        self.refresh_timer.stop()
+        self.changes_timer.stop()
+        if self.notifier is not None:
+            self.notifier.unsubscribe(self.on_notification, self.on_notifications_available)
+            self.notifier = None
+
+    # Background updates
+
+    def refresh_if_stale(self):
+        if time.time() - self.refreshed >= self.FULL_REFRESH_INTERVAL:
+            self.refresh()
+
+    def refresh(self):
+        """Download the whole guide in the background"""
+        if self.refreshing:
+            return
+        self.refreshing = True
+        logger.debug(f"Downloading EPG from {self.api.base_url}")
+        run_in_background(
+            self.download,
+            on_progress=lambda count: self.updated.emit(),
+            on_result=self.on_downloaded,
+            on_error=lambda e: logger.error(f"Error downloading EPG: {str(e)}"),
+            on_finished=self.on_refresh_finished)
+
+    def download(self, progress_callback):
+        """Download all events page by page (runs on a worker thread).
+
+        Each page is committed as it arrives, so the guide fills up while
+        it downloads. Events not seen in this download are removed at the
+        end. Returns the number of events downloaded.
+        """
+        generation = int(time.time())
+        self.download_generation = generation
+        conn = self.connect()
+        try:
+            start = 0
+            while True:
+                params = {'start': start, 'limit': self.PAGE_SIZE, 'sort': 'start', 'dir': 'ASC'}
+                response = self.api.get('api/epg/events/grid', params=params, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+                page = data.get('entries', [])
+                with conn:
+                    self.write_events(conn, page, generation)
+                start += len(page)
+                progress_callback(start)
+                total = data.get('totalCount', data.get('total'))
+                if len(page) < self.PAGE_SIZE or (total is not None and start >= total):
+                    break
+            with conn:
+                conn.execute('DELETE FROM events WHERE generation < ? OR stop < ?',
+                             (generation, generation - self.KEEP_PAST))
+                self.write_meta(conn, refreshed=generation)
+            return start
+        finally:
+            self.download_generation = None
+            conn.close()
+
+    def write_generation(self):
+        """Return the generation to store events downloaded outside download() with"""
+        generation = self.download_generation
+        return generation if generation is not None else self.refreshed
+
+    def write_events(self, conn, entries, generation):
+        conn.executemany("""
+            INSERT INTO events (event_id, channel, start, stop, title, subtitle, description,
+                                data, generation)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (event_id) DO UPDATE SET
+                channel = excluded.channel, start = excluded.start, stop = excluded.stop,
+                title = excluded.title, subtitle = excluded.subtitle,
+                description = excluded.description, data = excluded.data,
+                generation = MAX(events.generation, excluded.generation)
+        """, [(entry['eventId'], entry.get('channelUuid', ''),
+               int(entry.get('start', 0)), int(entry.get('stop', 0)),
+               epg_text(entry.get('title')), epg_text(entry.get('subtitle')),
+               epg_text(entry.get('description')), json.dumps(entry), generation)
+              for entry in entries if 'eventId' in entry])
+
+    def write_meta(self, conn, **values):
+        values['max_duration'] = conn.execute(
+            'SELECT COALESCE(MAX(stop - start), 0) FROM events').fetchone()[0]
+        conn.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                         values.items())
+
+    def on_downloaded(self, count):
+        logger.debug(f"Downloaded {count} EPG events from {self.api.base_url}")
+        self.load_meta()
+
+    def on_refresh_finished(self):
+        self.refreshing = False
+        self.updated.emit()
+
+    def on_notifications_available(self, available):
+        if available:
+            self.refresh_if_stale()
+
+    def on_notification(self, notification_class, message):
+        """Track EPG events created, updated or deleted on the server"""
+        if notification_class != 'epg':
+            return
+        deleted = set(message.get('delete', []))
+        changed = set(message.get('create', []) + message.get('update', []))
+        if deleted or changed:
+            self.deleted_ids |= deleted
+            self.changed_ids = (self.changed_ids - deleted) | changed
+            self.changes_timer.start()
+
+    def load_changes(self):
+        if self.changes_pending or not (self.changed_ids or self.deleted_ids):
+            return
+        changed, deleted = list(self.changed_ids), list(self.deleted_ids)
+        self.changed_ids.clear()
+        self.deleted_ids.clear()
+        self.changes_pending = True
+        run_in_background(
+            self.apply_changes, changed, deleted,
+            on_result=lambda count: self.on_changes_loaded(),
+            on_error=lambda e: logger.error(f"Error loading changed EPG events: {str(e)}"),
+            on_finished=self.on_changes_finished)
+
+    def apply_changes(self, changed, deleted):
+        """Download the changed events and store them (runs on a worker thread)"""
+        entries = []
+        if changed:
+            response = self.api.get('api/epg/events/load',
+                                    params={'eventId': json.dumps(changed)})
+            response.raise_for_status()
+            entries = response.json().get('entries', [])
+        conn = self.connect()
+        try:
+            with conn:
+                conn.executemany('DELETE FROM events WHERE event_id = ?',
+                                 [(event_id,) for event_id in deleted])
+                self.write_events(conn, entries, self.write_generation())
+                self.write_meta(conn)
+        finally:
+            conn.close()
+        return len(entries)
+
+    def download_channel(self, channel_uuid, limit):
+        """Download and store the next events of one channel (runs on a worker thread)"""
+        params = {'channel': channel_uuid, 'limit': limit, 'sort': 'start', 'dir': 'ASC'}
+        response = self.api.get('api/epg/events/grid', params=params)
+        response.raise_for_status()
+        entries = response.json().get('entries', [])
+        conn = self.connect()
+        try:
+            with conn:
+                self.write_events(conn, entries, self.write_generation())
+                self.write_meta(conn)
+        finally:
+            conn.close()
+        return len(entries)
+
+    def mark_channel_loaded(self, channel_uuid):
+        self.loaded_channels.add(channel_uuid)
+        self.load_meta()
+
+    def has_channel(self, channel_uuid):
+        """Whether the next events of a channel are in the database"""
+        return bool(self.refreshed) or channel_uuid in self.loaded_channels
+
+    def on_changes_loaded(self):
+        self.load_meta()
+        self.updated.emit()
+
+    def on_changes_finished(self):
+        self.changes_pending = False
+        if self.changed_ids or self.deleted_ids:
+            # Changes announced while the previous request was running
+            self.changes_timer.start()
+
+    # Queries, answered locally
+
+    def count(self):
+        return self.reader.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+
+    def channel_events(self, channel_uuid, since=None, limit=-1, offset=0):
+        """Return the events of a channel ending after since (default now), by start time"""
+        since = int(time.time() if since is None else since)
+        rows = self.reader.execute(
+            'SELECT data FROM events WHERE channel = ? AND start >= ? AND stop > ? '
+            'ORDER BY start LIMIT ? OFFSET ?',
+            (channel_uuid, since - self.max_duration, since, limit, offset))
+        return [json.loads(data) for data, in rows]
+
+    def events_between(self, start, stop, channels=None):
+        """Return the events overlapping [start, stop), by channel and start time"""
+        sql = 'SELECT data FROM events WHERE start >= ? AND start < ? AND stop > ?'
+        params = [int(start) - self.max_duration, int(stop), int(start)]
+        if channels is not None:
+            channels = list(channels)
+            sql += f" AND channel IN ({', '.join('?' * len(channels))})"
+            params += channels
+        rows = self.reader.execute(sql + ' ORDER BY channel, start', params)
+        return [json.loads(data) for data, in rows]
+
+    def search(self, text, limit=200):
+        """Return upcoming events whose title, subtitle or description match every word of text"""
+        words = normalize_search_text(text).split()
+        if not words:
+            return []
+        now = int(time.time())
+        if self.fts:
+            # Prefix match on each word; quotes keep FTS syntax characters literal
+            query = ' '.join('"{}"*'.format(word.replace('"', '""')) for word in words)
+            rows = self.reader.execute(
+                'SELECT events.data FROM events_fts JOIN events ON events.event_id = events_fts.rowid '
+                'WHERE events_fts MATCH ? AND events.stop > ? ORDER BY events.start LIMIT ?',
+                (query, now, limit))
+        else:
+            condition = ' AND '.join(["(title || ' ' || subtitle || ' ' || description) LIKE ?"] * len(words))
+            rows = self.reader.execute(
+                f'SELECT data FROM events WHERE {condition} AND stop > ? ORDER BY start LIMIT ?',
+                [f'%{word}%' for word in words] + [now, limit])
+        return [json.loads(data) for data, in rows]
+
+class NowNextSnapshot:
+    """Compact snapshot of the EPG answering what is on every channel at a time.
+
+    The events of the next HORIZON seconds are held in flat arrays, those
+    of channel c at [offsets[c], offsets[c + 1]) sorted by start, with
+    titles interned in a string table. lookup() finds the current and next
+    event of each channel by binary search within its slice, and the next
+    time any of them changes, so callers only need to look again then.
+    """
+
+    HORIZON = 12 * 3600
+
+    def __init__(self, start_time=0):
+        self.start_time = start_time
+        self.end_time = start_time + self.HORIZON
+        self.channels = {}  # channel uuid -> slice number
+        self.offsets = array('l', [0])
+        self.starts = array('q')
+        self.stops = array('q')
+        self.titles = array('l')  # index into strings
+        self.strings = []
+
+    @classmethod
+    def build(cls, store, now):
+        """Read the events around now from an EPGStore (runs on a worker thread)"""
+        snapshot = cls(int(now))
+        strings = {}
+        conn = store.connect()
+        try:
+            rows = conn.execute(
+                'SELECT channel, start, stop, title FROM events '
+                'WHERE start >= ? AND start < ? AND stop > ? ORDER BY channel, start',
+                (snapshot.start_time - store.max_duration, snapshot.end_time, snapshot.start_time))
+            channel = None
+            for uuid, start, stop, title in rows:
+                if uuid != channel:
+                    if channel is not None:
+                        snapshot.offsets.append(len(snapshot.starts))
+                    channel = uuid
+                    snapshot.channels[uuid] = len(snapshot.channels)
+                snapshot.starts.append(start)
+                snapshot.stops.append(stop)
+                index = strings.get(title)
+                if index is None:
+                    index = strings[title] = len(snapshot.strings)
+                    snapshot.strings.append(title)
+                snapshot.titles.append(index)
+            if channel is not None:
+                snapshot.offsets.append(len(snapshot.starts))
+        finally:
+            conn.close()
+        return snapshot
+
+    def covers(self, t):
+        """Whether the snapshot still reaches far enough past t"""
+        return self.start_time <= t < self.end_time - self.HORIZON // 2
+
+    def lookup(self, uuids, t):
+        """Return the (current, next) events of the channels at time t, and the
+        next time either changes for any of them. Events are indexes into the
+        arrays, or -1.
+        """
+        starts, stops, offsets = self.starts, self.stops, self.offsets
+        boundary = self.end_time - self.HORIZON // 2
+        result = []
+        for uuid in uuids:
+            c = self.channels.get(uuid)
+            if c is None:
+                result.append((-1, -1))
+                continue
+            lo, hi = offsets[c], offsets[c + 1]
+            i = bisect.bisect_right(starts, t, lo, hi) - 1
+            current = i if i >= lo and stops[i] > t else -1
+            upcoming = i + 1 if i + 1 < hi else -1
+            if current >= 0 and stops[current] < boundary:
+                boundary = stops[current]
+            if upcoming >= 0 and starts[upcoming] < boundary:
+                boundary = starts[upcoming]
+            result.append((current, upcoming))
+        return result, boundary
+
+    def title(self, event):
+        return self.strings[self.titles[event]]
+
+class ChannelPrefetcher(QObject):
+    """Prefetches the EPG and logos of the channels in view.
+
+    Whenever the channel list scrolls or its rows change, the visible
+    channels and LOOKAHEAD rows either side are queued, visible rows first,
+    then those below and then those above. Up to MAX_TASKS worker tasks
+    each take the next BATCH_SIZE queued channels and download their next
+    events one after another on the pooled keep-alive session, skipping
+    channels that have left the window by then. Nothing is fetched for
+    channels once the whole guide has been downloaded.
+
+    logo_loader, if set, is given the logo URLs of the same rows in the
+    same order through its prefetch() method.
+    """
+
+    LOOKAHEAD = 20
+    BATCH_SIZE = 8
+    MAX_TASKS = 2
+    EVENTS_PER_CHANNEL = 50
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.store = None
+        self.logo_loader = None
+        self.wanted = {}  # channel uuid -> priority, 0 first
+        self.queue = []  # channel uuids waiting for a task, by priority
+        self.in_flight = set()
+        self.tasks = 0
+        
+        # Coalesce scrolling and row changes into one update
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(100)
+        self.update_timer.timeout.connect(self.update_window)
+        
+        view.verticalScrollBar().valueChanged.connect(self.schedule_update)
+        model = view.model()
+        for signal in (model.rowsInserted, model.rowsRemoved, model.modelReset,
+                       model.layoutChanged):
+            signal.connect(self.schedule_update)
+
+    def set_store(self, store):
+        """Prefetch into the EPG database of the server now shown"""
+        if store is self.store:
+            return
+        self.store = store
+        self.wanted = {}
+        self.queue = []
+        self.schedule_update()
+
+    def schedule_update(self, *args):
+        self.update_timer.start()
+
+    def window_rows(self):
+        """Return the model rows to prefetch, visible rows first"""
+        count = self.view.model().rowCount()
+        if not count:
+            return []
+        first = self.view.rowAt(0)
+        last = self.view.rowAt(self.view.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = count - 1 if last < 0 else last
+        below = range(last + 1, min(count, last + 1 + self.LOOKAHEAD))
+        above = range(first - 1, max(-1, first - 1 - self.LOOKAHEAD), -1)
+        return list(range(first, last + 1)) + list(below) + list(above)
+
+    def update_window(self):
+        model = self.view.model()
+        rows = [model.store_row(row) for row in self.window_rows()]
+        store = model.store
+        
+        if self.logo_loader is not None:
+            self.logo_loader.prefetch([store.icons[row] for row in rows if store.icons[row]])
+        
+        if self.store is None or self.store.refreshed:
+            self.wanted = {}
+            self.queue = []
+            return
+        # Channels no longer in the window are dropped from the queue and
+        # skipped by the tasks that already took them
+        wanted = {}
+        for row in rows:
+            uuid = store.uuids[row]
+            if not self.store.has_channel(uuid):
+                wanted.setdefault(uuid, len(wanted))
+        self.wanted = wanted
+        self.queue = [uuid for uuid in self.wanted if uuid not in self.in_flight]
+        self.start_tasks()
+
+    def start_tasks(self):
+        while self.tasks < self.MAX_TASKS and self.queue:
+            batch = self.queue[:self.BATCH_SIZE]
+            del self.queue[:self.BATCH_SIZE]
+            self.in_flight.update(batch)
+            self.tasks += 1
+            store = self.store
+            run_in_background(
+                self.fetch_batch, store, batch,
+                on_progress=lambda uuid, store=store: store.mark_channel_loaded(uuid),
+                on_result=lambda loaded, store=store: self.on_batch_done(store, loaded),
+                on_error=lambda e: logger.error(f"Error prefetching EPG: {str(e)}"),
+                on_finished=lambda batch=batch: self.on_batch_finished(batch))
+
+    def fetch_batch(self, store, batch, progress_callback):
+        """Download the events of a batch of channels (runs on a worker thread).
+
+        Returns how many channels were downloaded.
+        """
+        loaded = 0
+        for uuid in batch:
+            # Reading the dict from the worker is safe; it is replaced, not mutated
+            if store is not self.store or uuid not in self.wanted:
+                continue
+            store.download_channel(uuid, self.EVENTS_PER_CHANNEL)
+            progress_callback(uuid)
+            loaded += 1
+        return loaded
+
+    def on_batch_done(self, store, loaded):
+        if loaded:
+            logger.debug(f"Prefetched EPG of {loaded} channels")
+            store.updated.emit()
+
+    def on_batch_finished(self, batch):
+        self.tasks -= 1
+        self.in_flight.difference_update(batch)
+        self.start_tasks()
+
+class LogoLoader(QObject):
+    """Loads channel logos for the channel list.
+
+    Logos are looked up in an LRU of QPixmaps holding at most MEMORY_LIMIT
+    bytes, then in a disk cache, and only then downloaded, with at most
+    MAX_TASKS disk reads or downloads running at once. Decoding and
+    scaling happen on the worker threads with QImage; only the conversion
+    to QPixmap is left to the GUI thread. Cached logos are used without a
+    request for REVALIDATE_AFTER, then revalidated with their ETag or
+    Last-Modified date, so an unchanged logo is never downloaded twice.
+    """
+    logo_loaded = pyqtSignal(str)  # absolute logo URL
+
+    MAX_TASKS = 4
+    MEMORY_LIMIT = 16 * 1024 * 1024
+    REVALIDATE_AFTER = 7 * 86400
+    RETRY_AFTER = 600
+    LOGO_SIZE = QSize(40, 24)
+
+    def __init__(self, cache_dir, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.api = None  # server the relative logo URLs belong to
+        self.pixmaps = OrderedDict()  # absolute URL -> QPixmap, least recently used first
+        self.memory = 0
+        self.queue = []  # absolute URLs waiting for a task, first is next
+        self.loading = set()
+        self.failed = {}  # absolute URL -> time of the failure
+        self.tasks = 0
+
+    def set_api(self, api):
+        self.api = api
+
+    def absolute_url(self, url):
+        if url.startswith(('http://', 'https://')):
+            return url
+        if self.api is None or not url or url.startswith('file://'):
+            return None
+        return self.api.url(url)
+
+    def pixmap(self, url):
+        """Return the logo at a URL if it is in memory, otherwise queue it and return None"""
+        url = self.absolute_url(url)
+        if url is None:
+            return None
+        pixmap = self.pixmaps.get(url)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(url)
+            return pixmap
+        self.request(url)
+        return None
+
+    def prefetch(self, urls):
+        """Replace the queue with the logos at URLs, loaded in order"""
+        self.queue = [url for url in map(self.absolute_url, urls) if url and self.wanted(url)]
+        self.start_tasks()
+
+    def wanted(self, url):
+        if url in self.pixmaps or url in self.loading:
+            return False
+        failed = self.failed.get(url)
+        return failed is None or time.time() - failed >= self.RETRY_AFTER
+
+    def request(self, url):
+        if not self.wanted(url):
+            return
+        if url in self.queue:
+            self.queue.remove(url)
+        self.queue.insert(0, url)
+        self.start_tasks()
+
+    def start_tasks(self):
+        ratio = QApplication.instance().devicePixelRatio()
+        size = self.LOGO_SIZE * ratio
+        while self.tasks < self.MAX_TASKS and self.queue:
+            url = self.queue.pop(0)
+            self.loading.add(url)
+            self.tasks += 1
+            run_in_background(
+                self.load, url, size,
+                on_result=lambda image, url=url: self.on_loaded(url, image, ratio),
+                on_error=lambda e, url=url: self.on_load_error(url, e),
+                on_finished=lambda url=url: self.on_load_finished(url))
+
+    def cache_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def get(self, url, headers):
+        # Only send a server's credentials to the server itself
+        api = TVHeadendAPI.for_url(url)
+        if api is not None:
+            return api.session.get(url, headers=headers, timeout=api.timeout)
+        return requests.get(url, headers=headers, timeout=10)
+
+    def load(self, url, size):
+        """Read or download a logo and scale it to size (runs on a worker thread)"""
+        path = self.cache_path(url)
+        meta = None
+        try:
+            with open(f'{path}.json', 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            pass
+        
+        data = None
+        if meta is not None and time.time() - meta.get('checked', 0) < self.REVALIDATE_AFTER:
+            data = self.read_cached(path)
+        if data is None:
+            headers = {}
+            if meta is not None and os.path.exists(path):
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            response = self.get(url, headers)
+            if response.status_code == 304:
+                data = self.read_cached(path)
+            if data is None:
+                if response.status_code == 304:
+                    response = self.get(url, {})
+                response.raise_for_status()
+                data = response.content
+                self.write_cached(path, data)
+            # A 304 may leave out the validators it confirmed
+            validated = meta if response.status_code == 304 else {}
+            self.write_meta(path, {
+                'url': url,
+                'checked': int(time.time()),
+                'etag': response.headers.get('ETag', validated.get('etag', '')),
+                'last_modified': response.headers.get('Last-Modified', validated.get('last_modified', '')),
+            })
+        
+        image = QImage.fromData(data)
+        if image.isNull():
+            raise ValueError(f"Unsupported logo image: {url}")
+        return image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    @staticmethod
+    def read_cached(path):
         try:
-            import requests
-            self.logger.info(f"requests version: {requests.__version__}")
-        except ImportError:
-            self.logger.error("requests not found")
-    
-    def debug(self, msg):
-        self.logger.debug(msg)
-    
-    def info(self, msg):
-        self.logger.info(msg)
-    
-    def warning(self, msg):
-        self.logger.warning(msg)
-    
-    def error(self, msg):
-        self.logger.error(msg)
-    
-    def critical(self, msg):
-        self.logger.critical(msg)
-    
-    def exception(self, msg):
-        self.logger.exception(msg)
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def write_cached(path, data):
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def write_meta(path, meta):
+        tmp_path = f'{path}.json.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, f'{path}.json')
+
+    def on_loaded(self, url, image, ratio):
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        self.pixmaps[url] = pixmap
+        self.memory += self.pixmap_bytes(pixmap)
+        while self.memory > self.MEMORY_LIMIT and len(self.pixmaps) > 1:
+            _, evicted = self.pixmaps.popitem(last=False)
+            self.memory -= self.pixmap_bytes(evicted)
+        self.logo_loaded.emit(url)
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def on_load_error(self, url, error):
+        logger.debug(f"Error loading logo {url}: {str(error)}")
+        self.failed[url] = time.time()
+
+    def on_load_finished(self, url):
+        self.loading.discard(url)
+        self.tasks -= 1
+        self.start_tasks()
+
+class DVRTableModel(QAbstractTableModel):
+    """Rows of one of the server's DVR grids loaded so far.
+
+    TVHeadend sorts and pages the upcoming, finished and failed grids
+    itself, so only the rows being shown are downloaded. Reloaded rows are
+    diffed against the current ones by uuid, and only the rows that were
+    inserted, removed or changed are signalled to the view.
+    """
+
+    PAGE_SIZE = 200
+
+    more_requested = pyqtSignal()
+
+    def __init__(self, kind, path, columns, sort, direction, parent=None):
+        super().__init__(parent)
+        self.kind = kind
+        self.path = path
+        self.columns = columns  # (header, sort field) pairs
+        self.sort_field = sort
+        self.direction = direction
+        self.uuids = []  # loaded rows, in server order
+        self.entries = {}  # loaded entries by uuid
+        self.rows = {}  # uuid -> row
+        self.total = 0
+        self.pending = False  # a page request is running
+        self.stale = False  # reload the loaded rows once it finishes
+        self.generation = 0  # bumped when the sort order changes
+
+    def params(self, start, limit):
+        return {'start': start, 'limit': limit, 'sort': self.sort_field, 'dir': self.direction}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.uuids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[self.uuids[index.row()]]
+        if role == Qt.DisplayRole:
+            return self.display_text(entry, index.column())
+        if role == Qt.BackgroundRole:
+            # Highlight currently recording and failed entries
+            if self.kind == 'failed':
+                return QColor(Qt.red)
+            if self.kind == 'upcoming' and self.is_recording(entry):
+                return QColor(Qt.green)
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+    @staticmethod
+    def is_recording(entry):
+        return entry.get('status') == "Running" or entry.get('sched_status', '').lower() == 'recording'
+
+    @staticmethod
+    def failure_message(entry):
+        errors = entry.get('errors', 0)
+        error_code = entry.get('errorcode', 0)
+        error_msg = entry.get('error', '') or entry.get('status', '')
+        if not error_msg and errors > 0:
+            error_msg = f"Recording failed with {errors} errors"
+        if not error_msg and error_code != 0:
+            error_msg = f"Error code: {error_code}"
+        return error_msg or "Unknown error"
+
+    def display_text(self, entry, column):
+        if column == 0:
+            return entry.get('channelname', 'Unknown')
+        if column == 1:
+            return entry.get('disp_title', 'Unknown')
+        if column == 2:
+            return datetime.fromtimestamp(entry.get('start', 0)).strftime('%Y-%m-%d %H:%M')
+        if self.kind == 'failed':
+            return self.failure_message(entry)
+        if column == 3:
+            return str(timedelta(seconds=entry.get('duration', 0)))
+        # Status column
+        if self.is_recording(entry):
+            return "Recording"
+        return (entry.get('sched_status', '').lower() or 'scheduled').capitalize()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.pending and len(self.uuids) < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        self.more_requested.emit()
+
+    def entry(self, uuid):
+        return self.entries.get(uuid)
+
+    def update_rows(self):
+        self.rows = {uuid: row for row, uuid in enumerate(self.uuids)}
+
+    def emit_changed(self, rows):
+        last_column = len(self.columns) - 1
+        for first, last in ChannelTableModel.runs(sorted(rows)):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+    def remove_uuids(self, uuids):
+        """Remove rows by uuid; returns how many were removed"""
+        rows = sorted(self.rows[uuid] for uuid in uuids if uuid in self.rows)
+        for first, last in reversed(ChannelTableModel.runs(rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for uuid in self.uuids[first:last + 1]:
+                del self.entries[uuid]
+            del self.uuids[first:last + 1]
+            self.endRemoveRows()
+        if rows:
+            self.total = max(0, self.total - len(rows))
+            self.update_rows()
+        return len(rows)
+
+    def set_entries(self, entries, total):
+        """Replace the loaded rows with a reloaded first window of the grid"""
+        new_entries = {entry['uuid']: entry for entry in entries if 'uuid' in entry}
+        new_uuids = list(new_entries)
+        self.total = total
+        
+        # Rows no longer in the window
+        self.remove_uuids([uuid for uuid in self.uuids if uuid not in new_entries])
+        self.total = total
+        
+        # Rows kept but moved relative to each other
+        kept = [uuid for uuid in new_uuids if uuid in self.rows]
+        if kept != self.uuids:
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            persistent_uuids = [self.uuids[index.row()] for index in persistent]
+            self.uuids = kept
+            self.update_rows()
+            self.changePersistentIndexList(
+                persistent,
+                [self.index(self.rows[uuid], index.column())
+                 for index, uuid in zip(persistent, persistent_uuids)])
+            self.layoutChanged.emit()
+        
+        # Changed rows
+        changed = [self.rows[uuid] for uuid in kept if self.entries[uuid] != new_entries[uuid]]
+        for uuid in kept:
+            self.entries[uuid] = new_entries[uuid]
+        self.emit_changed(changed)
+        
+        # New rows, at their final positions
+        added = [row for row, uuid in enumerate(new_uuids) if uuid not in self.rows]
+        for first, last in ChannelTableModel.runs(added):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self.uuids[first:first] = new_uuids[first:last + 1]
+            for uuid in new_uuids[first:last + 1]:
+                self.entries[uuid] = new_entries[uuid]
+            self.endInsertRows()
+        if added:
+            self.update_rows()
+
+    def append_entries(self, entries, total):
+        """Append the next page of the grid"""
+        new = [entry for entry in entries if 'uuid' in entry and entry['uuid'] not in self.rows]
+        self.total = total
+        if not new:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.uuids), len(self.uuids) + len(new) - 1)
+        for entry in new:
+            self.rows[entry['uuid']] = len(self.uuids)
+            self.uuids.append(entry['uuid'])
+            self.entries[entry['uuid']] = entry
+        self.endInsertRows()
+
+    def update_entries(self, entries):
+        """Update loaded rows in place"""
+        changed = []
+        for entry in entries:
+            row = self.rows.get(entry.get('uuid'))
+            if row is not None and self.entries[entry['uuid']] != entry:
+                self.entries[entry['uuid']] = entry
+                changed.append(row)
+        self.emit_changed(changed)
 
 class DVRStatusDialog(QDialog):
     def __init__(self, server, parent=None):
         super().__init__(parent)
         self.server = server
+        self.api = TVHeadendAPI.for_server(server)
         self.setWindowTitle("DVR Status")
         self.resize(800, 600)
+        self.models = {
+            'upcoming': DVRTableModel('upcoming', 'api/dvr/entry/grid_upcoming', [
+                ('Channel', 'channelname'), ('Title', 'disp_title'), ('Start Time', 'start'),
+                ('Duration', 'duration'), ('Status', 'sched_status')], 'start', 'ASC', self),
+            'finished': DVRTableModel('finished', 'api/dvr/entry/grid_finished', [
+                ('Channel', 'channelname'), ('Title', 'disp_title'), ('Start Time', 'start'),
+                ('Duration', 'duration')], 'start', 'DESC', self),
+            'failed': DVRTableModel('failed', 'api/dvr/entry/grid_failed', [
+                ('Channel', 'channelname'), ('Title', 'disp_title'), ('Start Time', 'start'),
+                ('Error', 'status')], 'start', 'DESC', self),
+        }
         self.setup_ui()
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(5000)  # Update every 5 seconds
-        
-        # Initial update
-        self.update_status()
+        # Reloads the loaded rows of every grid and follows the server's changes
+        self.feed = DVRServerFeed(
+            server, [(name, model.path) for name, model in self.models.items()],
+            grid_request=self.grid_request, parent=self)
+        self.feed.loaded.connect(self.on_feed_loaded)
+        self.feed.changed.connect(self.on_feed_changed)
+        self.feed.status_changed.connect(self.on_feed_status)
+        self.finished.connect(self.feed.stop)
+        self.feed.start()
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -159,140 +2716,699 @@ class DVRStatusDialog(QDialog):
         layout.addWidget(self.tabs)
         
         # Upcoming/Current recordings tab
-        self.upcoming_table = QTableWidget()
-        self.upcoming_table.setColumnCount(5)  # Added one more column for status
-        self.upcoming_table.setHorizontalHeaderLabels(['Channel', 'Title', 'Start Time', 'Duration', 'Status'])
-        self.upcoming_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.upcoming_table = self.create_table('upcoming')
         self.tabs.addTab(self.upcoming_table, "Upcoming/Current")  # Changed tab title
         
         # Finished recordings tab
-        self.finished_table = QTableWidget()
-        self.finished_table.setColumnCount(4)
-        self.finished_table.setHorizontalHeaderLabels(['Channel', 'Title', 'Start Time', 'Duration'])
-        self.finished_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.finished_table = self.create_table('finished')
         self.tabs.addTab(self.finished_table, "Finished")
         
         # Failed recordings tab
-        self.failed_table = QTableWidget()
-        self.failed_table.setColumnCount(4)
-        self.failed_table.setHorizontalHeaderLabels(['Channel', 'Title', 'Start Time', 'Error'])
-        self.failed_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.failed_table = self.create_table('failed')
         self.tabs.addTab(self.failed_table, "Failed")
         
+        self.tables = {
+            'upcoming': self.upcoming_table,
+            'finished': self.finished_table,
+            'failed': self.failed_table,
+        }
+        self.tab_titles = {
+            'upcoming': "Upcoming/Current",
+            'finished': "Finished",
+            'failed': "Failed",
+        }
+        
+        # Loading and error messages
+        self.status_label = QLabel("Loading...")
+        layout.addWidget(self.status_label)
+        
         # Close button
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
+
+    def create_table(self, name):
+        """Create the table of a grid, sorted by the server when a header is clicked"""
+        model = self.models[name]
+        table = QTableView()
+        table.setModel(model)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setContextMenuPolicy(Qt.CustomContextMenu)
+        table.customContextMenuRequested.connect(
+            lambda position: self.show_context_menu(name, position))
+        if name != 'upcoming':
+            delete_shortcut = QShortcut(QKeySequence(QKeySequence.Delete), table)
+            delete_shortcut.activated.connect(lambda: self.remove_selected(name))
+        
+        header = table.horizontalHeader()
+        header.setSortIndicatorShown(True)
+        header.setSectionsClickable(True)
+        sort_column = [field for _, field in model.columns].index(model.sort_field)
+        header.setSortIndicator(sort_column, Qt.AscendingOrder if model.direction == 'ASC'
+                                else Qt.DescendingOrder)
+        header.sortIndicatorChanged.connect(
+            lambda column, order: self.sort_grid(name, column, order))
+        
+        # The view asks for the next page when scrolled to the end
+        model.more_requested.connect(lambda: self.load_more(name))
+        return table
+
+    def selected_entries(self, name):
+        """Return the selected entries of a grid, in row order"""
+        table = self.tables[name]
+        rows = sorted(index.row() for index in table.selectionModel().selectedRows())
+        return [table.model().index(row, 0).data(Qt.UserRole) for row in rows]
+
+    def show_context_menu(self, name, position):
+        """Show the actions for the selected entries of a grid"""
+        entries = self.selected_entries(name)
+        if not entries:
+            return
+        menu = QMenu()
+        if name == 'upcoming':
+            recording = [e['uuid'] for e in entries if DVRTableModel.is_recording(e)]
+            scheduled = [e['uuid'] for e in entries if not DVRTableModel.is_recording(e)]
+            if recording:
+                stop_action = menu.addAction(f"Stop ({len(recording)})")
+                stop_action.triggered.connect(lambda: self.run_action('stop', recording))
+            if scheduled:
+                cancel_action = menu.addAction(f"Cancel ({len(scheduled)})")
+                cancel_action.triggered.connect(lambda: self.run_action('cancel', scheduled))
+        else:
+            uuids = [e['uuid'] for e in entries]
+            if name == 'failed':
+                rerecord_action = menu.addAction(f"Re-record ({len(uuids)})")
+                rerecord_action.triggered.connect(lambda: self.run_action('rerecord', uuids))
+            remove_action = menu.addAction(f"Delete ({len(uuids)})")
+            remove_action.triggered.connect(lambda: self.remove_selected(name))
+        menu.exec_(self.tables[name].viewport().mapToGlobal(position))
+
+    def remove_selected(self, name):
+        """Delete the selected finished or failed recordings, after confirmation"""
+        if name == 'upcoming':
+            return
+        uuids = [entry['uuid'] for entry in self.selected_entries(name)]
+        if not uuids:
+            return
+        answer = QMessageBox.question(
+            self, "Delete Recordings",
+            f"Delete {len(uuids)} recording(s) and their files from the server?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if answer == QMessageBox.Yes:
+            self.run_action('remove', uuids)
+
+    def run_action(self, action, uuids):
+        """Apply a DVR action to entries in the background"""
+        self.status_label.setText(f"Applying {action} to {len(uuids)} entries...")
+        run_in_background(
+            self.api.dvr_action, action, uuids,
+            on_result=lambda failed: self.on_action_done(action, uuids, failed),
+            on_error=lambda e: self.on_action_error(action, e))
+
+    def on_action_done(self, action, uuids, failed):
+        if failed:
+            self.status_label.setText(f"{action.capitalize()} failed for {len(failed)} "
+                                      f"of {len(uuids)} entries")
+        else:
+            self.status_label.setText("")
+        if self.feed.notifier is None or not self.feed.notifier.is_available:
+            # No dvrentry notifications will follow
+            self.feed.reload()
+
+    def on_action_error(self, action, error):
+        logger.error(f"Error applying DVR {action}: {str(error)}")
+        self.status_label.setText(f"Failed to {action} entries: {str(error)}")
+
+    def update_tab_title(self, name):
+        table = self.tables[name]
+        self.tabs.setTabText(self.tabs.indexOf(table),
+                             f"{self.tab_titles[name]} ({self.models[name].total})")
+
+    def grid_request(self, name):
+        """Return the parameters and row count of a grid reloaded by the feed"""
+        model = self.models[name]
+        return ({'sort': model.sort_field, 'dir': model.direction},
+                max(len(model.uuids), DVRTableModel.PAGE_SIZE))
+
+    def on_feed_loaded(self, grids):
+        for name, params, entries, total in grids:
+            model = self.models[name]
+            if model.pending:
+                model.stale = True  # Reload once the page being loaded arrives
+                continue
+            if params != {'sort': model.sort_field, 'dir': model.direction}:
+                continue  # Re-sorted meanwhile; sort_grid() loads the new order
+            model.set_entries(entries, total)
+            self.update_tab_title(name)
+        self.status_label.setText("")
+
+    def on_feed_changed(self, entries, deleted):
+        if deleted:
+            self.remove_entries(deleted)
+        if entries:
+            for model in self.models.values():
+                model.update_entries([entry for _, entry in entries])
+
+    def on_feed_status(self):
+        feed = self.feed
+        if feed.failures:
+            retry = (f", retrying at {datetime.fromtimestamp(feed.retry_at).strftime('%H:%M:%S')}"
+                     if feed.retry_at else "")
+            self.status_label.setText(f"Failed to get DVR data: {feed.error}{retry}")
+
+    def load_grid(self, name):
+        """Reload the rows of a grid loaded so far, at least one page"""
+        model = self.models[name]
+        if model.pending:
+            model.stale = True  # Previous request still running
+            return
+        self.request_page(name, 0, max(len(model.uuids), DVRTableModel.PAGE_SIZE))
+
+    def load_more(self, name):
+        """Load the next page of a grid"""
+        model = self.models[name]
+        if model.pending or len(model.uuids) >= model.total:
+            return
+        self.request_page(name, len(model.uuids), DVRTableModel.PAGE_SIZE)
+
+    def request_page(self, name, start, limit):
+        model = self.models[name]
+        model.pending = True
+        model.stale = False
+        generation = model.generation
+        run_in_background(
+            self.fetch_page, model.path, model.params(start, limit),
+            on_result=lambda result: self.add_page(name, generation, start, result),
+            on_error=lambda e: self.on_fetch_error(name, e),
+            on_finished=lambda: self.on_page_finished(name))
+
+    def on_page_finished(self, name):
+        model = self.models[name]
+        model.pending = False
+        if model.stale:
+            self.load_grid(name)
+
+    def on_fetch_error(self, name, error):
+        logger.error(f"Error updating DVR status: {str(error)}")
+        self.status_label.setText(f"Failed to get DVR data: {str(error)}")
+
+    def sort_grid(self, name, column, order):
+        """Have the server sort a grid by the clicked column"""
+        model = self.models[name]
+        model.sort_field = model.columns[column][1]
+        model.direction = 'ASC' if order == Qt.AscendingOrder else 'DESC'
+        model.generation += 1  # Pages in the old order are discarded
+        self.load_grid(name)
+
+    def fetch_page(self, path, params):
+        """Download a page of a DVR grid (runs on a worker thread)"""
+        response = self.api.get(path, params=params)
+        response.raise_for_status()
+        data = response.json()
+        return data.get('entries', []), data.get('total', 0)
+
+    def add_page(self, name, generation, start, result):
+        """Apply a downloaded page, replacing the loaded rows when it starts at 0"""
+        model = self.models[name]
+        if generation != model.generation:
+            return
+        entries, total = result
+        if start == 0:
+            model.set_entries(entries, total)
+        else:
+            model.append_entries(entries, total)
+        self.feed.add_entries(name, entries)
+        self.status_label.setText("")
+        self.update_tab_title(name)
+
+    def remove_entries(self, uuids):
+        for name, model in self.models.items():
+            if model.remove_uuids(uuids):
+                self.update_tab_title(name)
+
+class DVRServerFeed(QObject):
+    """Keeps DVR entries of one server up to date.
+
+    reload() downloads each of grids, a list of (kind, path): by default
+    the whole upcoming and failed grids, or the rows grid_request(kind)
+    asks for, which returns extra request parameters and the most rows
+    to load (None for all). After that, entries announced by comet
+    notifications are reloaded on their own, with a full reload every
+    RESYNC_INTERVAL, or every POLL_INTERVAL while notifications are
+    unavailable. A server that fails to answer is retried after a delay
+    doubling from RETRY_MIN up to RETRY_MAX.
+    """
+    loaded = pyqtSignal(object)  # [(kind, params, entries, total)] per grid
+    changed = pyqtSignal(object, object)  # [(kind, entry)] changed in place, deleted uuids
+    status_changed = pyqtSignal()
+
+    GRIDS = (('upcoming', 'api/dvr/entry/grid_upcoming'), ('failed', 'api/dvr/entry/grid_failed'))
+    PAGE_SIZE = 500
+    POLL_INTERVAL = 5000
+    RESYNC_INTERVAL = 60000
+    RETRY_MIN = 5000
+    RETRY_MAX = 300000
+
+    def __init__(self, server, grids=GRIDS, grid_request=None, parent=None):
+        super().__init__(parent)
+        self.server = server
+        self.grids = grids
+        self.grid_request = grid_request
+        self.key = TVHeadendAPI.server_key(server)
+        self.name = server.get('name', '')
+        self.api = TVHeadendAPI.for_server(server)
+        self.notifier = None
+        self.entries = {}  # uuid -> (kind, sched_status) of the entries loaded
+        self.is_loaded = False
+        self.failures = 0  # reloads failed in a row
+        self.error = ''
+        self.retry_at = None  # when a failed server is tried again
+        self.pending = False  # a reload is running
+        self.stale = False  # reload again once it finishes
+        self.changed_uuids = set()  # entries announced as changed, not loaded yet
+        self.changes_pending = False
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.reload)
+        
+        # Batch notifications arriving together into one request
+        self.changes_timer = QTimer(self)
+        self.changes_timer.setSingleShot(True)
+        self.changes_timer.setInterval(200)
+        self.changes_timer.timeout.connect(self.load_changed_entries)
+
+    def start(self):
+        self.notifier = self.api.notifier()
+        self.notifier.subscribe(self.on_notification, self.on_notifications_available)
+        self.reload()
+
+    def stop(self):
+        self.timer.stop()
+        self.changes_timer.stop()
+        if self.notifier is not None:
+            self.notifier.unsubscribe(self.on_notification, self.on_notifications_available)
+            self.notifier = None
+
+    def reload(self):
+        """Download both grids again"""
+        if self.pending:
+            self.stale = True
+            return
+        self.pending = True
+        self.stale = False
+        self.timer.stop()
+        grid_requests = []
+        for kind, path in self.grids:
+            params, limit = self.grid_request(kind) if self.grid_request is not None else ({}, None)
+            grid_requests.append((kind, path, params, limit))
+        run_in_background(
+            self.fetch_grids, grid_requests,
+            on_result=self.on_loaded,
+            on_error=self.on_error,
+            on_finished=self.on_reload_finished)
+
+    def fetch_grids(self, grid_requests):
+        """Download the requested rows of each grid (runs on a worker thread)"""
+        grids = []
+        for kind, path, params, limit in grid_requests:
+            entries = []
+            total = 0
+            while limit is None or len(entries) < limit:
+                page_size = self.PAGE_SIZE if limit is None else min(self.PAGE_SIZE, limit - len(entries))
+                response = self.api.get(path, params=dict(params, start=len(entries), limit=page_size))
+                response.raise_for_status()
+                data = response.json()
+                page = [entry for entry in data.get('entries', []) if 'uuid' in entry]
+                entries.extend(page)
+                total = data.get('total', 0)
+                if len(page) < page_size or len(entries) >= total:
+                    break
+            grids.append((kind, params, entries, total))
+        return grids
+
+    def on_loaded(self, grids):
+        self.entries = {}
+        for kind, _, entries, _ in grids:
+            self.add_entries(kind, entries)
+        self.is_loaded = True
+        self.failures = 0
+        self.error = ''
+        self.retry_at = None
+        self.loaded.emit(grids)
+        self.status_changed.emit()
+
+    def add_entries(self, kind, entries):
+        """Track entries of a grid loaded outside reload(), e.g. further pages"""
+        for entry in entries:
+            if 'uuid' in entry:
+                self.entries[entry['uuid']] = (kind, entry.get('sched_status'))
+
+    def on_error(self, error):
+        self.failures += 1
+        self.error = HealthProber.describe_error(error)
+        logger.error(f"Error loading DVR entries of {self.name}: {str(error)}")
+
+    def on_reload_finished(self):
+        self.pending = False
+        if self.stale and not self.failures:
+            self.reload()
+            return
+        if self.failures:
+            interval = min(self.RETRY_MAX, self.RETRY_MIN * 2 ** (self.failures - 1))
+            self.retry_at = time.time() + interval / 1000
+            self.status_changed.emit()
+        elif self.notifier is not None and self.notifier.is_available:
+            interval = self.RESYNC_INTERVAL
+        else:
+            interval = self.POLL_INTERVAL
+        self.timer.start(interval)
+
+    def on_notifications_available(self, available):
+        if available:
+            # Changes may have been missed, and a failed server is back
+            self.reload()
+
+    def on_notification(self, notification_class, message):
+        """Track DVR entries created, changed or deleted on the server"""
+        if notification_class != 'dvrentry' or not self.is_loaded:
+            return
+        if message.get('reload'):
+            self.reload()
+            return
+        deleted = {uuid for uuid in message.get('delete', []) if uuid in self.entries}
+        if deleted:
+            for uuid in deleted:
+                del self.entries[uuid]
+            self.changed.emit([], deleted)
+        changed = message.get('create', []) + message.get('change', [])
+        if changed:
+            self.changed_uuids.update(changed)
+            self.changes_timer.start()
+
+    def load_changed_entries(self):
+        if self.changes_pending or not self.changed_uuids:
+            return
+        uuids = list(self.changed_uuids)
+        self.changed_uuids.clear()
+        self.changes_pending = True
+        run_in_background(
+            self.fetch_entries, uuids,
+            on_result=lambda entries: self.update_entries(uuids, entries),
+            on_error=lambda e: logger.error(f"Error loading changed DVR entries of {self.name}: {str(e)}"),
+            on_finished=self.on_changes_finished)
+
+    def on_changes_finished(self):
+        self.changes_pending = False
+        if self.changed_uuids:
+            # Changes announced while the previous request was running
+            self.changes_timer.start()
+
+    def fetch_entries(self, uuids):
+        """Download the given DVR entries (runs on a worker thread)"""
+        response = self.api.get('api/idnode/load', params={'uuid': json.dumps(uuids), 'grid': 1})
+        response.raise_for_status()
+        return response.json().get('entries', [])
+
+    def update_entries(self, uuids, entries):
+        """Apply reloaded entries.
+
+        Entries whose state is unchanged are updated in place; new entries
+        and entries that changed state may have moved between grids, so
+        both grids are reloaded.
+        """
+        loaded = {entry['uuid']: entry for entry in entries if 'uuid' in entry}
+        for uuid, entry in loaded.items():
+            known = self.entries.get(uuid)
+            if known is None or known[1] != entry.get('sched_status'):
+                self.reload()
+                return
+        gone = {uuid for uuid in uuids if uuid not in loaded and uuid in self.entries}
+        for uuid in gone:
+            del self.entries[uuid]
+        self.changed.emit([(self.entries[uuid][0], entry) for uuid, entry in loaded.items()], gone)
+
+class DVRDashboardModel(QAbstractTableModel):
+    """Upcoming, running and failed DVR entries of several servers.
+
+    Rows are keyed by (server key, uuid) and kept sorted locally, since
+    no single server can sort the merged list. A server's entries are
+    replaced or updated without touching those of other servers; rows
+    are inserted and removed at their sorted positions found with
+    bisect, so an update costs a few row signals instead of a reset.
+    """
+
+    COLUMNS = ('Server', 'Channel', 'Title', 'Start Time', 'Duration', 'Status')
+
+    # Above this many changed rows a model reset is cheaper than row updates
+    MAX_DELTA_ROWS = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = {}  # (server key, uuid) -> (server name, kind, entry)
+        self.keys = []  # (server key, uuid) in ascending sort order
+        self.sort_keys = []  # sort key of each of keys
+        self.sort_column = 3
+        self.sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def position(self, row):
+        """Map between view rows and positions in keys, which are always ascending"""
+        return row if self.sort_order == Qt.AscendingOrder else len(self.keys) - 1 - row
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        server_name, kind, entry = self.items[self.keys[self.position(index.row())]]
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return server_name
+            if column == 1:
+                return entry.get('channelname', 'Unknown')
+            if column == 2:
+                return entry.get('disp_title', 'Unknown')
+            if column == 3:
+                return datetime.fromtimestamp(entry.get('start', 0)).strftime('%Y-%m-%d %H:%M')
+            if column == 4:
+                return str(timedelta(seconds=entry.get('duration', 0)))
+            return self.status_text(kind, entry)
+        if role == Qt.BackgroundRole:
+            # Highlight currently recording and failed entries
+            if kind == 'failed':
+                return QColor(Qt.red)
+            if DVRTableModel.is_recording(entry):
+                return QColor(Qt.green)
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+    @staticmethod
+    def status_text(kind, entry):
+        if kind == 'failed':
+            return DVRTableModel.failure_message(entry)
+        if DVRTableModel.is_recording(entry):
+            return "Recording"
+        return (entry.get('sched_status', '').lower() or 'scheduled').capitalize()
+
+    def sort_key(self, key, item):
+        server_name, kind, entry = item
+        column = self.sort_column
+        if column == 0:
+            value = server_name.casefold()
+        elif column == 1:
+            value = entry.get('channelname', '').casefold()
+        elif column == 2:
+            value = entry.get('disp_title', '').casefold()
+        elif column == 3:
+            value = entry.get('start', 0)
+        elif column == 4:
+            value = entry.get('duration', 0)
+        else:
+            value = self.status_text(kind, entry).casefold()
+        # Ties are broken by start time and then by key, so every sort key is unique
+        return (value, entry.get('start', 0), server_name, key)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_keys = [self.keys[self.position(index.row())] for index in persistent]
+        self.sort_column = column
+        self.sort_order = order
+        self.rebuild()
+        rows = {key: row for row, key in enumerate(self.keys)}
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(self.position(rows[key]), index.column())
+             for index, key in zip(persistent, persistent_keys)])
+        self.layoutChanged.emit()
+
+    def rebuild(self):
+        ordered = sorted((self.sort_key(key, item), key) for key, item in self.items.items())
+        self.sort_keys = [sort_key for sort_key, _ in ordered]
+        self.keys = [key for _, key in ordered]
+
+    def insert(self, key, item):
+        sort_key = self.sort_key(key, item)
+        pos = bisect.bisect(self.sort_keys, sort_key)
+        row = pos if self.sort_order == Qt.AscendingOrder else len(self.keys) - pos
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items[key] = item
+        self.keys.insert(pos, key)
+        self.sort_keys.insert(pos, sort_key)
+        self.endInsertRows()
+
+    def remove(self, key):
+        pos = bisect.bisect_left(self.sort_keys, self.sort_key(key, self.items[key]))
+        row = self.position(pos)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.items[key]
+        del self.keys[pos]
+        del self.sort_keys[pos]
+        self.endRemoveRows()
+
+    def apply(self, server_key, server_name, entries, removed):
+        """Add or update entries of a server and remove the given uuids"""
+        removed = [(server_key, uuid) for uuid in removed if (server_key, uuid) in self.items]
+        updates = {}
+        for kind, entry in entries:
+            key = (server_key, entry['uuid'])
+            item = (server_name, kind, entry)
+            if self.items.get(key) != item:
+                updates[key] = item
+        if not removed and not updates:
+            return
+        
+        if len(removed) + len(updates) > self.MAX_DELTA_ROWS:
+            self.beginResetModel()
+            for key in removed:
+                del self.items[key]
+            self.items.update(updates)
+            self.rebuild()
+            self.endResetModel()
+            return
+        
+        for key in removed:
+            self.remove(key)
+        for key, item in updates.items():
+            old = self.items.get(key)
+            if old is not None and self.sort_key(key, old) == self.sort_key(key, item):
+                # Same place in the sort order; just repaint the row
+                self.items[key] = item
+                pos = bisect.bisect_left(self.sort_keys, self.sort_key(key, item))
+                row = self.position(pos)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+                continue
+            if old is not None:
+                self.remove(key)
+            self.insert(key, item)
+
+    def set_server_entries(self, server_key, server_name, grids):
+        """Replace all entries of a server with the grids loaded by its DVRServerFeed"""
+        entries = [(kind, entry) for kind, _, grid_entries, _ in grids for entry in grid_entries]
+        current = {entry['uuid'] for _, entry in entries}
+        removed = [uuid for key, uuid in self.items if key == server_key and uuid not in current]
+        self.apply(server_key, server_name, entries, removed)
+
+    def count(self, kind):
+        return sum(1 for _, item_kind, _ in self.items.values() if item_kind == kind)
+
+    def recording_count(self):
+        return sum(1 for _, _, entry in self.items.values() if DVRTableModel.is_recording(entry))
+
+class DVRDashboardDialog(QDialog):
+    """Upcoming, running and failed recordings of all servers in one table"""
+
+    def __init__(self, servers, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("DVR Dashboard")
+        self.resize(900, 600)
+        self.model = DVRDashboardModel(self)
+        self.feeds = [DVRServerFeed(server, parent=self) for server in servers]
+        for feed in self.feeds:
+            feed.loaded.connect(
+                lambda grids, feed=feed: self.model.set_server_entries(feed.key, feed.name, grids))
+            feed.changed.connect(
+                lambda entries, deleted, feed=feed: self.model.apply(feed.key, feed.name, entries, deleted))
+            feed.status_changed.connect(self.schedule_status)
+        
+        # Update the counts once for a burst of row changes
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(100)
+        self.status_timer.timeout.connect(self.update_status)
+        for signal in (self.model.rowsInserted, self.model.rowsRemoved, self.model.modelReset):
+            signal.connect(self.schedule_status)
+        self.setup_ui()
+        self.finished.connect(self.stop_feeds)
+        for feed in self.feeds:
+            feed.start()
+        self.update_status()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(3, Qt.AscendingOrder)
+        layout.addWidget(self.table)
+        
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        
+        # Servers that are loading or not responding
+        self.status_label = QLabel("Loading...")
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
         
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+
+    def schedule_status(self, *args):
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+
     def update_status(self):
-        try:
-            # Create auth if needed
-            auth = None
-            if self.server.get('username') or self.server.get('password'):
-                auth = (self.server.get('username', ''), self.server.get('password', ''))
-            
-            # Get DVR entries
-            api_url = f'{self.server["url"]}/api/dvr/entry/grid'
-            response = requests.get(api_url, auth=auth)
-            
-            if response.status_code == 200:
-                data = response.json()
-                entries = data.get('entries', [])
-                print(f"Debug: Found {len(entries)} DVR entries")
-                
-                # Sort entries by status
-                upcoming = []
-                finished = []
-                failed = []
-                
-                for entry in entries:
-                    status = entry.get('status', '')  # Don't convert to lowercase yet
-                    sched_status = entry.get('sched_status', '').lower()
-                    errors = entry.get('errors', 0)
-                    error_code = entry.get('errorcode', 0)
-                    
-                    print(f"\nDebug: Processing entry: {entry.get('disp_title', 'Unknown')}")
-                    print(f"  Status: {status}")
-                    print(f"  Sched Status: {sched_status}")
-                    
-                    # Check status (case-sensitive for "Running")
-                    if status == "Running":
-                        print(f"Debug: Found active recording: {entry.get('disp_title', 'Unknown')}")
-                        upcoming.append((entry.get('channelname', 'Unknown'), entry.get('disp_title', 'Unknown'), datetime.fromtimestamp(entry.get('start', 0)), timedelta(seconds=entry.get('duration', 0)), True))
-                    elif 'scheduled' in status.lower() or sched_status == 'scheduled':
-                        upcoming.append((entry.get('channelname', 'Unknown'), entry.get('disp_title', 'Unknown'), datetime.fromtimestamp(entry.get('start', 0)), timedelta(seconds=entry.get('duration', 0)), False))
-                    elif 'completed' in status.lower() or status.lower() == 'finished':
-                        finished.append((entry.get('channelname', 'Unknown'), entry.get('disp_title', 'Unknown'), datetime.fromtimestamp(entry.get('start', 0)), timedelta(seconds=entry.get('duration', 0))))
-                    elif ('failed' in status.lower() or 'invalid' in status.lower() or 
-                          'error' in status.lower() or errors > 0 or error_code != 0):
-                        error_msg = entry.get('error', '')
-                        if not error_msg and errors > 0:
-                            error_msg = f"Recording failed with {errors} errors"
-                        if not error_msg and error_code != 0:
-                            error_msg = f"Error code: {error_code}"
-                        if not error_msg:
-                            error_msg = "Unknown error"
-                        failed.append((entry.get('channelname', 'Unknown'), entry.get('disp_title', 'Unknown'), datetime.fromtimestamp(entry.get('start', 0)), error_msg))
-                        print(f"Debug: Added to failed: {entry.get('disp_title', 'Unknown')} (Error: {error_msg})")
-                    else:
-                        print(f"Debug: Unhandled status: {status} for entry: {entry.get('disp_title', 'Unknown')}")
-                
-                print(f"\nDebug: Sorted entries - Upcoming: {len(upcoming)}, "
-                      f"Finished: {len(finished)}, Failed: {len(failed)}")
-                
-                # Sort upcoming recordings by start time
-                upcoming.sort(key=lambda x: x[2])  # Sort by start_time
-                
-                # Update tables
-                self.upcoming_table.setRowCount(len(upcoming))
-                for i, (channel, title, start, duration, is_recording) in enumerate(upcoming):
-                    self.upcoming_table.setItem(i, 0, QTableWidgetItem(channel))
-                    self.upcoming_table.setItem(i, 1, QTableWidgetItem(title))
-                    self.upcoming_table.setItem(i, 2, QTableWidgetItem(start.strftime('%Y-%m-%d %H:%M')))
-                    self.upcoming_table.setItem(i, 3, QTableWidgetItem(str(duration)))
-                    
-                    # Add status column
-                    status = "Recording" if is_recording else entry.get('sched_status', 'scheduled').capitalize()
-                    self.upcoming_table.setItem(i, 4, QTableWidgetItem(status))
-                    
-                    # Highlight currently recording entries
-                    if is_recording:
-                        for col in range(5):  # Update range to include new column
-                            self.upcoming_table.item(i, col).setBackground(Qt.green)
-                
-                # Sort finished recordings by start time (most recent first)
-                finished.sort(key=lambda x: x[2], reverse=True)
-                
-                self.finished_table.setRowCount(len(finished))
-                for i, (channel, title, start, duration) in enumerate(finished):
-                    self.finished_table.setItem(i, 0, QTableWidgetItem(channel))
-                    self.finished_table.setItem(i, 1, QTableWidgetItem(title))
-                    self.finished_table.setItem(i, 2, QTableWidgetItem(start.strftime('%Y-%m-%d %H:%M')))
-                    self.finished_table.setItem(i, 3, QTableWidgetItem(str(duration)))
-                
-                # Sort failed recordings by start time (most recent first)
-                failed.sort(key=lambda x: x[2], reverse=True)
-                
-                self.failed_table.setRowCount(len(failed))
-                for i, (channel, title, start, error) in enumerate(failed):
-                    self.failed_table.setItem(i, 0, QTableWidgetItem(channel))
-                    self.failed_table.setItem(i, 1, QTableWidgetItem(title))
-                    self.failed_table.setItem(i, 2, QTableWidgetItem(start.strftime('%Y-%m-%d %H:%M')))
-                    self.failed_table.setItem(i, 3, QTableWidgetItem(error))
-                    # Highlight failed entries in red
-                    for col in range(4):
-                        self.failed_table.item(i, col).setBackground(Qt.red)
-                
-            else:
-                print(f"Debug: Failed to fetch DVR entries. Status code: {response.status_code}")
-                
-        except Exception as e:
-            print(f"Debug: Error updating DVR status: {str(e)}")
-            print(f"Debug: Traceback: {traceback.format_exc()}")
-    
-    def closeEvent(self, event):
-        self.update_timer.stop()
-        super().closeEvent(event)
+        model = self.model
+        self.summary_label.setText(
+            f"{model.recording_count()} recording, {model.count('upcoming')} upcoming, "
+            f"{model.count('failed')} failed on {len(self.feeds)} servers")
+        lines = []
+        for feed in self.feeds:
+            if feed.failures:
+                retry = (f", retrying at {datetime.fromtimestamp(feed.retry_at).strftime('%H:%M:%S')}"
+                         if feed.retry_at else "")
+                lines.append(f"{feed.name}: not responding ({feed.error}){retry}")
+            elif not feed.is_loaded:
+                lines.append(f"{feed.name}: loading...")
+        self.status_label.setText('\n'.join(lines))
+
+    def stop_feeds(self):
+        self.status_timer.stop()
+        for feed in self.feeds:
+            feed.stop()
 
 class RecordingDurationDialog(QDialog):
     def __init__(self, parent=None):
@@ -359,11 +3475,16 @@ class RecordingDurationDialog(QDialog):
         return (hours * 3600) + (minutes * 60)
 
 class ServerDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, prober=None):
         super().__init__(parent)
         self.setWindowTitle("Server Management")
         self.setModal(True)
+        self.prober = prober
+        self.servers = []
         self.setup_ui()
+        if prober is not None:
+            prober.updated.connect(self.update_health)
+            self.finished.connect(lambda result: prober.updated.disconnect(self.update_health))
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -400,37 +3521,47 @@ class ServerDialog(QDialog):
         self.servers = servers
         self.server_list.clear()
         for server in self.servers:
-            self.server_list.addItem(server['name'])
+            self.server_list.addItem(self.item_text(server))
+
+    def item_text(self, server):
+        if self.prober is None:
+            return server['name']
+        return f"{server['name']} - {self.prober.summary(server)}"
+
+    def update_health(self):
+        """Show the latest probe results next to the server names"""
+        for row, server in enumerate(self.servers):
+            self.server_list.item(row).setText(self.item_text(server))
             
     def add_server(self):
-        print("Debug: Opening add server dialog")
+        logger.debug("Opening add server dialog")
         dialog = ServerConfigDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             server = dialog.get_server_config()
-            print(f"Debug: Adding new server: {server['name']}")
+            logger.debug(f"Adding new server: {server['name']}")
             self.servers.append(server)
-            self.server_list.addItem(server['name'])
+            self.server_list.addItem(self.item_text(server))
             
     def edit_server(self):
         current_row = self.server_list.currentRow()
         if current_row >= 0:
-            print(f"Debug: Editing server at index {current_row}")
+            logger.debug(f"Editing server at index {current_row}")
             dialog = ServerConfigDialog(self)
             dialog.set_server_config(self.servers[current_row])
             if dialog.exec_() == QDialog.Accepted:
                 self.servers[current_row] = dialog.get_server_config()
-                print(f"Debug: Updated server: {self.servers[current_row]['name']}")
-                self.server_list.item(current_row).setText(self.servers[current_row]['name'])
+                logger.debug(f"Updated server: {self.servers[current_row]['name']}")
+                self.server_list.item(current_row).setText(self.item_text(self.servers[current_row]))
                 
     def remove_server(self):
         current_row = self.server_list.currentRow()
         if current_row >= 0:
             server_name = self.servers[current_row]['name']
-            print(f"Debug: Removing server: {server_name}")
+            logger.debug(f"Removing server: {server_name}")
             self.servers.pop(current_row)
             self.server_list.takeItem(current_row)
         else:
-            print("Debug: No server selected for removal")
+            logger.debug("No server selected for removal")
             
 class ServerConfigDialog(QDialog):
     def __init__(self, parent=None):
@@ -529,9 +3660,9 @@ class ServerConfigDialog(QDialog):
         return True, ""
 
     def accept(self):
-        print("Debug: Validating server configuration")
+        logger.debug("Validating server configuration")
         config = self.get_server_config()
-        print(f"Debug: Server config: {config['name']} @ {config['url']}")
+        logger.debug(f"Server config: {config['name']} @ {config['url']}")
         
         if not config['name']:
             QMessageBox.warning(self, "Invalid Configuration",
@@ -588,18 +3719,58 @@ class ConnectionErrorDialog(QDialog):
         layout.addLayout(button_layout)
 
 class ServerStatusDialog(QDialog):
+    # Refresh interval without comet notifications, and the resync interval with them
+    POLL_INTERVAL = 5000
+    RESYNC_INTERVAL = 60000
+
+    # Status endpoints, and the notification classes announcing changes to them
+    ENDPOINTS = {
+        'serverinfo': 'api/serverinfo',
+        'inputs': 'api/status/inputs',
+        'connections': 'api/status/connections',
+        'subscriptions': 'api/status/subscriptions',
+    }
+    NOTIFICATION_ENDPOINTS = {
+        'input_status': 'inputs',
+        'connections': 'connections',
+        'subscriptions': 'subscriptions',
+    }
+    # (connect, read) timeouts, short for the live status so a slow server doesn't stall the tabs
+    ENDPOINT_TIMEOUTS = {
+        'serverinfo': (3, 10),
+        'inputs': (3, 5),
+        'connections': (3, 5),
+        'subscriptions': (3, 5),
+    }
+
     def __init__(self, server, parent=None):
         super().__init__(parent)
         self.server = server
+        self.api = TVHeadendAPI.for_server(server)
         self.parent = parent
         self.setWindowTitle("Server Status")
         self.resize(800, 600)
+        self.pending_endpoints = set()  # endpoints being fetched
+        self.results = {}  # last result of each endpoint
+        self.stale_endpoints = set()  # endpoints to fetch once their request finishes
         self.setup_ui()
         
-        # Update timer
+        # Update timer, polling only while comet notifications are unavailable
+        self.notifier = self.api.notifier()
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(5000)  # Update every 5 seconds
+        self.update_timer.start(self.RESYNC_INTERVAL if self.notifier.is_available
+                                else self.POLL_INTERVAL)
+        
+        # Subscriptions are announced every second while streaming; refresh
+        # at most once per batch of notifications
+        self.changes_timer = QTimer()
+        self.changes_timer.setSingleShot(True)
+        self.changes_timer.setInterval(500)
+        self.changes_timer.timeout.connect(self.update_stale)
+        
+        self.notifier.subscribe(self.on_notification, self.on_notifications_available)
+        self.finished.connect(self.stop_updates)
         
         # Initial update
         self.update_status()
@@ -647,177 +3818,230 @@ class ServerStatusDialog(QDialog):
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
         
-    def update_status(self):
-        try:
-            auth = None
-            if self.server.get('username') or self.server.get('password'):
-                auth = (self.server.get('username', ''), self.server.get('password', ''))
+    def update_status(self, keys=None):
+        """Refresh the given endpoints in the background, each in its own request.
 
-            # 1. Update Server Info Tab
-            server_info = f"Server Information:\n\n"
-            server_info += f"Name: {self.server.get('name', 'Unknown')}\n"
-            server_info += f"URL: {self.server.get('url', 'Unknown')}\n"
-            
-            # Get server version and capabilities
-            version_url = f"{self.server['url']}/api/serverinfo"
-            try:
-                version_response = requests.get(version_url, auth=auth)
-                if version_response.status_code == 200:
-                    server_data = version_response.json()
-                    server_info += f"\nServer Version: {server_data.get('sw_version', 'Unknown')}\n"
-                    server_info += f"API Version: {server_data.get('api_version', 'Unknown')}\n"
-                    server_info += f"Server Name: {server_data.get('server_name', 'Unknown')}\n"
-                    
-                    if 'capabilities' in server_data:
-                        server_info += "\nCapabilities:\n"
-                        for cap in server_data['capabilities']:
-                            server_info += f"- {cap}\n"
-            except Exception as e:
-                server_info += f"\nError fetching server info: {str(e)}\n"
-            
-            self.info_text.setText(server_info)
+        By default all endpoints are refreshed except the static server
+        info, which is only fetched until it has loaded once.
+        """
+        if keys is None:
+            keys = set(self.ENDPOINTS)
+            if 'serverinfo' in self.results and not isinstance(self.results['serverinfo'], Exception):
+                keys.discard('serverinfo')
+        for key in keys:
+            if key in self.pending_endpoints:
+                # Previous request still running, fetch again once it's done
+                self.stale_endpoints.add(key)
+                continue
+            self.pending_endpoints.add(key)
+            self.stale_endpoints.discard(key)
+            run_in_background(
+                self.fetch_endpoint, key,
+                on_result=lambda data, key=key: self.render_endpoint(key, data),
+                on_finished=lambda key=key: self.on_update_finished(key))
 
-            # 2. Update Signal Status Tab
-            inputs_url = f"{self.server['url']}/api/status/inputs"
-            try:
-                inputs_response = requests.get(inputs_url, auth=auth)
-                
-                if inputs_response.status_code == 200:
-                    inputs = inputs_response.json().get('entries', [])
-                    
-                    # Set up table with double the rows (signal and SNR on separate rows)
-                    self.signal_table.setRowCount(len(inputs) * 2)
-                    
-                    for i, input in enumerate(inputs):
-                        # Base row for this input (multiply by 2 since we're using 2 rows per input)
-                        base_row = i * 2
-                        
-                        # Input name spans both rows
-                        input_item = QTableWidgetItem(str(input.get('input', 'Unknown')))
-                        self.signal_table.setItem(base_row, 0, input_item)
-                        self.signal_table.setSpan(base_row, 0, 2, 1)  # Span 2 rows
-                        
-                        # Signal row
-                        signal = input.get('signal')
-                        signal_scale = input.get('signal_scale', 0)
-                        if signal is not None and signal_scale > 0:
-                            if signal_scale == 1:  # Relative (65535 = 100%)
-                                signal_value = f"{(signal * 100 / 65535):.1f}%"
-                            elif signal_scale == 2:  # Absolute (1000 = 1dB)
-                                signal_value = f"{(signal / 1000):.1f} dB"
-                            else:
-                                signal_value = "N/A"
-                        else:
-                            signal_value = "N/A"
-                        
-                        signal_item = QTableWidgetItem(signal_value)
-                        self.signal_table.setItem(base_row, 1, signal_item)
-                        self.signal_table.setItem(base_row, 2, QTableWidgetItem("Signal"))
-                        
-                        # SNR row
-                        snr = input.get('snr')
-                        snr_scale = input.get('snr_scale', 0)
-                        if snr is not None and snr_scale > 0:
-                            if snr_scale == 1:  # Relative (65535 = 100%)
-                                snr_value = f"{(snr * 100 / 65535):.1f}%"
-                            elif snr_scale == 2:  # Absolute (1000 = 1dB)
-                                snr_value = f"{(snr / 1000):.1f} dB"
-                            else:
-                                snr_value = "N/A"
-                        else:
-                            snr_value = "N/A"
-                        
-                        snr_item = QTableWidgetItem(snr_value)
-                        self.signal_table.setItem(base_row + 1, 1, snr_item)
-                        self.signal_table.setItem(base_row + 1, 2, QTableWidgetItem("SNR"))
-                        
-                        # Stream and Weight info (spans both rows)
-                        self.signal_table.setItem(base_row, 3, QTableWidgetItem(str(input.get('stream', 'N/A'))))
-                        self.signal_table.setItem(base_row, 4, QTableWidgetItem(str(input.get('weight', 'N/A'))))
-                        self.signal_table.setSpan(base_row, 3, 2, 1)  # Span 2 rows for stream
-                        self.signal_table.setSpan(base_row, 4, 2, 1)  # Span 2 rows for weight
-                        
-                        # Color coding for signal and SNR
-                        self.color_code_cell(signal_item, signal, signal_scale, 'signal')
-                        self.color_code_cell(snr_item, snr, snr_scale, 'snr')
-            except Exception as e:
-                print(f"Debug: Error updating signal status: {str(e)}")
+    def on_update_finished(self, key):
+        self.pending_endpoints.discard(key)
+        if key in self.stale_endpoints:
+            self.changes_timer.start()
+
+    def update_stale(self):
+        stale = self.stale_endpoints - self.pending_endpoints
+        if stale:
+            self.update_status(stale)
+
+    def on_notifications_available(self, available):
+        if available:
+            # Notifications before the new mailbox may have been missed
+            self.update_timer.start(self.RESYNC_INTERVAL)
+            self.update_status()
+        else:
+            self.update_timer.start(self.POLL_INTERVAL)
+
+    def on_notification(self, notification_class, message):
+        """Mark the endpoint a notification refers to for refreshing"""
+        key = self.NOTIFICATION_ENDPOINTS.get(notification_class)
+        if key:
+            self.stale_endpoints.add(key)
+            if not self.changes_timer.isActive():
+                self.changes_timer.start()
+
+    def fetch_endpoint(self, key):
+        """Download one status endpoint (runs on a worker thread).
+
+        Returns the decoded JSON, or the exception raised while fetching
+        it, so a failing endpoint is shown in its tab.
+        """
+        try:
+            response = self.api.get(self.ENDPOINTS[key], timeout=self.ENDPOINT_TIMEOUTS[key])
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            return e
+
+    def render_endpoint(self, key, data):
+        """Update the tab showing an endpoint as soon as its result arrives"""
+        self.results[key] = data
+        if not self.isVisible():
+            return
+        try:
+            if key == 'serverinfo':
+                self.render_info(data)
+            elif key == 'inputs':
+                self.render_inputs(data)
+            elif 'connections' in self.results and 'subscriptions' in self.results:
+                self.render_streams(self.results['connections'], self.results['subscriptions'])
+        except Exception as e:
+            logger.exception(f"Error in update_status: {str(e)}")
 
-            # 3. Update Active Streams Tab
-            connections_url = f"{self.server['url']}/api/status/connections"
-            subscriptions_url = f"{self.server['url']}/api/status/subscriptions"
+    def render_info(self, server_data):
+        """Update Server Info Tab"""
+        server_info = f"Server Information:\n\n"
+        server_info += f"Name: {self.server.get('name', 'Unknown')}\n"
+        server_info += f"URL: {self.server.get('url', 'Unknown')}\n"
+        
+        # Server version and capabilities
+        if isinstance(server_data, Exception):
+            server_info += f"\nError fetching server info: {str(server_data)}\n"
+        else:
+            server_info += f"\nServer Version: {server_data.get('sw_version', 'Unknown')}\n"
+            server_info += f"API Version: {server_data.get('api_version', 'Unknown')}\n"
+            server_info += f"Server Name: {server_data.get('server_name', 'Unknown')}\n"
             
-            try:
-                # Get both connections and subscriptions
-                connections_response = requests.get(connections_url, auth=auth)
-                subscriptions_response = requests.get(subscriptions_url, auth=auth)
-                
-                if connections_response.status_code == 200 and subscriptions_response.status_code == 200:
-                    connections = connections_response.json().get('entries', [])
-                    subscriptions = subscriptions_response.json().get('entries', [])
-                    
-                    # Calculate total rows needed (connections + subscriptions)
-                    total_rows = len(connections) + len(subscriptions)
-                    self.subscriptions_table.setRowCount(total_rows)
-                    
-                    # Add connections
-                    row = 0
-                    for conn in connections:
-                        # Peer (IP address/hostname)
-                        peer = conn.get('peer', 'Unknown')
-                        self.subscriptions_table.setItem(row, 0, QTableWidgetItem(str(peer)))
-                        self.subscriptions_table.setItem(row, 1, QTableWidgetItem(str(conn.get('user', 'N/A'))))
-                        
-                        # Start time
-                        start = datetime.fromtimestamp(conn.get('started', 0)).strftime('%H:%M:%S')
-                        self.subscriptions_table.setItem(row, 2, QTableWidgetItem(start))
-                        
-                        # Duration
-                        duration = int(time.time() - conn.get('started', 0))
-                        hours = duration // 3600
-                        minutes = (duration % 3600) // 60
-                        seconds = duration % 60
-                        duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                        self.subscriptions_table.setItem(row, 3, QTableWidgetItem(duration_str))
-                        
-                        # Type/Status
-                        self.subscriptions_table.setItem(row, 4, QTableWidgetItem("Connection"))
-                        
-                        row += 1
-                    
-                    # Add subscriptions
-                    for sub in subscriptions:
-                        # Channel/Service name
-                        channel = sub.get('channel', 'Unknown')
-                        if isinstance(channel, dict):
-                            channel = channel.get('name', 'Unknown')
-                        self.subscriptions_table.setItem(row, 0, QTableWidgetItem(str(channel)))
-                        self.subscriptions_table.setItem(row, 1, QTableWidgetItem(str(sub.get('username', 'N/A'))))
-                        
-                        # Start time
-                        start = datetime.fromtimestamp(sub.get('start', 0)).strftime('%H:%M:%S')
-                        self.subscriptions_table.setItem(row, 2, QTableWidgetItem(start))
-                        
-                        # Duration
-                        duration = int(time.time() - sub.get('start', 0))
-                        hours = duration // 3600
-                        minutes = (duration % 3600) // 60
-                        seconds = duration % 60
-                        duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                        self.subscriptions_table.setItem(row, 3, QTableWidgetItem(duration_str))
-                        
-                        # Type/Status
-                        status = f"Subscription ({sub.get('state', 'Unknown')})"
-                        self.subscriptions_table.setItem(row, 4, QTableWidgetItem(status))
-                        
-                        row += 1
+            if 'capabilities' in server_data:
+                server_info += "\nCapabilities:\n"
+                for cap in server_data['capabilities']:
+                    server_info += f"- {cap}\n"
+        
+        self.info_text.setText(server_info)
 
-            except Exception as e:
-                print(f"Debug: Error fetching connections/subscriptions: {str(e)}")
+    def render_inputs(self, inputs_data):
+        """Update Signal Status Tab"""
+        if isinstance(inputs_data, Exception):
+            logger.error(f"Error updating signal status: {str(inputs_data)}")
+            return
+        inputs = inputs_data.get('entries', [])
+        
+        # Set up table with double the rows (signal and SNR on separate rows)
+        self.signal_table.setRowCount(len(inputs) * 2)
+        
+        for i, input in enumerate(inputs):
+            # Base row for this input (multiply by 2 since we're using 2 rows per input)
+            base_row = i * 2
+            
+            # Input name spans both rows
+            input_item = QTableWidgetItem(str(input.get('input', 'Unknown')))
+            self.signal_table.setItem(base_row, 0, input_item)
+            self.signal_table.setSpan(base_row, 0, 2, 1)  # Span 2 rows
+            
+            # Signal row
+            signal = input.get('signal')
+            signal_scale = input.get('signal_scale', 0)
+            if signal is not None and signal_scale > 0:
+                if signal_scale == 1:  # Relative (65535 = 100%)
+                    signal_value = f"{(signal * 100 / 65535):.1f}%"
+                elif signal_scale == 2:  # Absolute (1000 = 1dB)
+                    signal_value = f"{(signal / 1000):.1f} dB"
+                else:
+                    signal_value = "N/A"
+            else:
+                signal_value = "N/A"
+            
+            signal_item = QTableWidgetItem(signal_value)
+            self.signal_table.setItem(base_row, 1, signal_item)
+            self.signal_table.setItem(base_row, 2, QTableWidgetItem("Signal"))
+            
+            # SNR row
+            snr = input.get('snr')
+            snr_scale = input.get('snr_scale', 0)
+            if snr is not None and snr_scale > 0:
+                if snr_scale == 1:  # Relative (65535 = 100%)
+                    snr_value = f"{(snr * 100 / 65535):.1f}%"
+                elif snr_scale == 2:  # Absolute (1000 = 1dB)
+                    snr_value = f"{(snr / 1000):.1f} dB"
+                else:
+                    snr_value = "N/A"
+            else:
+                snr_value = "N/A"
+            
+            snr_item = QTableWidgetItem(snr_value)
+            self.signal_table.setItem(base_row + 1, 1, snr_item)
+            self.signal_table.setItem(base_row + 1, 2, QTableWidgetItem("SNR"))
+            
+            # Stream and Weight info (spans both rows)
+            self.signal_table.setItem(base_row, 3, QTableWidgetItem(str(input.get('stream', 'N/A'))))
+            self.signal_table.setItem(base_row, 4, QTableWidgetItem(str(input.get('weight', 'N/A'))))
+            self.signal_table.setSpan(base_row, 3, 2, 1)  # Span 2 rows for stream
+            self.signal_table.setSpan(base_row, 4, 2, 1)  # Span 2 rows for weight
+            
+            # Color coding for signal and SNR
+            self.color_code_cell(signal_item, signal, signal_scale, 'signal')
+            self.color_code_cell(snr_item, snr, snr_scale, 'snr')
 
-        except Exception as e:
-            print(f"Debug: Error in update_status: {str(e)}")
-            print(f"Debug: Traceback: {traceback.format_exc()}")
+    def render_streams(self, connections_data, subscriptions_data):
+        """Update Active Streams Tab"""
+        for data in (connections_data, subscriptions_data):
+            if isinstance(data, Exception):
+                logger.error(f"Error fetching connections/subscriptions: {str(data)}")
+                return
+        connections = connections_data.get('entries', [])
+        subscriptions = subscriptions_data.get('entries', [])
+        
+        # Calculate total rows needed (connections + subscriptions)
+        total_rows = len(connections) + len(subscriptions)
+        self.subscriptions_table.setRowCount(total_rows)
+        
+        # Add connections
+        row = 0
+        for conn in connections:
+            # Peer (IP address/hostname)
+            peer = conn.get('peer', 'Unknown')
+            self.subscriptions_table.setItem(row, 0, QTableWidgetItem(str(peer)))
+            self.subscriptions_table.setItem(row, 1, QTableWidgetItem(str(conn.get('user', 'N/A'))))
+            
+            # Start time
+            start = datetime.fromtimestamp(conn.get('started', 0)).strftime('%H:%M:%S')
+            self.subscriptions_table.setItem(row, 2, QTableWidgetItem(start))
+            
+            # Duration
+            duration = int(time.time() - conn.get('started', 0))
+            hours = duration // 3600
+            minutes = (duration % 3600) // 60
+            seconds = duration % 60
+            duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            self.subscriptions_table.setItem(row, 3, QTableWidgetItem(duration_str))
+            
+            # Type/Status
+            self.subscriptions_table.setItem(row, 4, QTableWidgetItem("Connection"))
+            
+            row += 1
+        
+        # Add subscriptions
+        for sub in subscriptions:
+            # Channel/Service name
+            channel = sub.get('channel', 'Unknown')
+            if isinstance(channel, dict):
+                channel = channel.get('name', 'Unknown')
+            self.subscriptions_table.setItem(row, 0, QTableWidgetItem(str(channel)))
+            self.subscriptions_table.setItem(row, 1, QTableWidgetItem(str(sub.get('username', 'N/A'))))
+            
+            # Start time
+            start = datetime.fromtimestamp(sub.get('start', 0)).strftime('%H:%M:%S')
+            self.subscriptions_table.setItem(row, 2, QTableWidgetItem(start))
+            
+            # Duration
+            duration = int(time.time() - sub.get('start', 0))
+            hours = duration // 3600
+            minutes = (duration % 3600) // 60
+            seconds = duration % 60
+            duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            self.subscriptions_table.setItem(row, 3, QTableWidgetItem(duration_str))
+            
+            # Type/Status
+            status = f"Subscription ({sub.get('state', 'Unknown')})"
+            self.subscriptions_table.setItem(row, 4, QTableWidgetItem(status))
+            
+            row += 1
 
     def color_code_cell(self, item, value, scale, type='signal'):
         """Helper method to color code signal and SNR values"""
@@ -839,12 +4063,101 @@ class ServerStatusDialog(QDialog):
             else:
                 item.setBackground(Qt.red)
     
-    def closeEvent(self, event):
+    def stop_updates(self):
         self.update_timer.stop()
-        super().closeEvent(event)
+        self.changes_timer.stop()
+        if self.notifier is not None:
+            self.notifier.unsubscribe(self.on_notification, self.on_notifications_available)
+            self.notifier = None
+
+class IconCache:
+    """Icons of the UI, rasterised once per size and device pixel ratio.
+
+    Icons are read from the compiled Qt resources under RESOURCE_PREFIX,
+    falling back to icons_dir for any not compiled in. A QIcon made from
+    an SVG path re-reads and re-renders the file whenever a new one is
+    constructed; here each SVG is rendered once into a pixmap of the
+    requested size and shared by every QIcon asking for it.
+    """
+
+    RESOURCE_PREFIX = ':/icons'
+
+    icons_dir = None  # fallback directory, set by TVHeadendClient.setup_paths
+    _pixmaps = {}  # (name, width, height, ratio) -> QPixmap
+    _icons = {}  # (name, width, height, ratio) -> QIcon
+
+    @classmethod
+    def device_pixel_ratio(cls):
+        return QApplication.instance().devicePixelRatio()
+
+    @classmethod
+    def path(cls, name):
+        """Return where an icon is read from, or None if it doesn't exist"""
+        path = f'{cls.RESOURCE_PREFIX}/{name}'
+        if QFile.exists(path):
+            return path
+        if cls.icons_dir is not None:
+            path = os.path.join(cls.icons_dir, name)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @classmethod
+    def pixmap(cls, name, size):
+        """Return an icon rendered at size in device-independent pixels"""
+        ratio = cls.device_pixel_ratio()
+        key = (name, size.width(), size.height(), ratio)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = cls.render(name, size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            cls._pixmaps[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def icon(cls, name, size):
+        """Return a QIcon of an icon rendered at size"""
+        key = (name, size.width(), size.height(), cls.device_pixel_ratio())
+        icon = cls._icons.get(key)
+        if icon is None:
+            pixmap = cls.pixmap(name, size)
+            icon = QIcon(pixmap) if not pixmap.isNull() else QIcon()
+            cls._icons[key] = icon
+        return icon
+
+    @classmethod
+    def render(cls, name, size):
+        path = cls.path(name)
+        if path is None:
+            logger.warning(f"Icon not found: {name}")
+            return QPixmap()
+        reader = QImageReader(path)
+        # Scaled reading renders SVGs at the target size instead of scaling a bitmap;
+        # SVGs without a usable intrinsic size are rendered at the requested size
+        intrinsic = reader.size()
+        reader.setScaledSize(intrinsic.scaled(size, Qt.KeepAspectRatio) if intrinsic.isValid() else size)
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"Could not load icon {path}: {reader.errorString()}")
+            return QPixmap()
+        return QPixmap.fromImage(image)
 
 class TVHeadendClient(QMainWindow):
-    def __init__(self):
+    # Channel grid page sizes: a small first page so rows show up quickly
+    FIRST_CHANNEL_PAGE = 100
+    CHANNEL_PAGE_SIZE = 1000
+    # Shown in server_combo after the servers when there is more than one
+    LINEUP_LABEL = "All servers"
+    # displayed_server_key while the merged lineup is shown
+    LINEUP_KEY = 'lineup'
+
+    # VLC's network cache in ms unless the config or command line sets one
+    NETWORK_CACHING = 1000
+    # Wait after a channel shows before pre-opening the next ones, so zapping
+    # through the list doesn't open and close streams on every step
+    PREWARM_DELAY = 2000
+
+    def __init__(self, network_caching=None):
         super().__init__()
         self.setup_paths()
         
@@ -862,10 +4175,17 @@ class TVHeadendClient(QMainWindow):
         
         # Set config file path
         self.config_file = os.path.join(self.config_dir, 'tvhplayer.conf')
-        print(f"Debug: Config file location: {self.config_file}")
+        self.channel_cache = ChannelCache(self.config_dir)
+        self.epg_stores = {}  # server key -> EPGStore
+        self.now_next_building = False
+        self.now_next_stale = False  # rebuild once the running build finishes
+        logger.debug(f"Config file location: {self.config_file}")
         self.config = self.load_config()
-        print(f"Debug: Current config: {json.dumps(self.config, indent=2)}")
-        print("Debug: Initializing TVHeadendClient")
+        logger.debug(f"Loaded config with {len(self.config.get('servers', []))} servers")
+        logger.debug("Initializing TVHeadendClient")
+        if network_caching is None:
+            network_caching = self.config.get('network_caching', self.NETWORK_CACHING)
+        self.network_caching = network_caching
         
         # Initialize fullscreen state        
         # Rest of initialization code...
@@ -883,10 +4203,29 @@ class TVHeadendClient(QMainWindow):
         
         # Initialize servers from config
         self.servers = self.config.get('servers', [])
-        print(f"Debug: Loaded {len(self.servers)} servers")
+        logger.debug(f"Loaded {len(self.servers)} servers")
+        
+        # Keep checking every server, and fail over when the one in use goes down
+        self.prober = HealthProber(self)
+        self.prober.set_servers(self.servers)
+        self.prober.state_changed.connect(self.on_server_state_changed)
         
         # Initialize channels list
         self.channels = []
+        self.channel_fetch_id = 0
+        # Fetch whose pages are being streamed into channel_list
+        self.channel_stream_id = None
+        # Server whose channels are shown in channel_list
+        self.displayed_server_key = None
+        # ChannelLineup shown in channel_list when all servers are selected
+        self.lineup = None
+        # Plays that are waiting for a server to be chosen are dropped once
+        # another channel is played
+        self.play_id = 0
+        # (server config, channel data) of the channel being played
+        self.playing = None
+        # Name of a channel to play once the server failed over to has listed it
+        self.resume_channel = None
         
         self.is_fullscreen = False
  
@@ -899,7 +4238,7 @@ class TVHeadendClient(QMainWindow):
         self.opacity_effect = None
         
         # Initialize VLC with basic instance first
-        print("Debug: Initializing VLC instance")
+        logger.debug("Initializing VLC instance")
         try:
             if getattr(sys, 'frozen', False):
                 # If running as compiled executable
@@ -913,14 +4252,14 @@ class TVHeadendClient(QMainWindow):
                 if sys.platform.startswith('linux'):
                     os.environ['LD_LIBRARY_PATH'] = base_path
                     
-                print(f"Debug: VLC plugin path set to: {plugin_path}")
+                logger.debug(f"VLC plugin path set to: {plugin_path}")
                 
             # Initialize VLC with hardware acceleration parameters
             vlc_args = [
                 # Enable hardware decoding
                 '--avcodec-hw=any',  # Try any hardware acceleration method
                 '--file-caching=1000',  # Increase file caching for smoother playback
-                '--network-caching=1000',  # Increase network caching for streaming
+                f'--network-caching={self.network_caching}',  # Increase network caching for streaming
                 '--no-video-title-show',  # Don't show the video title
                 '--no-snapshot-preview',  # Don't show snapshot previews
             ]
@@ -929,43 +4268,59 @@ class TVHeadendClient(QMainWindow):
             if not self.instance:
                 raise RuntimeError("VLC Instance creation returned None")
                 
-            print("Debug: VLC instance created successfully with hardware acceleration")
+            logger.debug("VLC instance created successfully with hardware acceleration")
             
             self.media_player = self.instance.media_player_new()
             if not self.media_player:
                 raise RuntimeError("VLC media player creation returned None")
                 
-            print("Debug: VLC media player created successfully")
+            logger.debug("VLC media player created successfully")
+            
+            # Time every channel switch until its first frame shows
+            self.zap_tracker = ZapTracker(os.path.join(self.config_dir, 'zap_stats.json'), self)
+            self.zap_tracker.zap_finished.connect(self.on_zap_finished)
             
         except Exception as e:
-            print(f"Error initializing VLC: {str(e)}")
+            logger.error(f"Error initializing VLC: {str(e)}")
             raise RuntimeError(f"Failed to initialize VLC: {str(e)}")
         
         # Then setup UI
         self.setup_ui()
         
+        # Keep players open on the channels likely played next
+        self.zap_engine = ZapEngine(
+            self.instance, self.media_player, self.video_frame,
+            tuners=self.config.get('prewarm_tuners', 0),
+            bandwidth=self.config.get('prewarm_bandwidth', 0), parent=self)
+        for player in self.zap_engine.players:
+            self.zap_tracker.attach(player)
+        self.zap_tracker.set_player(self.media_player)
+        self.prewarm_timer = QTimer(self)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.setInterval(self.PREWARM_DELAY)
+        self.prewarm_timer.timeout.connect(self.prewarm_channels)
+        # Channel played before the current one, for switching back
+        self.previous_channel = None
+        # Rows moved in the channel list by the last channel switch, or None
+        self.zap_step = None
+        
         # Update to use config for last server
         self.server_combo.setCurrentIndex(self.config.get('last_server', 0))
+        self.prober.start()
         
         # Now configure hardware acceleration after UI is set up
         try:
-            # Set player window - with proper type conversion
-            if sys.platform.startswith('linux'):
-                handle = self.video_frame.winId().__int__()
-                if handle is not None:
-                    self.media_player.set_xwindow(handle)
-            elif sys.platform == "win32":
-                self.media_player.set_hwnd(self.video_frame.winId().__int__())
-            elif sys.platform == "darwin":
-                self.media_player.set_nsobject(self.video_frame.winId().__int__())
-            
-            # Set hardware decoding to automatic
-            if hasattr(self.media_player, 'set_hardware_decoding'):
-                self.media_player.set_hardware_decoding(True)
-            else:
-                # Alternative method for older VLC Python bindings
-                self.media_player.video_set_key_input(False)
-                self.media_player.video_set_mouse_input(False)
+            # Set player windows - with proper type conversion
+            self.zap_engine.attach_outputs()
+            
+            for player in self.zap_engine.players:
+                # Set hardware decoding to automatic
+                if hasattr(player, 'set_hardware_decoding'):
+                    player.set_hardware_decoding(True)
+                else:
+                    # Alternative method for older VLC Python bindings
+                    player.video_set_key_input(False)
+                    player.video_set_mouse_input(False)
             
             # Add a timer to check which hardware acceleration method is being used
             # This will check after playback starts
@@ -974,11 +4329,11 @@ class TVHeadendClient(QMainWindow):
             self.hw_check_timer.timeout.connect(self.check_hardware_acceleration)
             self.hw_check_timer.start(5000)  # Check after 5 seconds of playback
                 
-            print("Debug: Hardware acceleration configured for VLC")
+            logger.debug("Hardware acceleration configured for VLC")
             
         except Exception as e:
-            print(f"Warning: Could not configure hardware acceleration: {str(e)}")
-            print("Continuing without hardware acceleration")
+            logger.warning(f"Could not configure hardware acceleration: {str(e)}")
+            logger.info("Continuing without hardware acceleration")
     
     def setup_paths(self):
         """Setup application paths for resources"""
@@ -992,7 +4347,7 @@ class TVHeadendClient(QMainWindow):
         # Ensure icons directory exists
         self.icons_dir = self.app_dir / 'icons'
         if not self.icons_dir.exists():
-            print(f"Warning: Icons directory not found at {self.icons_dir}")
+            logger.warning(f"Icons directory not found at {self.icons_dir}")
             # Try looking up one directory (in case we're in src/)
             self.icons_dir = self.app_dir.parent / 'icons'
             if not self.icons_dir.exists():
@@ -1019,31 +4374,130 @@ class TVHeadendClient(QMainWindow):
                 for dir in system_icon_dirs:
                     if dir.exists():
                         self.icons_dir = dir
-                        print(f"Using system icons directory: {self.icons_dir}")
+                        logger.info(f"Using system icons directory: {self.icons_dir}")
                         break
                 else:
-                    raise RuntimeError(f"Icons directory not found in {self.app_dir}, parent directory, or system locations")
+                    # Icons are served from the compiled resources; the
+                    # directory only supplies any that are not compiled in
+                    logger.warning(f"Icons directory not found in {self.app_dir}, parent directory, or system locations")
         
-        print(f"Debug: Using icons directory: {self.icons_dir}")
+        logger.debug(f"Using icons directory: {self.icons_dir}")
+        IconCache.icons_dir = str(self.icons_dir)
         
-    def get_icon(self, icon_name):
-        """Get icon path and verify it exists"""
-        # Always use app_dir/icons path
-        icon_path = self.app_dir / 'icons' / icon_name
-        if not icon_path.exists():
-            print(f"Warning: Icon not found: {icon_path}")
-            return None
-        return str(icon_path)
+    def get_icon(self, icon_name, size=QSize(24, 24)):
+        """Get an icon rendered at size from the shared icon cache"""
+        return IconCache.icon(icon_name, size)
+
+    def fill_server_combo(self):
+        for server in self.servers:
+            logger.debug(f"Adding server to combo: {server['name']}")
+            self.server_combo.addItem(server['name'])
+        if len(self.servers) > 1:
+            self.server_combo.addItem(self.LINEUP_LABEL)
+
+    def is_lineup(self):
+        """Return whether the merged lineup of all servers is selected"""
+        return len(self.servers) > 1 and self.server_combo.currentIndex() == len(self.servers)
+
+    def current_server(self):
+        """Return the config dict of the server selected in server_combo.
+
+        When all servers are selected this is the first one that is not
+        down, which serves the EPG, DVR and status views.
+        """
+        if self.is_lineup():
+            return next((server for server in self.servers if not self.prober.is_down(server)),
+                        self.servers[0])
+        return self.servers[self.server_combo.currentIndex()]
+
+    def current_api(self):
+        """Return the pooled API client for the selected server"""
+        return TVHeadendAPI.for_server(self.current_server())
+
+    def epg_store(self, server):
+        """Return the local EPG database of a server, or None if it can't be opened"""
+        key = TVHeadendAPI.server_key(server)
+        store = self.epg_stores.get(key)
+        if store is None:
+            path = os.path.join(self.config_dir,
+                                f'epg_{ChannelCache.server_digest(server)}.sqlite')
+            try:
+                store = EPGStore(TVHeadendAPI.for_server(server), path, self)
+            except sqlite3.Error as e:
+                logger.error(f"Error opening EPG database {path}: {str(e)}")
+                return None
+            store.updated.connect(lambda: self.on_epg_updated(store))
+            self.epg_stores[key] = store
+        return store
+
+    def current_epg_store(self):
+        return self.epg_store(self.current_server()) if self.servers else None
+
+    def on_epg_updated(self, store):
+        if store is self.current_epg_store():
+            self.refresh_now_next()
+
+    def refresh_now_next(self):
+        """Rebuild the now/next snapshot from the selected server's EPG database"""
+        store = self.current_epg_store()
+        if store is None:
+            return
+        if self.now_next_building:
+            self.now_next_stale = True
+            return
+        self.now_next_building = True
+        run_in_background(
+            NowNextSnapshot.build, store, time.time(),
+            on_result=lambda snapshot: self.on_now_next_built(store, snapshot),
+            on_error=lambda e: logger.error(f"Error reading now/next programmes: {str(e)}"),
+            on_finished=self.on_now_next_finished)
+
+    def on_now_next_built(self, store, snapshot):
+        if store is not self.current_epg_store():
+            return
+        self.channel_model.set_now_next(snapshot, time.time())
+        self.schedule_now_next()
+
+    def on_now_next_finished(self):
+        self.now_next_building = False
+        if self.now_next_stale:
+            self.now_next_stale = False
+            self.refresh_now_next()
+
+    def update_now_next(self):
+        """Move the now/next column on at a programme boundary"""
+        snapshot = self.channel_model.now_next
+        now = time.time()
+        if snapshot is None or not snapshot.covers(now):
+            self.refresh_now_next()
+            return
+        self.channel_model.set_now_next(snapshot, now)
+        self.schedule_now_next()
+
+    def schedule_now_next(self):
+        """Wake up when the next programme on any channel starts or ends"""
+        boundary = self.channel_model.now_next_boundary
+        if boundary is None:
+            return
+        delay = max(0, boundary - time.time())
+        self.now_next_timer.start(int(delay * 1000) + 50)
+
+    def release_epg_stores(self):
+        """Stop updating the EPG of servers that are no longer configured"""
+        keep = {TVHeadendAPI.server_key(server) for server in self.servers}
+        for key in list(self.epg_stores):
+            if key not in keep:
+                self.epg_stores.pop(key).stop()
     
     def setup_ui(self):
         """Setup the UI elements"""
 
         
         # Create buttons with icons
-        self.play_btn = QAction(QIcon(self.get_icon('play.svg')), 'Play', self)
-        self.stop_btn = QAction(QIcon(self.get_icon('stop.svg')), 'Stop', self)
-        self.record_btn = QAction(QIcon(self.get_icon('record.svg')), 'Record', self)
-        self.stop_record_btn = QAction(QIcon(self.get_icon('stoprec.svg')), 'Stop Recording', self)
+        self.play_btn = QAction(self.get_icon('play.svg'), 'Play', self)
+        self.stop_btn = QAction(self.get_icon('stop.svg'), 'Stop', self)
+        self.record_btn = QAction(self.get_icon('record.svg'), 'Record', self)
+        self.stop_record_btn = QAction(self.get_icon('stoprec.svg'), 'Stop Recording', self)
         
 
         
@@ -1101,8 +4555,7 @@ class TVHeadendClient(QMainWindow):
         server_layout = QHBoxLayout()
         self.server_combo = QComboBox()
         self.server_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        for server in self.servers:
-            self.server_combo.addItem(server['name'])
+        self.fill_server_combo()
         
         # Connect server combo box change signal
         self.server_combo.currentIndexChanged.connect(self.on_server_changed)
@@ -1121,19 +4574,40 @@ class TVHeadendClient(QMainWindow):
     
 
         # Channel list
-        self.channel_list = QTableWidget()
-        self.channel_list.setColumnCount(2)
-        self.channel_list.setHorizontalHeaderLabels(['', 'Channel Name'])
+        self.channel_model = ChannelTableModel(self)
+        
+        self.channel_list = QTableView()
+        self.channel_list.setModel(self.channel_model)
         self.channel_list.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.channel_list.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.channel_list.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.channel_list.setItemDelegateForColumn(2, NowPlayingDelegate(self.channel_list))
+        self.logo_loader = LogoLoader(os.path.join(self.config_dir, 'logos'), self)
+        self.channel_model.set_logo_loader(self.logo_loader)
+        self.channel_list.setIconSize(LogoLoader.LOGO_SIZE)
+        self.prefetcher = ChannelPrefetcher(self.channel_list, self)
+        self.prefetcher.logo_loader = self.logo_loader
+        
+        # Now/next programmes change at programme boundaries; in between the
+        # progress bars are just repainted
+        self.now_next_timer = QTimer(self)
+        self.now_next_timer.setSingleShot(True)
+        self.now_next_timer.setTimerType(Qt.PreciseTimer)
+        self.now_next_timer.timeout.connect(self.update_now_next)
+        self.progress_timer = QTimer(self)
+        self.progress_timer.timeout.connect(self.channel_list.viewport().update)
+        self.progress_timer.start(60000)
         self.channel_list.verticalHeader().setVisible(False)
-        self.channel_list.setSelectionBehavior(QTableWidget.SelectRows)
-        self.channel_list.setSelectionMode(QTableWidget.SingleSelection)
+        # Uniform rows, so the view doesn't measure every row of large lineups
+        self.channel_list.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.channel_list.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.channel_list.setSelectionMode(QAbstractItemView.SingleSelection)
         self.channel_list.setSortingEnabled(True)
-        self.channel_list.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.channel_list.sortByColumn(0, Qt.AscendingOrder)
+        self.channel_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         # Connect double-click to play
-        self.channel_list.itemDoubleClicked.connect(self.play_channel_from_table)
+        self.channel_list.doubleClicked.connect(self.play_channel_from_table)
         
         # Connect context menu
         self.channel_list.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -1152,7 +4626,7 @@ class TVHeadendClient(QMainWindow):
         self.video_frame = QWidget()
         self.video_frame.setStyleSheet("""
             background-color: black;
-            background-image: url(icons/playerbg.svg);
+            background-image: url(:/icons/playerbg.svg);
             background-position: center;
             background-repeat: no-repeat;
         """)
@@ -1172,23 +4646,21 @@ class TVHeadendClient(QMainWindow):
         # Play button
         self.play_btn = QPushButton()
         self.play_btn.setFixedSize(48, 48)
-        self.play_btn.setIcon(QIcon(f"{self.icons_dir}/play.svg"))
+        self.play_btn.setIcon(self.get_icon('play.svg', QSize(48, 48)))
         self.play_btn.setIconSize(QSize(48, 48))
         self.play_btn.setStyleSheet("QPushButton { border-radius: 24px; }")
         self.play_btn.clicked.connect(lambda: self.play_channel_by_data(
-            self.channel_list.currentItem().data(Qt.UserRole) if self.channel_list.currentItem() 
-            else self.channel_list.item(0, 1).data(Qt.UserRole) if self.channel_list.rowCount() > 0 
-            else None))
+            self.selected_channel() or self.first_channel()))
         self.play_btn.setToolTip("Play selected channel")
         playback_layout.addWidget(self.play_btn)
         
         # Stop button
         self.stop_btn = QPushButton()
         self.stop_btn.setFixedSize(48, 48)
-        self.stop_btn.setIcon(QIcon(f"{self.icons_dir}/stop.svg"))
+        self.stop_btn.setIcon(self.get_icon('stop.svg', QSize(48, 48)))
         self.stop_btn.setIconSize(QSize(48, 48))
         self.stop_btn.setStyleSheet("QPushButton { border-radius: 24px; }")
-        self.stop_btn.clicked.connect(self.media_player.stop)
+        self.stop_btn.clicked.connect(self.stop_playback)
         self.stop_btn.setToolTip("Stop playback")
         playback_layout.addWidget(self.stop_btn)
         
@@ -1205,7 +4677,7 @@ class TVHeadendClient(QMainWindow):
         # Start Record button
         self.start_record_btn = QPushButton()
         self.start_record_btn.setFixedSize(48, 48)  # Remove extra parenthesis
-        self.start_record_btn.setIcon(QIcon(f"{self.icons_dir}/record.svg"))
+        self.start_record_btn.setIcon(self.get_icon('record.svg', QSize(48, 48)))
         self.start_record_btn.setIconSize(QSize(48, 48))
         self.start_record_btn.setStyleSheet("QPushButton { border-radius: 24px; }")
         self.start_record_btn.setToolTip("Start Recording")
@@ -1215,7 +4687,7 @@ class TVHeadendClient(QMainWindow):
         # Stop Record button 
         self.stop_record_btn = QPushButton()
         self.stop_record_btn.setFixedSize(48, 48)  # Remove extra parenthesis
-        self.stop_record_btn.setIcon(QIcon(f"{self.icons_dir}/stoprec.svg"))
+        self.stop_record_btn.setIcon(self.get_icon('stoprec.svg', QSize(48, 48)))
         self.stop_record_btn.setIconSize(QSize(48, 48))
         self.stop_record_btn.setStyleSheet("QPushButton { border-radius: 24px; }")
         self.stop_record_btn.setToolTip("Stop Recording")
@@ -1234,20 +4706,20 @@ class TVHeadendClient(QMainWindow):
         # Start Local Record button
         self.start_local_record_btn = QPushButton()
         self.start_local_record_btn.setFixedSize(48, 48)  # Remove extra parenthesis
-        self.start_local_record_btn.setIcon(QIcon(f"{self.icons_dir}/reclocal.svg"))
+        self.start_local_record_btn.setIcon(self.get_icon('reclocal.svg', QSize(48, 48)))
         self.start_local_record_btn.setIconSize(QSize(48, 48))
         self.start_local_record_btn.setStyleSheet("QPushButton { border-radius: 24px; }")
         self.start_local_record_btn.setToolTip("Start Local Recording")
         self.start_local_record_btn.clicked.connect(
             lambda: self.start_local_recording(
-                self.channel_list.currentItem().text() if self.channel_list.currentItem() else None
+                self.selected_channel()['name'] if self.selected_channel() else None
             ))
         local_record_layout.addWidget(self.start_local_record_btn)
 
         # Stop Local Record button
         self.stop_local_record_btn = QPushButton()
         self.stop_local_record_btn.setFixedSize(48, 48)  # Remove extra parenthesis
-        self.stop_local_record_btn.setIcon(QIcon(f"{self.icons_dir}/stopreclocal.svg"))
+        self.stop_local_record_btn.setIcon(self.get_icon('stopreclocal.svg', QSize(48, 48)))
         self.stop_local_record_btn.setIconSize(QSize(48, 48))
         self.stop_local_record_btn.setStyleSheet("QPushButton { border-radius: 24px; }")
         self.stop_local_record_btn.setToolTip("Stop Local Recording")
@@ -1264,7 +4736,7 @@ class TVHeadendClient(QMainWindow):
         
         
         self.mute_btn = QPushButton()
-        self.mute_btn.setIcon(QIcon(f"{self.icons_dir}/unmute.svg"))
+        self.mute_btn.setIcon(self.get_icon('unmute.svg', QSize(32, 32)))
         self.mute_btn.setIconSize(QSize(32, 32))
         self.mute_btn.setFixedSize(32, 32)  # Remove extra parenthesis
         self.mute_btn.setCheckable(True)  # Make the button checkable
@@ -1281,7 +4753,7 @@ class TVHeadendClient(QMainWindow):
         
         # Fullscreen button with icon
         fullscreen_btn = QPushButton()
-        fullscreen_btn.setIcon(QIcon(f"{self.icons_dir}/fullscreen.svg"))
+        fullscreen_btn.setIcon(self.get_icon('fullscreen.svg', QSize(32, 32)))
         fullscreen_btn.setIconSize(QSize(32, 32))
         fullscreen_btn.setFixedSize(32, 32)  # Remove extra parenthesis
         fullscreen_btn.clicked.connect(self.toggle_fullscreen)
@@ -1352,9 +4824,6 @@ class TVHeadendClient(QMainWindow):
             self.status_label.setText(message)
         self.statusbar.showMessage = custom_show_message
         
-        # Initialize
-        self.fetch_channels()
-        
         # Connect channel list double click to play
         
         # Add event filter to video frame for double-click
@@ -1370,6 +4839,20 @@ class TVHeadendClient(QMainWindow):
         # Add DVR Status to View menu
         dvr_status_action = view_menu.addAction("DVR Status")
         dvr_status_action.triggered.connect(self.show_dvr_status)
+        dvr_dashboard_action = view_menu.addAction("DVR Dashboard")
+        dvr_dashboard_action.triggered.connect(self.show_dvr_dashboard)
+        
+        # Add zap statistics to View menu
+        zap_stats_action = view_menu.addAction("Zap Statistics")
+        zap_stats_action.triggered.connect(self.show_zap_stats)
+        
+        # Add TV guide to View menu
+        epg_grid_action = view_menu.addAction("TV Guide")
+        epg_grid_action.triggered.connect(self.show_epg_grid)
+        
+        # Add EPG search to View menu
+        epg_search_action = view_menu.addAction("Search EPG")
+        epg_search_action.triggered.connect(self.show_epg_search)
         
         # Add search box before styling it
         search_layout = QHBoxLayout()
@@ -1384,12 +4867,31 @@ class TVHeadendClient(QMainWindow):
         
         self.search_box.setPlaceholderText("Press S to search channels...")
         self.search_box.textChanged.connect(self.filter_channels)
+        # Filter once typing pauses rather than on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_channel_filter)
         self.search_box.setClearButtonEnabled(True)  # Add clear button inside search box
         
         # Add Ctrl+F shortcut for search box
         search_shortcut = QShortcut(QKeySequence(Qt.Key_S, Qt.NoModifier), self)
         search_shortcut.activated.connect(self.search_box.setFocus)
         
+        # With the video focused (click it, or in fullscreen) Page Up/Down switch to
+        # the channel above/below and Backspace back to the previous one; the
+        # keys keep their usual meaning in the channel list and search box
+        self.video_frame.setFocusPolicy(Qt.ClickFocus)
+        channel_up_shortcut = QShortcut(QKeySequence(Qt.Key_PageUp), self.video_frame)
+        channel_up_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        channel_up_shortcut.activated.connect(lambda: self.play_adjacent_channel(-1))
+        channel_down_shortcut = QShortcut(QKeySequence(Qt.Key_PageDown), self.video_frame)
+        channel_down_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        channel_down_shortcut.activated.connect(lambda: self.play_adjacent_channel(1))
+        previous_channel_shortcut = QShortcut(QKeySequence(Qt.Key_Backspace), self.video_frame)
+        previous_channel_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        previous_channel_shortcut.activated.connect(self.play_previous_channel)
+        
         # Create custom clear button action
         clear_action = QAction("⌫", self.search_box)
         self.search_box.addAction(clear_action, QLineEdit.TrailingPosition)
@@ -1405,253 +4907,375 @@ class TVHeadendClient(QMainWindow):
         search_layout.setContentsMargins(0, 5, 0, 5)
         search_layout.setSpacing(5)
         
+        # Initialize
+        self.fetch_channels()
+        
     def fetch_channels(self):
-        """Fetch channel list from current TVHeadend server"""
-        try:
-            if not self.servers:
-                print("Debug: No servers configured")
-                self.statusbar.showMessage("No servers configured")
-                return
-                
-            server = self.servers[self.server_combo.currentIndex()]
-            print(f"Debug: Fetching channels from server: {server['url']}")
-            
-            # Initialize verification list
-            channel_verification = []
-            
-            # Update status bar
-            self.statusbar.showMessage("Connecting to server...")
-            
-            # Clean and format the URL properly
-            url = server['url']
-            if url.startswith('https://') or url.startswith('http://'):
-                base_url = url
-            else:
-                base_url = f"http://{url}"
-            
-            api_url = f'{base_url}/api/channel/grid?limit=10000'
-            print(f"Debug: Making request to: {api_url}")
-            
-            # Create auth tuple if credentials exist
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-                print(f"Debug: Using authentication with username: {server.get('username', '')}")
-            
-            # Add timeout parameter (10 seconds)
-            response = requests.get(api_url, auth=auth, timeout=10)
-            
-            channels = response.json()['entries']
-            print(f"Debug: Found {len(channels)} channels")
-            
-            # First, disable sorting while adding items
-            #self.channel_list.setSortingEnabled(False)
-            
-            # Clear existing items
-            self.channel_list.setRowCount(0)
-            
-            # Create a list to store channel data for sorting
-            channel_data = []
-            
-            # Process all channels first
-            for channel in channels:
-                try:
-                    channel_name = channel.get('name', 'Unknown Channel')
-                    channel_number = channel.get('number', 0)  # Use 0 as default for unnumbered channels
-                    
-                    # Store channel data for sorting
-                    channel_data.append({
-                        'number': channel_number,
-                        'name': channel_name,
-                        'data': channel
-                    })
-                    
-                except Exception as e:
-                    print(f"Debug: Error processing channel {channel.get('name', 'Unknown')}: {str(e)}")
-                    continue
-            
-            # Sort channels by number, then name
-            channel_data.sort(key=lambda x: (x['number'] or float('inf'), x['name'].lower()))
+        """Fetch channel list from current TVHeadend server in the background"""
+        if not self.servers:
+            logger.debug("No servers configured")
+            self.statusbar.showMessage("No servers configured")
+            return
             
-            # Now add sorted channels to the table
-            for idx, channel in enumerate(channel_data):
-                try:
-                    print(f"Debug: Adding channel {idx + 1}/{len(channel_data)}: {channel['name']}")
-                    
-                    row = self.channel_list.rowCount()
-                    self.channel_list.insertRow(row)
-                    
-                    # Create and add number item
-                    number_item = QTableWidgetItem()
-                    number_item.setData(Qt.DisplayRole, channel['number'])
-                    self.channel_list.setItem(row, 0, number_item)
-                    
-                    # Create and add name item
-                    name_item = QTableWidgetItem(channel['name'])
-                    name_item.setData(Qt.UserRole, channel['data'])
-                    self.channel_list.setItem(row, 1, name_item)
-                    
-                    # Add to verification list
-                    channel_verification.append({
-                        'row': row,
-                        'name': channel['name'],
-                        'number': channel['number']
-                    })
-                    
-                    print(f"Debug: Added channel to row {row}: {channel['name']}")
-                    
-                except Exception as e:
-                    print(f"Debug: Error adding channel to table: {str(e)}")
+        server = self.current_server()
+        api = TVHeadendAPI.for_server(server)
+        self.logo_loader.set_api(api)
+        
+        # Results of an older fetch (e.g. before a server switch) are discarded
+        self.channel_fetch_id += 1
+        fetch_id = self.channel_fetch_id
+        
+        if self.is_lineup():
+            self.fetch_lineup(fetch_id)
+            return
+        logger.debug(f"Fetching channels from server: {api.base_url}")
+        
+        # Show the cached list straight away, then revalidate it against the server
+        server_key = TVHeadendAPI.server_key(server)
+        if self.displayed_server_key != server_key:
+            cached = self.channel_cache.load(server)
+            if cached:
+                logger.debug(f"Showing {len(cached)} cached channels")
+                api.channel_index = ChannelIndex(cached)
+                self.populate_channels(fetch_id, server, cached)
+        
+        # Update status bar
+        self.statusbar.showMessage("Connecting to server...")
+        
+        self.start_epg_store(server)
+        
+        run_in_background(
+            self.download_channels, api, lambda: fetch_id == self.channel_fetch_id,
+            on_progress=lambda page: self.on_channel_page(fetch_id, server, page),
+            on_result=lambda channels: self.on_channels_downloaded(fetch_id, server, channels),
+            on_error=lambda e: self.on_fetch_channels_error(fetch_id, server, e))
+
+    def start_epg_store(self, server):
+        """Keep the EPG database of a server up to date in the background"""
+        epg_store = self.epg_store(server)
+        if epg_store:
+            epg_store.start()
+            self.refresh_now_next()
+        self.prefetcher.set_store(epg_store)
+
+    def fetch_lineup(self, fetch_id):
+        """Fetch the channels of all servers at once and show them merged.
+
+        The merged cached lists are shown straight away. Once every server
+        has answered or failed, the downloaded lists, and the cached ones
+        of servers that failed, are merged again.
+        """
+        logger.debug(f"Fetching channels from {len(self.servers)} servers")
+        if self.displayed_server_key != self.LINEUP_KEY:
+            cached = [(server, self.channel_cache.load(server)) for server in self.servers]
+            cached = [(server, store) for server, store in cached if store]
+            if cached:
+                self.populate_lineup(fetch_id, ChannelLineup(cached))
+        
+        self.statusbar.showMessage(f"Connecting to {len(self.servers)} servers...")
+        self.start_epg_store(self.current_server())
+        
+        results = {}  # server index -> ChannelStore, or None if the download failed
+        for i, server in enumerate(self.servers):
+            run_in_background(
+                self.download_channels, TVHeadendAPI.for_server(server),
+                lambda: fetch_id == self.channel_fetch_id,
+                on_progress=lambda page: None,
+                on_result=lambda store, i=i: self.on_lineup_channels(i, results, store),
+                on_error=lambda e, i=i: self.on_lineup_error(fetch_id, i, results, e),
+                on_finished=lambda: self.on_lineup_finished(fetch_id, results))
+
+    def on_lineup_channels(self, i, results, store):
+        results[i] = store
+
+    def on_lineup_error(self, fetch_id, i, results, error):
+        if fetch_id == self.channel_fetch_id:
+            logger.error(f"Error fetching channels from {self.servers[i]['name']}: {str(error)}")
+        results[i] = None
+
+    def on_lineup_finished(self, fetch_id, results):
+        """Merge the lineup once the downloads of all servers have finished"""
+        if fetch_id != self.channel_fetch_id or len(results) < len(self.servers):
+            return
+        stores = []
+        failed = 0
+        for i, server in enumerate(self.servers):
+            store = results[i]
+            if store is None:
+                # Unreachable servers still contribute their cached channels
+                failed += 1
+                store = self.channel_cache.load(server)
+                if store is None:
                     continue
-            
-            # Re-enable sorting but don't trigger an automatic sort
-            self.channel_list.setSortingEnabled(True)
-            
-            # Verify the final table contents
-            print("\nDebug: Channel Verification:")
-            print(f"Original channel count: {len(channels)}")
-            print(f"Added channel count: {len(channel_verification)}")
-            print(f"Table row count: {self.channel_list.rowCount()}")
-            
-            print("\nDebug: Final Table Contents:")
-            for row in range(self.channel_list.rowCount()):
-                number_item = self.channel_list.item(row, 0)
-                name_item = self.channel_list.item(row, 1)
-                if number_item and name_item:
-                    number = number_item.data(Qt.DisplayRole)
-                    name = name_item.text()
-                    print(f"Row {row}: #{number} - {name}")
-                else:
-                    print(f"Row {row}: Missing items")
-            
-            self.statusbar.showMessage("Channels loaded successfully")
-            
-        except Exception as e:
-            print(f"Debug: Error in fetch_channels: {str(e)}")
-            print(f"Debug: Error type: {type(e)}")
-            import traceback
-            print(f"Debug: Traceback: {traceback.format_exc()}")
-            
-            # Show error dialog
-            dialog = ConnectionErrorDialog(
-                server['name'], 
-                f"Unexpected error: {str(e)}", 
-                self
-            )
-            if dialog.exec_() == QDialog.Accepted:
-                print("Debug: Retrying connection...")
-                self.fetch_channels()
             else:
-                print("Debug: Connection attempt aborted by user")
-                self.statusbar.showMessage("Connection aborted")
-                self.channel_list.clear()
+                TVHeadendAPI.for_server(server).channel_index = ChannelIndex(store)
+                run_in_background(self.channel_cache.save, server, store)
+            stores.append((server, store))
+        
+        if failed == len(self.servers) and not stores:
+            self.statusbar.showMessage("No server reachable")
+            return
+        lineup = ChannelLineup(stores)
+        if (self.lineup is not None and self.displayed_server_key == self.LINEUP_KEY
+                and lineup.store == self.lineup.store and lineup.sources == self.lineup.sources):
+            logger.debug("Cached lineup is up to date")
+        else:
+            self.populate_lineup(fetch_id, lineup)
+        if failed:
+            self.statusbar.showMessage(f"Channels loaded - {failed} of {len(self.servers)} "
+                                       f"servers unreachable")
+        else:
+            self.statusbar.showMessage("Channels loaded successfully")
+
+    def populate_lineup(self, fetch_id, lineup):
+        """Show the merged channels of all servers in the channel list"""
+        if fetch_id != self.channel_fetch_id:
+            logger.debug("Discarding outdated channel list")
+            return
+        self.displayed_server_key = self.LINEUP_KEY
+        self.lineup = lineup
+        logger.debug(f"Found {len(lineup.store)} channels on {len(lineup.stores)} servers")
+        self.channel_model.set_store(lineup.store)
+        self.schedule_now_next()
+
+    def download_channels(self, api, is_current, progress_callback):
+        """Download the channel grid page by page (runs on a worker thread).
+
+        Each page of grid entries is passed to progress_callback as soon as it
+        arrives. Returns a ChannelStore with all channels, or None if
+        is_current() turns false because a newer fetch has started.
+        """
+        store = ChannelStore()
+        start = 0
+        limit = self.FIRST_CHANNEL_PAGE
+        while True:
+            if not is_current():
+                return None
+            params = {'start': start, 'limit': limit, 'sort': 'number', 'dir': 'ASC'}
+            logger.debug("Making request to: %s %s", api.url('api/channel/grid'), params)
+            response = api.get('api/channel/grid', params=params)
+            response.raise_for_status()
+            data = response.json()
+            page = data.get('entries', [])
+            store.extend(page)
+            if page:
+                progress_callback(page)
+            
+            start += len(page)
+            total = data.get('total')
+            if len(page) < limit or (total is not None and start >= total):
+                break
+            limit = self.CHANNEL_PAGE_SIZE
+        return store
+
+    def on_channel_page(self, fetch_id, server, page):
+        """Stream a page of downloaded channels into the list.
+
+        Pages are only streamed when the list isn't already showing (cached)
+        channels of the same server; otherwise the complete download is
+        compared with what's shown once it has finished.
+        """
+        if fetch_id != self.channel_fetch_id:
+            return
+        if self.channel_stream_id == fetch_id:
+            self.channel_model.append(page)
+            self.schedule_now_next()
+            self.statusbar.showMessage(f"Loading channels... ({len(self.channel_model.store)})")
+        elif self.displayed_server_key != TVHeadendAPI.server_key(server):
+            self.channel_stream_id = fetch_id
+            self.populate_channels(fetch_id, server, ChannelStore(page))
+            self.statusbar.showMessage(f"Loading channels... ({len(page)})")
+
+    def on_channels_downloaded(self, fetch_id, server, store):
+        """Swap in the downloaded channel list if it differs from the one shown"""
+        if store is None or fetch_id != self.channel_fetch_id:
+            logger.debug("Discarding outdated channel list")
+            return
+        api = TVHeadendAPI.for_server(server)
+        if self.channel_stream_id == fetch_id:
+            # Already streamed into the list page by page
+            self.channel_stream_id = None
+            api.channel_index = ChannelIndex(self.channel_model.store)
+            self.statusbar.showMessage("Channels loaded successfully")
+            run_in_background(self.channel_cache.save, server, self.channel_model.store)
+            return
+        if (self.displayed_server_key == TVHeadendAPI.server_key(server)
+                and store == self.channel_model.store):
+            logger.debug("Cached channel list is up to date")
+            self.statusbar.showMessage("Channels loaded successfully")
+            return
+        api.channel_index = ChannelIndex(store)
+        self.populate_channels(fetch_id, server, store)
+        run_in_background(self.channel_cache.save, server, store)
+
+    def find_channel(self, channel_name):
+        """Look up a channel of the selected server by name, without a network round trip"""
+        if self.lineup is not None:
+            return self.lineup.index.find_by_name(channel_name)
+        return self.current_api().channel_index.find_by_name(channel_name)
+
+    def channel_source(self, channel):
+        """Return the (server config, channel uuid) a channel of the list belongs to.
+
+        In the merged lineup this is the first server carrying the channel.
+        """
+        if self.lineup is not None:
+            sources = self.lineup.sources.get(channel['uuid'])
+            if sources:
+                return sources[0]
+        return self.current_server(), channel['uuid']
+
+    def selected_channel(self):
+        """Return the channel data of the selected row, or None"""
+        index = self.channel_list.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(Qt.UserRole)
+
+    def first_channel(self):
+        """Return the channel data of the first visible row, or None"""
+        if self.channel_model.rowCount() == 0:
+            return None
+        return self.channel_model.index(0, 1).data(Qt.UserRole)
+
+    def populate_channels(self, fetch_id, server, store):
+        """Show the channels of a server in the channel list"""
+        if fetch_id != self.channel_fetch_id:
+            logger.debug("Discarding outdated channel list")
+            return
+        self.displayed_server_key = TVHeadendAPI.server_key(server)
+        self.lineup = None
+        logger.debug(f"Found {len(store)} channels")
+        self.channel_model.set_store(store)
+        self.schedule_now_next()
+        self.statusbar.showMessage("Channels loaded successfully")
+        if self.resume_channel is not None:
+            channel = ChannelIndex(store).find_by_name(self.resume_channel)
+            self.resume_channel = None
+            if channel:
+                self.play_channel_by_data(channel)
+
+    def on_fetch_channels_error(self, fetch_id, server, error):
+        """Offer to retry after a failed channel download"""
+        if fetch_id != self.channel_fetch_id:
+            return
+        logger.error(f"Error in fetch_channels: {str(error)}")
+        # Check the server now rather than at the next round of probes
+        self.prober.probe(server)
+        
+        # Keep working from the cached list rather than blocking on a dialog
+        if self.displayed_server_key == TVHeadendAPI.server_key(server):
+            self.statusbar.showMessage("Server unreachable - showing cached channel list")
+            return
+        
+        # Show error dialog
+        dialog = ConnectionErrorDialog(
+            server['name'], 
+            f"Unexpected error: {str(error)}", 
+            self
+        )
+        if dialog.exec_() == QDialog.Accepted:
+            logger.debug("Retrying connection...")
+            self.fetch_channels()
+        else:
+            logger.debug("Connection attempt aborted by user")
+            self.statusbar.showMessage("Connection aborted")
+            self.channel_model.set_store(ChannelStore())
+            self.displayed_server_key = None
+            self.lineup = None
         
 
     def start_recording(self):
-        print("Debug: Starting recording")
+        logger.debug("Starting recording")
         try:
             # Get selected channel
-            current_channel = self.channel_list.currentItem()
+            current_channel = self.selected_channel()
             if not current_channel:
-                print("Debug: No channel selected for recording")
+                logger.debug("No channel selected for recording")
                 self.statusbar.showMessage("Please select a channel to record")
                 return
 
             # Show duration dialog
             duration_dialog = RecordingDurationDialog(self)
             if duration_dialog.exec_() != QDialog.Accepted:
-                print("Debug: Recording cancelled by user")
+                logger.debug("Recording cancelled by user")
                 return
             
             duration = duration_dialog.get_duration()
-            print(f"Debug: Selected recording duration: {duration} seconds")
+            logger.debug(f"Selected recording duration: {duration} seconds")
 
-            channel_name = current_channel.text()
-            print(f"Debug: Attempting to record channel: {channel_name}")
-            
-            # Get current server
-            server = self.servers[self.server_combo.currentIndex()]
-            print(f"Debug: Using server: {server['url']}")
-            
-            # Create auth if needed
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-                print(f"Debug: Using authentication with username: {server.get('username', '')}")
-            
-            # First, get channel UUID
-            api_url = f'{server["url"]}/api/channel/grid?limit=10000'
-            print(f"Debug: Getting channel UUID from: {api_url}")
-            
-            response = requests.get(api_url, auth=auth)
-            print(f"Debug: Channel list response status: {response.status_code}")
-            
-            channels = response.json()['entries']
-            channel_uuid = None
-            for channel in channels:
-                if channel['name'] == channel_name:
-                    channel_uuid = channel['uuid']
-                    print(f"Debug: Found channel UUID: {channel_uuid}")
-                    break
-                
-            if not channel_uuid:
-                print(f"Debug: Channel UUID not found for: {channel_name}")
-                self.statusbar.showMessage("Channel not found")
-                return
-            
-            # Prepare recording request
-            now = int(datetime.now().timestamp())
-            stop_time = now + duration
-            
-            # Format exactly as in the working curl command
-            conf_data = {
-                "start": now,
-                "stop": stop_time,
-                "channel": channel_uuid,
-                "title": {"eng": "Instant Recording"},
-                "subtitle": {"eng": "Recorded via TVHplayer"}
-            }
-            
-            # Convert to string format as expected by the API
-            data = {'conf': json.dumps(conf_data)}
-            print(f"Debug: Recording data: {data}")
-            
-            # Make recording request
-            record_url = f'{server["url"]}/api/dvr/entry/create'
-            print(f"Debug: Sending recording request to: {record_url}")
-            
-            response = requests.post(record_url, data=data, auth=auth)
-            print(f"Debug: Recording response status: {response.status_code}")
-            print(f"Debug: Recording response: {response.text}")
-            
-            if response.status_code == 200:
-                duration_minutes = duration // 60
-                self.statusbar.showMessage(
-                    f"Recording started for: {channel_name} ({duration_minutes} minutes)"
-                )
-                print("Debug: Recording started successfully")
-                self.start_recording_indicator()  # Start the recording indicator
-            else:
-                self.statusbar.showMessage("Failed to start recording")
-                print(f"Debug: Recording failed with status {response.status_code}")
+            channel_name = current_channel['name']
+            logger.debug(f"Attempting to record channel: {channel_name}")
+            
+            # Get the server carrying the channel
+            server, channel_uuid = self.channel_source(current_channel)
+            api = TVHeadendAPI.for_server(server)
+            logger.debug(f"Using server: {api.base_url}")
+            self.statusbar.showMessage(f"Starting recording for: {channel_name}...")
+            
+            run_in_background(
+                self.create_instant_recording, api, channel_uuid, duration,
+                on_result=lambda ok: self.on_instant_recording_created(ok, channel_name, duration),
+                on_error=lambda e: self.statusbar.showMessage(f"Recording error: {str(e)}"))
                 
         except Exception as e:
-            print(f"Debug: Recording error: {str(e)}")
-            print(f"Debug: Error type: {type(e)}")
-            import traceback
-            print(f"Debug: Traceback: {traceback.format_exc()}")
+            logger.exception(f"Recording error: {str(e)}")
             self.statusbar.showMessage(f"Recording error: {str(e)}")
+
+    def create_instant_recording(self, api, channel_uuid, duration):
+        """Create a DVR entry starting now (runs on a worker thread).
+
+        Returns whether the server accepted the recording.
+        """
+        # Prepare recording request
+        now = int(datetime.now().timestamp())
+        stop_time = now + duration
+        
+        # Format exactly as in the working curl command
+        conf_data = {
+            "start": now,
+            "stop": stop_time,
+            "channel": channel_uuid,
+            "title": {"eng": "Instant Recording"},
+            "subtitle": {"eng": "Recorded via TVHplayer"}
+        }
+        
+        # Convert to string format as expected by the API
+        data = {'conf': json.dumps(conf_data)}
+        logger.debug(f"Recording data: {data}")
+        
+        # Make recording request
+        logger.debug(f"Sending recording request to: {api.url('api/dvr/entry/create')}")
+        
+        response = api.post('api/dvr/entry/create', data=data)
+        logger.debug(f"Recording response status: {response.status_code}")
+        logger.debug(f"Recording response: {response.text}")
+        return response.status_code == 200
+
+    def on_instant_recording_created(self, ok, channel_name, duration):
+        if ok:
+            duration_minutes = duration // 60
+            self.statusbar.showMessage(
+                f"Recording started for: {channel_name} ({duration_minutes} minutes)"
+            )
+            logger.debug("Recording started successfully")
+            self.start_recording_indicator()  # Start the recording indicator
+        else:
+            self.statusbar.showMessage("Failed to start recording")
+            logger.error("Recording failed")
             
     def stop_playback(self):
-        print("Debug: Stopping playback")
+        logger.debug("Stopping playback")
         """Stop current playback"""
-        self.media_player.stop()
+        self.zap_engine.stop()
+        self.prewarm_timer.stop()
+        self.zap_tracker.cancel()
         self.statusbar.showMessage("Playback stopped")
 
                 # Create a new fullscreen window
     def toggle_fullscreen(self):
         """Toggle fullscreen mode for VLC player"""
-        print(f"Debug: Toggling fullscreen. Current state: {self.is_fullscreen}")
+        logger.debug(f"Toggling fullscreen. Current state: {self.is_fullscreen}")
         
         try:
             if not self.is_fullscreen:
@@ -1675,15 +5299,12 @@ class TVHeadendClient(QMainWindow):
                 QApplication.processEvents()  # Process any pending events
                 self.fullscreen_window.showFullScreen()
                 self.video_frame.show()
+                self.video_frame.setFocus()
             
-                # Reset VLC window handle for fullscreen
+                # Reset VLC window handles for fullscreen
                 if sys.platform.startswith('linux'):
                     QApplication.processEvents()  # Give X11 time to update
-                    self.media_player.set_xwindow(self.video_frame.winId().__int__())
-                elif sys.platform == "win32":
-                    self.media_player.set_hwnd(self.video_frame.winId().__int__())
-                elif sys.platform == "darwin":
-                    self.media_player.set_nsobject(self.video_frame.winId().__int__())
+                self.zap_engine.attach_outputs()
             else:
                 # Remove from fullscreen layout
                 if self.fullscreen_window and self.fullscreen_window.layout():
@@ -1698,27 +5319,22 @@ class TVHeadendClient(QMainWindow):
                     QApplication.processEvents()  # Process any pending events
                     self.video_frame.show()
                     
-                    # Reset VLC window handle for normal view
+                    # Reset VLC window handles for normal view
                     if sys.platform.startswith('linux'):
                         QApplication.processEvents()  # Give X11 time to update
-                        self.media_player.set_xwindow(self.video_frame.winId().__int__())
-                    elif sys.platform == "win32":
-                        self.media_player.set_hwnd(self.video_frame.winId().__int__())
-                    elif sys.platform == "darwin":
-                        self.media_player.set_nsobject(self.video_frame.winId().__int__())
+                    self.zap_engine.attach_outputs()
                     
                     # Close fullscreen window
                     self.fullscreen_window.close()
                     self.fullscreen_window = None
                 else:
-                    print("Debug: Could not find right_layout")
+                    logger.warning("Could not find right_layout")
             
             self.is_fullscreen = not self.is_fullscreen
-            print(f"Debug: New fullscreen state: {self.is_fullscreen}")
+            logger.debug(f"New fullscreen state: {self.is_fullscreen}")
             
         except Exception as e:
-            print(f"Debug: Error in toggle_fullscreen: {str(e)}")
-            print(f"Debug: Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error in toggle_fullscreen: {str(e)}")
 
     def load_servers(self):
         """Load TVHeadend server configurations"""
@@ -1736,20 +5352,21 @@ class TVHeadendClient(QMainWindow):
             }]
 
     def manage_servers(self):
-        print("Debug: Opening server management dialog")
-        dialog = ServerDialog(self)
+        logger.debug("Opening server management dialog")
+        dialog = ServerDialog(self, self.prober)
         dialog.load_servers(self.servers)
-        print(f"Debug: Loaded {len(self.servers)} servers into dialog")
+        logger.debug(f"Loaded {len(self.servers)} servers into dialog")
         if dialog.exec_() == QDialog.Accepted:
             self.servers = dialog.servers
-            print(f"Debug: Updated servers list, now has {len(self.servers)} servers")
+            logger.debug(f"Updated servers list, now has {len(self.servers)} servers")
+            self.prober.set_servers(self.servers)
+            TVHeadendAPI.release_unused(self.servers)
+            self.release_epg_stores()
             self.save_config()
             
             # Update server combo
             self.server_combo.clear()
-            for server in self.servers:
-                print(f"Debug: Adding server to combo: {server['name']}")
-                self.server_combo.addItem(server['name'])
+            self.fill_server_combo()
             
             # Refresh channels
             self.fetch_channels()
@@ -1775,33 +5392,26 @@ class TVHeadendClient(QMainWindow):
             # Save to file
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
-            print("Debug: Configuration saved successfully")
+            logger.debug("Configuration saved successfully")
         except Exception as e:
-            print(f"Debug: Error saving config: {str(e)}")
+            logger.error(f"Error saving config: {str(e)}")
 
     def play_channel(self, item):
         """Play the selected channel"""
         try:
             # Get the current row
-            current_row = self.channel_list.currentRow()
-            if current_row < 0:
-                print("Debug: No channel selected")
+            if not self.channel_list.currentIndex().isValid():
+                logger.debug("No channel selected")
                 self.statusbar.showMessage("Please select a channel to play")
                 return
             
-            # Get channel data directly from the table
-            name_item = self.channel_list.item(current_row, 1)  # Get the name column item
-            if not name_item:
-                print("Debug: No channel item found")
-                return
-            
             # Get the channel data stored in UserRole
-            channel_data = name_item.data(Qt.UserRole)
+            channel_data = self.selected_channel()
             if not channel_data:
-                print("Debug: No channel data found in item")
+                logger.debug("No channel data found in item")
                 return
             
-            print(f"Debug: Playing channel: {channel_data.get('name', 'Unknown')}")
+            logger.debug(f"Playing channel: {channel_data.get('name', 'Unknown')}")
             
             # Get current server
             server = self.servers[self.server_combo.currentIndex()]
@@ -1812,12 +5422,11 @@ class TVHeadendClient(QMainWindow):
                 base_url = f"http://{base_url}"
             
             url = f"{base_url}/stream/channel/{channel_data['uuid']}"
-            print(f"Debug: Playing URL: {url}")
+            logger.debug(f"Playing URL: {url}")
             
             # Rest of the play logic...
         except Exception as e:
-            print(f"Debug: Error in play_channel: {str(e)}")
-            print(f"Debug: Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error in play_channel: {str(e)}")
 
     def on_server_changed(self, index):
         """
@@ -1827,9 +5436,9 @@ class TVHeadendClient(QMainWindow):
         Args:
             index (int): Index of the newly selected server in self.servers list
         """
-        print(f"Debug: Server changed to index {index}")
+        logger.debug(f"Server changed to index {index}")
         if index >= 0:  # Valid index selected
-            print(f"Debug: Switching to server: {self.servers[index]['name']}")
+            logger.debug(f"Switching to server: {self.server_combo.itemText(index)}")
             
             # Update config with new server selection
             self.config['last_server'] = index
@@ -1838,15 +5447,15 @@ class TVHeadendClient(QMainWindow):
             try:
                 with open(self.config_file, 'w') as f:
                     json.dump(self.config, f)
-                print(f"Debug: Saved server index {index} to config")
+                logger.debug(f"Saved server index {index} to config")
             except Exception as e:
-                print(f"Debug: Error saving config: {e}")
+                logger.error(f"Error saving config: {e}")
                 
             # Load channels from newly selected server
             self.fetch_channels()
 
     def on_volume_changed(self, value):
-        print(f"Debug: Volume changed to {value}")
+        logger.debug(f"Volume changed to {value}")
         self.media_player.audio_set_volume(value)
 
     def eventFilter(self, obj, event):
@@ -1869,22 +5478,22 @@ class TVHeadendClient(QMainWindow):
 
     def toggle_mute(self):
         """Toggle audio mute state"""
-        print("Debug: Toggling mute")
+        logger.debug("Toggling mute")
         is_muted = self.media_player.audio_get_mute()
         self.media_player.audio_set_mute(not is_muted)
         
         if not is_muted:  # Switching to muted
-            self.mute_btn.setIcon(QIcon(f"{self.icons_dir}/mute.svg"))
+            self.mute_btn.setIcon(self.get_icon('mute.svg', QSize(32, 32)))
             self.mute_btn.setToolTip("Unmute")
-            print("Debug: Audio muted")
+            logger.debug("Audio muted")
         else:  # Switching to unmuted
-            self.mute_btn.setIcon(QIcon(f"{self.icons_dir}/unmute.svg"))
+            self.mute_btn.setIcon(self.get_icon('unmute.svg', QSize(32, 32)))
             self.mute_btn.setToolTip("Mute")
-            print("Debug: Audio unmuted")
+            logger.debug("Audio unmuted")
 
     def show_about(self):
         """Show the about dialog"""
-        print("Debug: Showing about dialog")
+        logger.debug("Showing about dialog")
         about_text = (
             "<div style='text-align: center;'>"
             "<h2>TVHplayer</h2>"
@@ -1920,7 +5529,7 @@ class TVHeadendClient(QMainWindow):
 
     def show_user_guide(self):
         """Open the user guide documentation"""
-        print("Debug: Opening user guide")
+        logger.debug("Opening user guide")
         try:
             # Open the GitHub wiki URL in the default web browser
             url = "https://github.com/mfat/tvhplayer/wiki/User-Guide"
@@ -1937,10 +5546,10 @@ class TVHeadendClient(QMainWindow):
                 import webbrowser
                 webbrowser.open(url)
                 
-            print(f"Opened user guide URL: {url}")
+            logger.info(f"Opened user guide URL: {url}")
             
         except Exception as e:
-            print(f"Error opening user guide URL: {str(e)}")
+            logger.error(f"Error opening user guide URL: {str(e)}")
             QMessageBox.critical(
                 self, 
                 "Error",
@@ -1957,70 +5566,57 @@ class TVHeadendClient(QMainWindow):
 
     def stop_recording(self):
         """Stop active recordings"""
-        print("Debug: Attempting to stop recordings")
-        try:
-            # Get current server
-            server = self.servers[self.server_combo.currentIndex()]
-            print(f"Debug: Using server: {server['url']}")
-            
-            # Create auth if needed
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-                print(f"Debug: Using authentication with username: {server.get('username', '')}")
-            
-            # Get list of active recordings
-            api_url = f'{server["url"]}/api/dvr/entry/grid'
-            print(f"Debug: Getting recordings from: {api_url}")
-            
-            response = requests.get(api_url, auth=auth)
-            print(f"Debug: Recording list response status: {response.status_code}")
-            
-            recordings = response.json()['entries']
-            print(f"Debug: Total recordings found: {len(recordings)}")
-            
-            # Print all recordings and their statuses for debugging
-            for recording in recordings:
-                print(f"Debug: Recording '{recording.get('disp_title', 'Unknown')}' - Status: {recording.get('status', 'unknown')}")
-            
-            # Look for recordings with status 'Running' (this seems to be the actual status used by TVHeadend)
-            active_recordings = [r for r in recordings if r['status'] in ['Running', 'recording']]
-            if not active_recordings:
-                print("Debug: No active recordings found")
-                self.statusbar.showMessage("No active recordings to stop")
-                self.stop_recording_indicator()  # Make sure to hide indicator
-                return
-                
-            print(f"Debug: Found {len(active_recordings)} active recordings")
-            
-            # Stop each active recording
-            for recording in active_recordings:
-                stop_url = f'{server["url"]}/api/dvr/entry/stop'
-                data = {'uuid': recording['uuid']}
-                
-                print(f"Debug: Stopping recording: {recording.get('disp_title', 'Unknown')} ({recording['uuid']})")
-                stop_response = requests.post(stop_url, data=data, auth=auth)
-                
-                if stop_response.status_code == 200:
-                    print(f"Debug: Successfully stopped recording: {recording['uuid']}")
-                else:
-                    print(f"Debug: Failed to stop recording: {recording['uuid']}")
-                    print(f"Debug: Response: {stop_response.text}")
-            
-            self.stop_recording_indicator()  # Hide the indicator after stopping recordings
-            self.statusbar.showMessage(f"Stopped {len(active_recordings)} recording(s)")
-            
-        except Exception as e:
-            print(f"Debug: Error stopping recordings: {str(e)}")
-            print(f"Debug: Error type: {type(e)}")
-            import traceback
-            print(f"Debug: Traceback: {traceback.format_exc()}")
-            self.statusbar.showMessage(f"Error stopping recordings: {str(e)}")
-            self.stop_recording_indicator()  # Make sure to hide indicator even on error
+        logger.debug("Attempting to stop recordings")
+        # Get current server
+        api = self.current_api()
+        logger.debug(f"Using server: {api.base_url}")
+        self.statusbar.showMessage("Stopping recordings...")
+        run_in_background(
+            self.stop_active_recordings, api,
+            on_result=self.on_recordings_stopped,
+            on_error=self.on_stop_recording_error)
+
+    def stop_active_recordings(self, api):
+        """Stop every running DVR entry (runs on a worker thread).
+
+        Returns the number of recordings that were asked to stop.
+        """
+        # Running entries are among the upcoming ones, so the finished and
+        # failed entries are not downloaded
+        logger.debug(f"Getting recordings from: {api.url('api/dvr/entry/grid_upcoming')}")
+        response = api.get('api/dvr/entry/grid_upcoming', params={'limit': 999999})
+        logger.debug(f"Recording list response status: {response.status_code}")
+        response.raise_for_status()
+        
+        recordings = response.json().get('entries', [])
+        active_recordings = [r['uuid'] for r in recordings if DVRTableModel.is_recording(r)]
+        if not active_recordings:
+            logger.debug("No active recordings found")
+            return 0
+            
+        logger.debug(f"Stopping {len(active_recordings)} active recordings")
+        failed = api.dvr_action('stop', active_recordings)
+        if failed:
+            logger.error(f"Failed to stop recordings: {', '.join(failed)}")
+            if len(failed) == len(active_recordings):
+                raise RuntimeError("the server did not stop any recording")
+        return len(active_recordings) - len(failed)
+
+    def on_recordings_stopped(self, count):
+        self.stop_recording_indicator()  # Hide the indicator after stopping recordings
+        if count:
+            self.statusbar.showMessage(f"Stopped {count} recording(s)")
+        else:
+            self.statusbar.showMessage("No active recordings to stop")
+
+    def on_stop_recording_error(self, error):
+        logger.error(f"Error stopping recordings: {str(error)}")
+        self.statusbar.showMessage(f"Error stopping recordings: {str(error)}")
+        self.stop_recording_indicator()  # Make sure to hide indicator even on error
 
     def start_recording_indicator(self):
         """Start the recording indicator with smooth pulsing animation"""
-        print("Debug: Starting recording indicator")
+        logger.debug("Starting recording indicator")
         self.is_recording = True
         self.recording_indicator.setProperty("recording", True)
         self.recording_indicator.style().polish(self.recording_indicator)
@@ -2042,7 +5638,7 @@ class TVHeadendClient(QMainWindow):
 
     def stop_recording_indicator(self):
         """Stop the recording indicator and its animation"""
-        print("Debug: Stopping recording indicator")
+        logger.debug("Stopping recording indicator")
         self.is_recording = False
         if self.recording_animation:
             self.recording_animation.stop()
@@ -2055,64 +5651,33 @@ class TVHeadendClient(QMainWindow):
 
     def show_dvr_status(self):
         """Show DVR status dialog"""
+        logger.debug("Opening DVR Status Dialog")
         try:
-            print("\nDebug: Opening DVR Status Dialog")
-            server = self.servers[self.server_combo.currentIndex()]
-            print(f"Debug: Using server: {server}")
-
-            # Test connection first
-            test_url = f"{server['url']}/api/status/connections"
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-                print(f"Debug: Using authentication with username: {server.get('username', '')}")
-
-            print(f"Debug: Testing connection to: {test_url}")
-            try:
-                test_response = requests.get(test_url, auth=auth, timeout=5)
-                print(f"Debug: Connection test response: {test_response.status_code}")
-                if test_response.status_code == 200:
-                    print("Debug: Server connection successful")
-                else:
-                    print(f"Debug: Server connection failed with status {test_response.status_code}")
-                    self.statusbar.showMessage("Failed to connect to server")
-                    return
-            except Exception as conn_err:
-                print(f"Debug: Connection test failed: {str(conn_err)}")
-                self.statusbar.showMessage("Failed to connect to server")
-                return
-
-            # Now try to get DVR data
-            dvr_url = f"{server['url']}/api/dvr/entry/grid"
-            print(f"Debug: Fetching DVR data from: {dvr_url}")
-            try:
-                dvr_response = requests.get(dvr_url, auth=auth, timeout=5)
-                print(f"Debug: DVR data response: {dvr_response.status_code}")
-                if dvr_response.status_code == 200:
-                    dvr_data = dvr_response.json()
-                    print(f"Debug: DVR data received: {len(dvr_data.get('entries', []))} entries")
-                    # Print first entry as sample if available
-                    if dvr_data.get('entries'):
-                        print("Debug: Sample DVR entry:")
-                        print(dvr_data['entries'][0])
-                else:
-                    print(f"Debug: Failed to get DVR data: {dvr_response.text}")
-                    self.statusbar.showMessage("Failed to get DVR data")
-                    return
-            except Exception as dvr_err:
-                print(f"Debug: DVR data fetch failed: {str(dvr_err)}")
-                self.statusbar.showMessage("Failed to get DVR data")
-                return
-
-            # If we got here, show the dialog
-            dialog = DVRStatusDialog(server, self)
+            dialog = DVRStatusDialog(self.current_server(), self)
             dialog.show()
-            
         except Exception as e:
-            print(f"Debug: Error showing DVR status: {str(e)}")
-            print(f"Debug: Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error showing DVR status: {str(e)}")
             self.statusbar.showMessage("Error showing DVR status")
 
+    def show_dvr_dashboard(self):
+        """Show the recordings of all servers in one table"""
+        if not self.servers:
+            self.statusbar.showMessage("No servers configured")
+            return
+        dialog = DVRDashboardDialog(self.servers, self)
+        dialog.show()
+
+    def show_zap_stats(self):
+        """Show how long channel switches took to show their first frame"""
+        dialog = ZapStatsDialog(self.zap_tracker, self)
+        dialog.show()
+
+    def on_zap_finished(self, zap, ms):
+        """Report the time to first frame of the channel just played"""
+        if ms is not None:
+            self.statusbar.showMessage(f"Playing: {zap['channel']} (first frame after {ms / 1000:.1f} s)")
+            self.prewarm_timer.start()
+
     def play_url(self, url):
         """Play media from URL"""
         try:
@@ -2126,11 +5691,12 @@ class TVHeadendClient(QMainWindow):
         """Record channel stream to local disk using ffmpeg"""
         try:
             if not channel_name:
-                print("Debug: No channel selected for recording")
+                logger.debug("No channel selected for recording")
                 self.statusbar.showMessage("Please select a channel to record")
                 return
 
-            print(f"Debug: Starting local recording for channel: {channel_name}")
+            logger.debug(f"Starting local recording for channel: {channel_name}")
+            self.recording_channel_name = channel_name
             
             # Show file save dialog
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2144,39 +5710,23 @@ class TVHeadendClient(QMainWindow):
             )
             
             if not file_path:  # User cancelled
-                print("Debug: Recording cancelled - no file selected")
+                logger.debug("Recording cancelled - no file selected")
                 return
                 
-            # Get current server and auth info
-            server = self.servers[self.server_combo.currentIndex()]
-            
             # Get channel UUID
-            api_url = f'{server["url"]}/api/channel/grid?limit=10000'
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-            
-            print(f"Debug: Fetching channel list from: {api_url}")
-            response = requests.get(api_url, auth=auth)
-            channels = response.json()['entries']
-            
-            channel_uuid = None
-            for channel in channels:
-                if channel['name'] == channel_name:
-                    channel_uuid = channel['uuid']
-                    break
-                    
-            if not channel_uuid:
-                print(f"Debug: Channel UUID not found for: {channel_name}")
+            channel = self.find_channel(channel_name)
+            if not channel:
+                logger.error(f"Channel UUID not found for: {channel_name}")
                 self.statusbar.showMessage("Channel not found")
                 return
+            
+            # Get the server carrying the channel and its auth info
+            server, channel_uuid = self.channel_source(channel)
+            api = TVHeadendAPI.for_server(server)
+            auth = api.auth
                 
             # Create stream URL
-            server_url = server['url'].rstrip('/')
-            if not server_url.startswith(('http://', 'https://')):
-                server_url = f'http://{server_url}'
-            
-            stream_url = f'{server_url}/stream/channel/{channel_uuid}'
+            stream_url = api.stream_url(channel_uuid)
             
             # Build ffmpeg command
             ffmpeg_cmd = [
@@ -2223,12 +5773,12 @@ class TVHeadendClient(QMainWindow):
             # Add output file
             ffmpeg_cmd.append(file_path)
             
-            print("Debug: Starting ffmpeg with command:")
+            logger.debug("Starting ffmpeg with command:")
             # Print command with hidden auth if present
             safe_cmd = ' '.join(ffmpeg_cmd)
             if auth:
                 safe_cmd = safe_cmd.replace(base64_auth, "***")
-            print(f"Debug: {safe_cmd}")
+            logger.debug(safe_cmd)
             
             # Start ffmpeg process
             self.ffmpeg_process = subprocess.Popen(
@@ -2253,10 +5803,7 @@ class TVHeadendClient(QMainWindow):
             self.recording_status_dialog.show()
             
         except Exception as e:
-            print(f"Debug: Local recording error: {str(e)}")
-            print(f"Debug: Error type: {type(e)}")
-            import traceback
-            print(f"Debug: Traceback: {traceback.format_exc()}")
+            logger.exception(f"Local recording error: {str(e)}")
             self.statusbar.showMessage(f"Local recording error: {str(e)}")
 
     def check_recording_status(self, file_path):
@@ -2271,7 +5818,7 @@ class TVHeadendClient(QMainWindow):
             elapsed_time = time.time() - self.recording_start_time
             
             if not os.path.exists(file_path):
-                print("Debug: Recording file does not exist")
+                logger.debug("Recording file does not exist")
                 # Only show warning if more than 10 seconds have passed
                 if elapsed_time > 10:
                     if hasattr(self, 'recording_status_dialog'):
@@ -2279,11 +5826,11 @@ class TVHeadendClient(QMainWindow):
                     QMessageBox.warning(self, "Local Recording Status", "Recording file does not exist")
                     return
                 else:
-                    print(f"Debug: Waiting for file creation ({int(elapsed_time)} seconds elapsed)")
+                    logger.debug(f"Waiting for file creation ({int(elapsed_time)} seconds elapsed)")
                     return
             
             file_size = os.path.getsize(file_path)
-            print(f"Debug: Current recording file size: {file_size} bytes")
+            logger.debug(f"Current recording file size: {file_size} bytes")
             
             # Update status dialog if it exists
             if hasattr(self, 'recording_status_dialog'):
@@ -2297,12 +5844,12 @@ class TVHeadendClient(QMainWindow):
                 if return_code is not None:
                     # Process has ended
                     _, stderr = self.ffmpeg_process.communicate()
-                    print(f"Debug: FFmpeg process ended with return code: {return_code}")
+                    logger.debug(f"FFmpeg process ended with return code: {return_code}")
                     if stderr:
-                        print(f"Debug: FFmpeg error output: {stderr.decode()}")
+                        logger.error(f"FFmpeg error output: {stderr.decode()}")
                     
                     if file_size == 0 or return_code != 0:
-                        print("Debug: Recording failed - stopping processes")
+                        logger.error("Recording failed - stopping processes")
                         self.stop_local_recording()
                         error_msg = "Recording failed - check console for errors"
                         QMessageBox.critical(self, "Recording Error", error_msg)
@@ -2311,14 +5858,14 @@ class TVHeadendClient(QMainWindow):
                 # Check if file is growing
                 if hasattr(self, 'last_file_size'):
                     if file_size == self.last_file_size:
-                        print("Debug: File size not increasing - potential stall")
+                        logger.debug("File size not increasing - potential stall")
                         self.stall_count = getattr(self, 'stall_count', 0) + 1
                         if self.stall_count > 5:  # After 10 seconds of no growth
-                            print("Debug: Recording stalled - restarting")
+                            logger.debug("Recording stalled - restarting")
                             stall_msg = "Recording stalled - attempting restart"
                             QMessageBox.warning(self, "Recording Status", stall_msg)
                             self.stop_local_recording()
-                            self.start_local_recording(self.channel_list.currentItem().text())
+                            self.start_local_recording(self.recording_channel_name)
                             return
                     else:
                         self.stall_count = 0
@@ -2327,7 +5874,7 @@ class TVHeadendClient(QMainWindow):
             
         except Exception as e:
             error_msg = f"Debug: Error checking recording status: {str(e)}"
-            print(error_msg)
+            logger.error(error_msg)
             QMessageBox.critical(self, "Recording Error", error_msg)
 
     def stop_local_recording(self):
@@ -2338,7 +5885,7 @@ class TVHeadendClient(QMainWindow):
                 self.recording_status_dialog.close()
                 delattr(self, 'recording_status_dialog')
             
-            print("Debug: Stopping local recording")
+            logger.debug("Stopping local recording")
             
             # Stop monitoring
             if hasattr(self, 'recording_monitor') and self.recording_monitor is not None:
@@ -2347,7 +5894,7 @@ class TVHeadendClient(QMainWindow):
             
             # Stop ffmpeg process
             if hasattr(self, 'ffmpeg_process') and self.ffmpeg_process is not None:
-                print("Debug: Stopping ffmpeg process")
+                logger.debug("Stopping ffmpeg process")
                 self.ffmpeg_process.terminate()
                 try:
                     self.ffmpeg_process.wait(timeout=5)
@@ -2365,7 +5912,7 @@ class TVHeadendClient(QMainWindow):
             self.stop_recording_indicator()
             
         except Exception as e:
-            print(f"Debug: Error stopping local recording: {str(e)}")
+            logger.error(f"Error stopping local recording: {str(e)}")
             self.statusbar.showMessage(f"Error stopping local recording: {str(e)}")
             self.stop_recording_indicator()
 
@@ -2389,7 +5936,7 @@ class TVHeadendClient(QMainWindow):
                     },
                 }
         except Exception as e:
-            print(f"Debug: Error loading config: {str(e)}")
+            logger.error(f"Error loading config: {str(e)}")
             return self.get_default_config()
 
     def get_default_config(self):
@@ -2409,6 +5956,11 @@ class TVHeadendClient(QMainWindow):
     def closeEvent(self, event):
         """Save configuration when closing the application"""
         self.save_config()
+        self.prober.stop()
+        self.zap_tracker.save()
+        self.zap_engine.stop()
+        for store in self.epg_stores.values():
+            store.stop()
         super().closeEvent(event)
 
     def show_channel_context_menu(self, position):
@@ -2416,162 +5968,316 @@ class TVHeadendClient(QMainWindow):
         menu = QMenu()
         
         # Get the item at the position
-        row = self.channel_list.rowAt(position.y())
-        if row >= 0:
-            channel_item = self.channel_list.item(row, 1)  # Get name column item
-            channel_data = channel_item.data(Qt.UserRole)
+        index = self.channel_list.indexAt(position)
+        if index.isValid():
+            channel_data = index.data(Qt.UserRole)
             
             # Add menu actions
             play_action = menu.addAction("Play")
             play_action.triggered.connect(lambda: self.play_channel_by_data(channel_data))
             record_action = menu.addAction("Record")
-            record_action.triggered.connect(lambda: self.start_recording())
-            local_record_action = menu.addAction("Record Locally")
-            local_record_action.triggered.connect(
-                lambda: self.start_local_recording(channel_data['name']))
-            
-            # Add EPG action
-            epg_action = menu.addAction("Show EPG")
-            epg_action.triggered.connect(lambda: self.show_channel_epg(channel_data['name']))
-            
-            # Show the menu at the cursor position
-            menu.exec_(self.channel_list.viewport().mapToGlobal(position))
-
-    def show_channel_epg(self, channel_name):
-        """Fetch and show EPG data for the selected channel"""
-        try:
-            print(f"Debug: Fetching EPG for channel: {channel_name}")
-            
-            # Get current server
-            server = self.servers[self.server_combo.currentIndex()]
-            print(f"Debug: Using server: {server['url']}")
-            
-            # Create auth if needed
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-                print(f"Debug: Using authentication with username: {server.get('username', '')}")
-            
-            # First get channel UUID
-            api_url = f'{server["url"]}/api/channel/grid?limit=10000'
-            print(f"Debug: Getting channel UUID from: {api_url}")
-            
-            response = requests.get(api_url, auth=auth)
-            print(f"Debug: Channel list response status: {response.status_code}")
-            
-            channels = response.json()['entries']
-            print(f"Debug: Found {len(channels)} channels in response")
-            
-            channel_uuid = None
-            for channel in channels:
-                if channel['name'] == channel_name:
-                    channel_uuid = channel['uuid']
-                    print(f"Debug: Found channel UUID: {channel_uuid}")
-                    break
-            
-            if not channel_uuid:
-                print(f"Debug: Channel UUID not found for: {channel_name}")
-                self.statusbar.showMessage("Channel not found")
-                return
-            
-            # Get EPG data for the channel
-            epg_url = f'{server["url"]}/api/epg/events/grid'
-            params = {
-                'channel': channel_uuid,
-                'limit': 24  # Get next 24 events
-            }
-            print(f"Debug: Fetching EPG data from: {epg_url}")
-            print(f"Debug: With parameters: {params}")
+            record_action.triggered.connect(lambda: self.start_recording())
+            local_record_action = menu.addAction("Record Locally")
+            local_record_action.triggered.connect(
+                lambda: self.start_local_recording(channel_data['name']))
             
-            response = requests.get(epg_url, params=params, auth=auth)
-            print(f"Debug: EPG response status: {response.status_code}")
+            # Add EPG action
+            epg_action = menu.addAction("Show EPG")
+            epg_action.triggered.connect(lambda: self.show_channel_epg(channel_data['name']))
             
-            if response.status_code == 200:
-                epg_data = response.json()['entries']
-                if epg_data:
-                    dialog = EPGDialog(channel_name, epg_data, server, self)
-                    dialog.show()
-                else:
-                    self.statusbar.showMessage("No EPG data available")
-            else:
-                self.statusbar.showMessage("Failed to fetch EPG data")
-                
-        except Exception as e:
-            print(f"Debug: Error fetching EPG: {str(e)}")
-            self.statusbar.showMessage(f"Error fetching EPG: {str(e)}")
+            # Show the menu at the cursor position
+            menu.exec_(self.channel_list.viewport().mapToGlobal(position))
+
+    def show_channel_epg(self, channel_name):
+        """Fetch and show EPG data for the selected channel"""
+        logger.debug(f"Fetching EPG for channel: {channel_name}")
+        
+        channel = self.find_channel(channel_name)
+        if not channel:
+            logger.error(f"Channel UUID not found for: {channel_name}")
+            self.statusbar.showMessage("Channel not found")
+            return
+        
+        # Get the server carrying the channel
+        server, channel_uuid = self.channel_source(channel)
+        logger.debug(f"Using server: {TVHeadendAPI.for_server(server).base_url}")
+        
+        # Browse the local EPG database once the guide has been downloaded
+        epg_store = self.epg_store(server)
+        if (epg_store is not None and epg_store.refreshed
+                and not epg_store.channel_events(channel_uuid, limit=1)):
+            self.statusbar.showMessage("No EPG data available")
+            return
+        
+        dialog = EPGDialog(channel_name, channel_uuid, server, epg_store, self)
+        dialog.show()
 
-    def play_channel_from_table(self, item):
+    def play_channel_from_table(self, index):
         """Play channel from table selection"""
-        row = item.row()
-        channel_item = self.channel_list.item(row, 1)  # Get name column item
-        channel_data = channel_item.data(Qt.UserRole)  # Original data is stored here
+        channel_data = index.data(Qt.UserRole)  # Original data is built from the model row
         self.play_channel_by_data(channel_data)
 
     def play_channel_by_data(self, channel_data):
         """Play channel using channel data"""
+        if not channel_data:
+            self.statusbar.showMessage("Please select a channel to play")
+            return
+        self.resume_channel = None
+        self.play_id += 1
+        play_id = self.play_id
+        self.zap_tracker.start(channel_data['name'])
+        sources = self.lineup.sources.get(channel_data['uuid'], []) if self.lineup is not None else []
+        prewarmed = [source for source in sources if self.zap_engine.has(*source)]
+        if prewarmed:
+            # A player is already open on the channel; switch to it
+            sources = prewarmed[:1]
+        if len(sources) > 1:
+            # Several servers carry the channel; play it from the best one
+            self.statusbar.showMessage(f"Finding a server for: {channel_data['name']}...")
+            run_in_background(
+                self.choose_source, sources,
+                on_result=lambda source: self.play_from_source(play_id, channel_data, *source),
+                on_error=lambda e: self.statusbar.showMessage(f"Playback error: {str(e)}"))
+            return
+        self.play_from_source(play_id, channel_data, *self.channel_source(channel_data))
+
+    def record_zap(self, channel_data):
+        """Remember the channel switched from and how far the list was moved"""
+        if self.playing is None or self.playing[1]['uuid'] == channel_data['uuid']:
+            return
+        self.previous_channel = self.playing[1]
+        old_row = self.channel_model.find_row(self.previous_channel['uuid'])
+        row = self.channel_model.find_row(channel_data['uuid'])
+        self.zap_step = row - old_row if row >= 0 and old_row >= 0 else None
+
+    def play_adjacent_channel(self, step):
+        """Play the channel step rows away from the one playing in the channel list"""
+        rows = self.channel_model.rowCount()
+        if not rows:
+            return
+        row = self.channel_model.find_row(self.playing[1]['uuid']) if self.playing is not None else -1
+        if row < 0:
+            row = self.channel_list.currentIndex().row()
+        row = (row + step) % rows if row >= 0 else 0
+        index = self.channel_model.index(row, 1)
+        self.channel_list.setCurrentIndex(index)
+        self.play_channel_by_data(index.data(Qt.UserRole))
+
+    def play_previous_channel(self):
+        """Switch back to the channel played before the current one"""
+        if self.previous_channel is None:
+            return
+        row = self.channel_model.find_row(self.previous_channel['uuid'])
+        if row >= 0:
+            self.channel_list.setCurrentIndex(self.channel_model.index(row, 1))
+        self.play_channel_by_data(self.previous_channel)
+
+    def zap_candidates(self):
+        """Return the channels most likely played next, most likely first.
+
+        After stepping through the channel list the next channel in the
+        same direction comes first, otherwise the previous channel.
+        """
+        if self.playing is None:
+            return []
+        model = self.channel_model
+        rows = model.rowCount()
+        row = model.find_row(self.playing[1]['uuid'])
+        adjacent = []
+        if row >= 0 and rows > 1:
+            step = -1 if self.zap_step == -1 else 1
+            adjacent = [model.index((row + step) % rows, 1).data(Qt.UserRole),
+                        model.index((row - step) % rows, 1).data(Qt.UserRole)]
+        previous = [self.previous_channel] if self.previous_channel is not None else []
+        if self.zap_step in (-1, 1):
+            return adjacent[:1] + previous + adjacent[1:]
+        return previous + adjacent
+
+    def prewarm_channels(self):
+        """Open standby players on the channels likely played next"""
+        candidates = []
+        for channel in self.zap_candidates():
+            server, channel_uuid = self.channel_source(channel)
+            if self.prober.is_down(server):
+                continue
+            stream_url = TVHeadendAPI.for_server(server).stream_url(channel_uuid, with_credentials=True)
+            candidates.append((server, channel_uuid, stream_url))
+        self.zap_engine.prewarm(candidates)
+
+    def on_server_state_changed(self, server, state):
+        """Move playback and the channel list off a server that went down"""
+        if state != 'down':
+            return
+        key = TVHeadendAPI.server_key(server)
+        self.zap_engine.release_server(key)
+        source = None
+        if self.playing is not None and TVHeadendAPI.server_key(self.playing[0]) == key:
+            channel_data = self.playing[1]
+            source = self.failover_source(channel_data, key)
+            if source is None:
+                self.statusbar.showMessage(f"{server['name']} is down - no other server "
+                                           f"carries {channel_data['name']}")
+            else:
+                logger.info(f"Failing over {channel_data['name']} from {server['name']} "
+                            f"to {source[0]['name']}")
+                self.play_id += 1
+                self.zap_tracker.start(channel_data['name'])
+                self.play_from_source(self.play_id, channel_data, *source)
+        
+        # The merged lineup moves to a healthy server by itself through current_server()
+        if self.is_lineup() or TVHeadendAPI.server_key(self.current_server()) != key:
+            return
+        if source is not None:
+            target = source[0]
+        else:
+            target = next((s for s in self.servers if self.prober.is_healthy(s)), None)
+        if target is None:
+            self.statusbar.showMessage(f"{server['name']} is down - no other server available")
+            return
+        if self.playing is not None and source is None:
+            # Channels of the target aren't known yet; look for it once they are
+            self.resume_channel = self.playing[1]['name']
+        logger.info(f"Switching from {server['name']} to {target['name']}")
+        self.server_combo.setCurrentIndex(self.servers.index(target))
+        self.statusbar.showMessage(f"{server['name']} is down - switched to {target['name']}")
+
+    def failover_source(self, channel_data, exclude_key):
+        """Return a (server config, channel uuid) on a healthy server carrying a channel, or None"""
+        if self.lineup is not None:
+            candidates = self.lineup.sources.get(channel_data['uuid'], [])
+        else:
+            candidates = []
+            for server in self.servers:
+                api = TVHeadendAPI.for_server(server)
+                if not len(api.channel_index):
+                    cached = self.channel_cache.load(server)
+                    if cached:
+                        api.channel_index = ChannelIndex(cached)
+                channel = api.channel_index.find_by_name(channel_data['name'])
+                if channel:
+                    candidates.append((server, channel['uuid']))
+        for server, channel_uuid in candidates:
+            if TVHeadendAPI.server_key(server) != exclude_key and self.prober.is_healthy(server):
+                return server, channel_uuid
+        return None
+
+    def choose_source(self, sources):
+        """Return the (server config, channel uuid) to play a channel from (runs on a worker thread).
+
+        All servers are asked for their input status at once. Servers with
+        an idle tuner input are preferred, then the one with the lowest
+        average round trip; servers that don't answer are skipped.
+        """
+        def probe(source):
+            api = TVHeadendAPI.for_server(source[0])
+            try:
+                _, idle = api.input_status()
+            except (requests.RequestException, ValueError) as e:
+                logger.debug(f"{api.base_url} unavailable for playback: {str(e)}")
+                return None
+            return idle == 0, api.latency
+        
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            ranks = list(executor.map(probe, sources))
+        candidates = [(rank, i) for i, rank in enumerate(ranks) if rank is not None]
+        if not candidates:
+            raise RuntimeError("No server carrying this channel is reachable")
+        return sources[min(candidates)[1]]
+
+    def play_from_source(self, play_id, channel_data, server, channel_uuid):
+        """Play a channel from one of the servers carrying it"""
+        if play_id != self.play_id:
+            return
         try:
-            server = self.servers[self.server_combo.currentIndex()]
-            server_url = server['url']
-            print(f"Debug: Playing channel from server: {server_url}")
-            
-            # Create auth string if credentials exist
-            auth_string = ''
-            auth = None
-            if server.get('username') or server.get('password'):
-                auth = (server.get('username', ''), server.get('password', ''))
-                auth_string = f"{server.get('username', '')}:{server.get('password', '')}@"
-            
-            # Use channel UUID directly from stored data
-            channel_uuid = channel_data['uuid']
+            api = TVHeadendAPI.for_server(server)
+            logger.debug(f"Playing channel from server: {api.base_url}")
             
             if channel_uuid:
-                # Create media URL with auth if needed
-                if auth_string:
-                    # Ensure server_url starts with http:// or https://
-                    if not server_url.startswith(('http://', 'https://')):
-                        server_url = f'http://{server_url}'
-                    
-                    # Insert auth string after http:// or https://
-                    stream_url = server_url.replace('://', f'://{auth_string}')
-                    stream_url = f'{stream_url}/stream/channel/{channel_uuid}'
-
-                else:
-                    if not server_url.startswith(('http://', 'https://')):
-                        server_url = f'http://{server_url}'
-                    stream_url = f'{server_url}/stream/channel/{channel_uuid}'
-                print(f"Debug: Stream URL: {stream_url}")
+                # Create media URL, with credentials embedded if needed
+                stream_url = api.stream_url(channel_uuid, with_credentials=True)
+                logger.debug(f"Playing channel: {channel_data['name']}")
                 
-                media = self.instance.media_new(stream_url)
-                self.media_player.set_media(media)
-                self.media_player.play()
-                print(f"Debug: Started playback")
-                self.statusbar.showMessage(f"Playing: {channel_data['name']}")
+                self.prewarm_timer.stop()
+                self.zap_tracker.set_server(server['name'])
+                switched = self.zap_engine.play(server, channel_uuid, stream_url)
+                self.media_player = self.zap_engine.player
+                self.zap_tracker.set_player(self.media_player)
+                if switched and self.zap_engine.is_ready():
+                    self.zap_tracker.shown()
+                logger.debug("Started playback")
+                self.record_zap(channel_data)
+                self.playing = (server, channel_data)
+                if self.lineup is not None:
+                    self.statusbar.showMessage(f"Playing: {channel_data['name']} from {server['name']}")
+                else:
+                    self.statusbar.showMessage(f"Playing: {channel_data['name']}")
             else:
-                print(f"Debug: Channel not found: {channel_data['name']}")
+                logger.error(f"Channel not found: {channel_data['name']}")
                 self.statusbar.showMessage("Channel not found")
+                self.zap_tracker.cancel()
                 
         except Exception as e:
-            print(f"Debug: Error in play_channel: {str(e)}")
+            logger.error(f"Error in play_channel: {str(e)}")
             self.statusbar.showMessage(f"Playback error: {str(e)}")
+            self.zap_tracker.cancel()
+
+    def show_epg_grid(self):
+        """Show the TV guide of the channels in the channel list"""
+        if not self.servers:
+            self.statusbar.showMessage("No servers configured")
+            return
+        server = self.current_server()
+        store = self.epg_store(server)
+        if store is None:
+            self.statusbar.showMessage("EPG database unavailable")
+            return
+        store.start()
+        model = self.channel_model
+        channels = [(model.store.uuids[row], model.store.names[row]) for row in model.order]
+        dialog = EPGGridDialog(store, channels, server, self)
+        dialog.show()
+
+    def show_epg_search(self):
+        """Show the EPG search dialog for the selected server"""
+        if not self.servers:
+            self.statusbar.showMessage("No servers configured")
+            return
+        server = self.current_server()
+        store = self.epg_store(server)
+        if store is None:
+            self.statusbar.showMessage("EPG database unavailable")
+            return
+        store.start()
+        dialog = EPGSearchDialog(store, server, self)
+        dialog.show()
 
     def show_server_status(self):
         """Show server status dialog"""
         try:
-            server = self.servers[self.server_combo.currentIndex()]
+            server = self.current_server()
             dialog = ServerStatusDialog(server, self)
             dialog.show()
         except Exception as e:
-            print(f"Debug: Error showing server status: {str(e)}")
+            logger.error(f"Error showing server status: {str(e)}")
             self.statusbar.showMessage("Error showing server status")
 
     def filter_channels(self, search_text):
         """Filter channel list based on search text"""
-        search_text = search_text.lower()
-        for row in range(self.channel_list.rowCount()):
-            item = self.channel_list.item(row, 1)  # Get name column item
-            if item:
-                channel_name = item.text().lower()
-                self.channel_list.setRowHidden(row, search_text not in channel_name)
+        if not search_text:
+            # Clearing the search shows all channels straight away
+            self.search_timer.stop()
+            self.apply_channel_filter()
+        else:
+            self.search_timer.start()
+
+    def apply_channel_filter(self):
+        channel = self.selected_channel()
+        self.channel_model.set_query(self.search_box.text())
+        if channel and not self.channel_list.currentIndex().isValid():
+            # A model reset drops the selection; keep the channel selected if still shown
+            row = self.channel_model.find_row(channel['uuid'])
+            if row >= 0:
+                self.channel_list.setCurrentIndex(self.channel_model.index(row, 1))
 
     def check_hardware_acceleration(self):
         """Check and print which hardware acceleration method is being used"""
@@ -2586,136 +6292,51 @@ class TVHeadendClient(QMainWindow):
             # Get media statistics - handle different VLC Python binding versions
             media = self.media_player.get_media()
             if not media:
-                print("No media currently playing")
+                logger.info("No media currently playing")
                 return
                 
             # Different versions of python-vlc have different APIs for get_stats
             try:
                 # Newer versions (direct call)
                 stats = media.get_stats()
-                print("VLC Playback Statistics:")
-                print(f"Decoded video blocks: {stats.decoded_video}")
-                print(f"Displayed pictures: {stats.displayed_pictures}")
-                print(f"Lost pictures: {stats.lost_pictures}")
+                logger.info("VLC Playback Statistics:")
+                logger.info(f"Decoded video blocks: {stats.decoded_video}")
+                logger.info(f"Displayed pictures: {stats.displayed_pictures}")
+                logger.info(f"Lost pictures: {stats.lost_pictures}")
             except TypeError:
                 # Older versions (requiring a stats object parameter)
                 stats = vlc.MediaStats()
                 media.get_stats(stats)
-                print("VLC Playback Statistics:")
-                print(f"Decoded video blocks: {stats.decoded_video}")
-                print(f"Displayed pictures: {stats.displayed_pictures}")
-                print(f"Lost pictures: {stats.lost_pictures}")
+                logger.info("VLC Playback Statistics:")
+                logger.info(f"Decoded video blocks: {stats.decoded_video}")
+                logger.info(f"Displayed pictures: {stats.displayed_pictures}")
+                logger.info(f"Lost pictures: {stats.lost_pictures}")
             
             # Check if hardware decoding is enabled
             if hasattr(self.media_player, 'get_role'):
-                print(f"Media player role: {self.media_player.get_role()}")
+                logger.info(f"Media player role: {self.media_player.get_role()}")
             
             # Try to get more detailed hardware acceleration info
-            print("Hardware acceleration is active if you see 'Using ... for hardware decoding' in the logs above")
-            print("For more details, run VLC with the same content and use:")
-            print("Tools -> Messages -> Info to see which decoder is being used")
+            logger.info("Hardware acceleration is active if you see 'Using ... for hardware decoding' in the logs above")
+            logger.info("For more details, run VLC with the same content and use:")
+            logger.info("Tools -> Messages -> Info to see which decoder is being used")
             
         except Exception as e:
-            print(f"Error checking hardware acceleration: {e}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error checking hardware acceleration: {e}")
 
 
 
-class EPGDialog(QDialog):
-    def __init__(self, channel_name, epg_data, server, parent=None):
+class ScheduleRecordingDialog(QDialog):
+    """Base for dialogs listing EPG events that can be scheduled for recording"""
+
+    def __init__(self, server, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"EPG Guide - {channel_name}")
-        self.setModal(False)
-        self.resize(800, 500)
         self.server = server
-        self.channel_name = channel_name
-        self.setup_ui(epg_data)
-        
-    def setup_ui(self, epg_data):
-        layout = QVBoxLayout(self)
-        
-        # Create list widget for EPG entries
-        self.epg_list = QListWidget()
-        layout.addWidget(self.epg_list)
-        
-        # Add EPG entries to list with record buttons
-        for entry in epg_data:
-            # Create widget to hold program info and record button
-            item_widget = QWidget()
-            item_layout = QHBoxLayout(item_widget)
-            item_layout.setContentsMargins(5, 2, 5, 2)
-            # Get start and stop times
-            start_time = datetime.fromtimestamp(entry['start']).strftime('%H:%M')
-            stop_time = datetime.fromtimestamp(entry['stop']).strftime('%H:%M')
-            
-            # Get title and description
-            if isinstance(entry.get('title'), dict):
-                title = entry['title'].get('eng', 'No title')
-            else:
-                title = str(entry.get('title', 'No title'))
-                
-            if isinstance(entry.get('description'), dict):
-                description = entry['description'].get('eng', 'No description')
-            else:
-                description = str(entry.get('description', 'No description'))
-                
-                # Create label for program info
-                info_text = f"{start_time} - {stop_time}: {title}"
-                info_label = QLabel(info_text)
-                info_label.setToolTip(description)
-                item_layout.addWidget(info_label, stretch=1)
-                
-                # Create record button with unicode icon
-                record_btn = QPushButton("⏺")  # Unicode record symbol
-                record_btn.setFixedWidth(32)  # Make button smaller since it's just an icon
-                record_btn.setFixedHeight(32)  # Make it square
-                record_btn.setStyleSheet("""
-                    QPushButton {
-                        color: red;
-                        font-size: 16px;
-                        border: 1px solid #ccc;
-                        border-radius: 16px;
-                        padding: 0px;
-                    }
-                    QPushButton:hover {
-                        background-color: #f0f0f0;
-                    }
-                    QPushButton:pressed {
-                        background-color: #e0e0e0;
-                    }
-                """)
-                record_btn.setToolTip("Schedule Recording")
-                record_btn.clicked.connect(
-                    lambda checked, e=entry: self.schedule_recording(e))
-                item_layout.addWidget(record_btn)
-                
-                # Create list item and set custom widget
-                list_item = QListWidgetItem(self.epg_list)
-                list_item.setSizeHint(item_widget.sizeHint())
-                self.epg_list.addItem(list_item)
-                self.epg_list.setItemWidget(list_item, item_widget)
-                try:
-                    self.epg_list.addItem(list_item)
-                    self.epg_list.setItemWidget(list_item, item_widget)
-                except Exception as e:
-                    print(f"Debug: Error processing EPG entry: {str(e)}")
-                    print(f"Debug: Problematic entry: {entry}")
-                    continue
 
-        # Close button
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        layout.addWidget(close_btn)
-        
     def schedule_recording(self, entry):
         """Schedule a recording for the selected EPG entry"""
         try:
-            print(f"Debug: Scheduling recording for: {entry.get('title', 'Unknown')}")
-            
-            # Create auth if needed
-            auth = None
-            if self.server.get('username') or self.server.get('password'):
-                auth = (self.server.get('username', ''), self.server.get('password', ''))
+            logger.debug(f"Scheduling recording for: {entry.get('title', 'Unknown')}")
             
             # Prepare recording request with proper language object structure
             conf_data = {
@@ -2733,37 +6354,683 @@ class EPGDialog(QDialog):
             
             # Convert to string format as expected by the API
             data = {'conf': json.dumps(conf_data)}
-            print(f"Debug: Recording data: {data}")
+            logger.debug(f"Recording data: {data}")
             
             # Make recording request
-            record_url = f'{self.server["url"]}/api/dvr/entry/create'
-            print(f"Debug: Sending recording request to: {record_url}")
-            
-            response = requests.post(record_url, data=data, auth=auth)
-            print(f"Debug: Recording response status: {response.status_code}")
-            print(f"Debug: Recording response: {response.text}")
+            api = TVHeadendAPI.for_server(self.server)
+            logger.debug(f"Sending recording request to: {api.url('api/dvr/entry/create')}")
             
-            if response.status_code == 200:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Recording scheduled successfully for {entry.get('title', 'Unknown')}"
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Error",
-                    f"Failed to schedule recording: {response.text}"
-                )
+            run_in_background(
+                api.post, 'api/dvr/entry/create', data=data,
+                on_result=lambda response: self.on_recording_scheduled(entry, response),
+                on_error=self.on_schedule_error)
                 
         except Exception as e:
-            print(f"Debug: Error scheduling recording: {str(e)}")
-            QMessageBox.critical(
+            self.on_schedule_error(e)
+
+    def on_recording_scheduled(self, entry, response):
+        logger.debug(f"Recording response status: {response.status_code}")
+        logger.debug(f"Recording response: {response.text}")
+        
+        if response.status_code == 200:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Recording scheduled successfully for {entry.get('title', 'Unknown')}"
+            )
+        else:
+            QMessageBox.warning(
                 self,
                 "Error",
-                f"Failed to schedule recording: {str(e)}"
+                f"Failed to schedule recording: {response.text}"
             )
 
+    def on_schedule_error(self, error):
+        logger.error(f"Error scheduling recording: {str(error)}")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to schedule recording: {str(error)}"
+        )
+
+class EPGSearchDialog(ScheduleRecordingDialog):
+    """Full-text search of the upcoming events in a server's local EPG database"""
+
+    MAX_RESULTS = 500
+
+    def __init__(self, store, server, parent=None):
+        super().__init__(server, parent)
+        self.store = store
+        self.results = []
+        self.setWindowTitle("Search EPG")
+        self.setModal(False)
+        self.resize(900, 550)
+        self.setup_ui()
+        
+        # Search once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_box.textChanged.connect(lambda text: self.search_timer.start())
+        
+        # Repeat the search as the guide downloads and changes
+        self.store.updated.connect(self.on_store_updated)
+        self.finished.connect(lambda result: self.store.updated.disconnect(self.on_store_updated))
+        self.update_status()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search titles and descriptions...")
+        self.search_box.setClearButtonEnabled(True)
+        layout.addWidget(self.search_box)
+        
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(4)
+        self.results_table.setHorizontalHeaderLabels(["Channel", "Start", "End", "Title"])
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
+        layout.addWidget(self.results_table)
+        
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        
+        button_layout = QHBoxLayout()
+        self.record_btn = QPushButton("Schedule Recording")
+        self.record_btn.setEnabled(False)
+        self.record_btn.clicked.connect(self.record_selected)
+        button_layout.addWidget(self.record_btn)
+        button_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+    def run_search(self):
+        started = time.perf_counter()
+        self.results = self.store.search(self.search_box.text(), limit=self.MAX_RESULTS)
+        elapsed = (time.perf_counter() - started) * 1000
+        logger.debug(f"EPG search for {self.search_box.text()!r}: "
+                     f"{len(self.results)} results in {elapsed:.1f} ms")
+        
+        self.results_table.setRowCount(len(self.results))
+        for row, entry in enumerate(self.results):
+            title = epg_text(entry.get('title'), 'No title')
+            subtitle = epg_text(entry.get('subtitle'))
+            if subtitle:
+                title = f"{title} - {subtitle}"
+            title_item = QTableWidgetItem(title)
+            title_item.setToolTip(epg_text(entry.get('description')))
+            self.results_table.setItem(row, 0, QTableWidgetItem(str(entry.get('channelName', ''))))
+            self.results_table.setItem(row, 1, QTableWidgetItem(
+                datetime.fromtimestamp(entry.get('start', 0)).strftime('%a %d %b %H:%M')))
+            self.results_table.setItem(row, 2, QTableWidgetItem(
+                datetime.fromtimestamp(entry.get('stop', 0)).strftime('%H:%M')))
+            self.results_table.setItem(row, 3, title_item)
+        self.update_status()
+
+    def update_status(self):
+        if self.store.refreshing:
+            status = f"Downloading guide... ({self.store.count()} events)"
+        elif self.store.refreshed:
+            updated = datetime.fromtimestamp(self.store.refreshed).strftime('%H:%M')
+            status = f"{self.store.count()} events, downloaded at {updated}"
+        else:
+            status = "Guide not downloaded yet"
+        if self.search_box.text().strip():
+            status = f"{len(self.results)} results - {status}"
+        self.status_label.setText(status)
+
+    def on_store_updated(self):
+        if self.search_box.text().strip():
+            self.search_timer.start()
+        else:
+            self.update_status()
+
+    def on_selection_changed(self):
+        self.record_btn.setEnabled(bool(self.results_table.selectionModel().selectedRows()))
+
+    def record_selected(self):
+        rows = self.results_table.selectionModel().selectedRows()
+        if rows:
+            self.schedule_recording(self.results[rows[0].row()])
+
+class EPGGridView(QAbstractScrollArea):
+    """Channels-by-time programme grid painted straight onto the viewport.
+
+    No widget or item is created per programme. Events are read from the
+    local EPG database in blocks of CHUNK_ROWS channels by BLOCK_SECONDS,
+    the first time a block comes into view, and each paint only draws the
+    cells in the viewport. The programme under the mouse is found by
+    hit-testing the loaded blocks.
+    """
+    record_requested = pyqtSignal(object)  # EPG entry
+
+    DAYS = 7
+    ROW_HEIGHT = 36
+    CHANNEL_WIDTH = 160
+    RULER_HEIGHT = 22
+    PIXELS_PER_MINUTE = 4
+    CHUNK_ROWS = 50
+    BLOCK_SECONDS = 6 * 3600
+    MAX_BLOCKS = 256
+
+    def __init__(self, store, channels, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.channels = channels  # (uuid, name) in display order
+        # Start at the half hour before now
+        self.origin = int(time.time() // 1800 * 1800) - 1800
+        self.end = self.origin + self.DAYS * 86400
+        self.blocks = OrderedDict()  # (chunk, block) -> {channel uuid: [entries]}
+        self.horizontalScrollBar().setSingleStep(self.PIXELS_PER_MINUTE * 15)
+        self.verticalScrollBar().setSingleStep(self.ROW_HEIGHT)
+        self.update_scroll_ranges()
+
+    def reload(self):
+        """Forget the loaded blocks after the EPG database changed"""
+        self.blocks.clear()
+        self.viewport().update()
+
+    # Geometry
+
+    def content_width(self):
+        return (self.end - self.origin) * self.PIXELS_PER_MINUTE // 60
+
+    def x_of(self, t):
+        return self.CHANNEL_WIDTH + int((t - self.origin) * self.PIXELS_PER_MINUTE / 60) \
+            - self.horizontalScrollBar().value()
+
+    def time_at(self, x):
+        return self.origin + (x - self.CHANNEL_WIDTH + self.horizontalScrollBar().value()) \
+            * 60 / self.PIXELS_PER_MINUTE
+
+    def y_of(self, row):
+        return self.RULER_HEIGHT + row * self.ROW_HEIGHT - self.verticalScrollBar().value()
+
+    def row_at(self, y):
+        return (y - self.RULER_HEIGHT + self.verticalScrollBar().value()) // self.ROW_HEIGHT
+
+    def update_scroll_ranges(self):
+        size = self.viewport().size()
+        width = max(0, size.width() - self.CHANNEL_WIDTH)
+        height = max(0, size.height() - self.RULER_HEIGHT)
+        self.horizontalScrollBar().setPageStep(width)
+        self.horizontalScrollBar().setRange(0, max(0, self.content_width() - width))
+        self.verticalScrollBar().setPageStep(height)
+        self.verticalScrollBar().setRange(
+            0, max(0, len(self.channels) * self.ROW_HEIGHT - height))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scroll_ranges()
+
+    def scrollContentsBy(self, dx, dy):
+        # The ruler and channel column stay put, so repaint rather than scroll
+        self.viewport().update()
+
+    def scroll_to_time(self, t):
+        self.horizontalScrollBar().setValue(
+            int((t - self.origin) * self.PIXELS_PER_MINUTE / 60))
+
+    # Events
+
+    def block(self, chunk, block):
+        """Return the events of a block of channels and time, reading it if needed"""
+        key = (chunk, block)
+        events = self.blocks.get(key)
+        if events is not None:
+            self.blocks.move_to_end(key)
+            return events
+        start = self.origin + block * self.BLOCK_SECONDS
+        uuids = [uuid for uuid, _ in
+                 self.channels[chunk * self.CHUNK_ROWS:(chunk + 1) * self.CHUNK_ROWS]]
+        events = {}
+        for entry in self.store.events_between(start, start + self.BLOCK_SECONDS, uuids):
+            events.setdefault(entry.get('channelUuid'), []).append(entry)
+        self.blocks[key] = events
+        if len(self.blocks) > self.MAX_BLOCKS:
+            self.blocks.popitem(last=False)
+        return events
+
+    def row_events(self, row, start, stop):
+        """Return the events of a channel row overlapping [start, stop)"""
+        uuid = self.channels[row][0]
+        chunk = row // self.CHUNK_ROWS
+        first = max(0, int(start - self.origin) // self.BLOCK_SECONDS)
+        last = int(stop - self.origin) // self.BLOCK_SECONDS
+        seen = set()
+        result = []
+        for block in range(first, last + 1):
+            for entry in self.block(chunk, block).get(uuid, ()):
+                # Events spanning two blocks are in both
+                if entry['eventId'] in seen:
+                    continue
+                if entry['start'] < stop and entry['stop'] > start:
+                    seen.add(entry['eventId'])
+                    result.append(entry)
+        return result
+
+    def event_at(self, pos):
+        """Return the EPG entry drawn at a viewport position, or None"""
+        if pos.x() < self.CHANNEL_WIDTH or pos.y() < self.RULER_HEIGHT:
+            return None
+        row = self.row_at(pos.y())
+        if not 0 <= row < len(self.channels):
+            return None
+        t = self.time_at(pos.x())
+        for entry in self.row_events(row, t, t + 1):
+            return entry
+        return None
+
+    # Painting
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        palette = self.palette()
+        rect = self.viewport().rect()
+        metrics = painter.fontMetrics()
+        now = time.time()
+        painter.fillRect(rect, palette.base())
+        
+        first_row = max(0, self.row_at(self.RULER_HEIGHT))
+        last_row = min(len(self.channels) - 1, self.row_at(rect.height()))
+        start = self.time_at(self.CHANNEL_WIDTH)
+        stop = self.time_at(rect.width())
+        
+        # Programme cells
+        painter.setClipRect(QRect(self.CHANNEL_WIDTH, self.RULER_HEIGHT,
+                                  rect.width() - self.CHANNEL_WIDTH,
+                                  rect.height() - self.RULER_HEIGHT))
+        painter.setPen(palette.mid().color())
+        for row in range(first_row, last_row + 1):
+            y = self.y_of(row)
+            for entry in self.row_events(row, start, stop):
+                x0 = max(self.x_of(entry['start']), self.CHANNEL_WIDTH - 1)
+                x1 = min(self.x_of(entry['stop']), rect.width() + 1)
+                cell = QRect(x0, y, x1 - x0, self.ROW_HEIGHT)
+                if entry['start'] <= now < entry['stop']:
+                    painter.fillRect(cell, palette.alternateBase())
+                painter.drawRect(cell.adjusted(0, 0, -1, -1))
+                text_rect = cell.adjusted(4, 2, -4, -2)
+                if text_rect.width() > 8:
+                    text = (f"{datetime.fromtimestamp(entry['start']).strftime('%H:%M')} "
+                            f"{epg_text(entry.get('title'), 'No title')}")
+                    painter.setPen(palette.text().color())
+                    painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft,
+                                     metrics.elidedText(text, Qt.ElideRight, text_rect.width()))
+                    painter.setPen(palette.mid().color())
+        
+        # Current time
+        x = self.x_of(now)
+        painter.setPen(palette.highlight().color())
+        painter.drawLine(x, self.RULER_HEIGHT, x, rect.height())
+        painter.setClipping(False)
+        
+        # Time ruler, every half hour
+        painter.fillRect(QRect(0, 0, rect.width(), self.RULER_HEIGHT), palette.window())
+        painter.setPen(palette.windowText().color())
+        tick = int(start // 1800 * 1800)
+        while tick <= stop:
+            x = self.x_of(tick)
+            if x >= self.CHANNEL_WIDTH:
+                painter.drawLine(x, self.RULER_HEIGHT - 5, x, self.RULER_HEIGHT)
+                label = datetime.fromtimestamp(tick).strftime(
+                    '%a %d %b' if datetime.fromtimestamp(tick).hour == 0 and tick % 3600 == 0
+                    else '%H:%M')
+                painter.drawText(x + 3, self.RULER_HEIGHT - 7, label)
+            tick += 1800
+        
+        # Channel names
+        painter.fillRect(QRect(0, self.RULER_HEIGHT, self.CHANNEL_WIDTH,
+                               rect.height() - self.RULER_HEIGHT), palette.window())
+        painter.setClipRect(QRect(0, self.RULER_HEIGHT, self.CHANNEL_WIDTH,
+                                  rect.height() - self.RULER_HEIGHT))
+        for row in range(first_row, last_row + 1):
+            cell = QRect(0, self.y_of(row), self.CHANNEL_WIDTH, self.ROW_HEIGHT)
+            painter.setPen(palette.mid().color())
+            painter.drawLine(cell.bottomLeft(), cell.bottomRight())
+            painter.setPen(palette.windowText().color())
+            text_rect = cell.adjusted(6, 0, -6, 0)
+            painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft,
+                             metrics.elidedText(self.channels[row][1], Qt.ElideRight,
+                                                text_rect.width()))
+        painter.end()
+
+    # Interaction
+
+    def viewportEvent(self, event):
+        if event.type() == QEvent.ToolTip:
+            entry = self.event_at(event.pos())
+            if entry:
+                start = datetime.fromtimestamp(entry['start']).strftime('%a %H:%M')
+                stop = datetime.fromtimestamp(entry['stop']).strftime('%H:%M')
+                text = f"{start} - {stop}  {epg_text(entry.get('title'), 'No title')}"
+                subtitle = epg_text(entry.get('subtitle'))
+                if subtitle:
+                    text += f"\n{subtitle}"
+                description = epg_text(entry.get('description'))
+                if description:
+                    text += f"\n\n{description}"
+                QToolTip.showText(event.globalPos(), text, self.viewport())
+            else:
+                QToolTip.hideText()
+            return True
+        return super().viewportEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        entry = self.event_at(event.pos())
+        if entry:
+            self.record_requested.emit(entry)
+
+    def contextMenuEvent(self, event):
+        entry = self.event_at(self.viewport().mapFrom(self, event.pos()))
+        if not entry:
+            return
+        menu = QMenu(self)
+        record_action = menu.addAction("Schedule Recording")
+        record_action.triggered.connect(lambda: self.record_requested.emit(entry))
+        menu.exec_(event.globalPos())
+
+class EPGGridDialog(ScheduleRecordingDialog):
+    """TV guide of the listed channels over the next week"""
+
+    def __init__(self, store, channels, server, parent=None):
+        super().__init__(server, parent)
+        self.store = store
+        self.setWindowTitle("TV Guide")
+        self.setModal(False)
+        self.resize(1100, 650)
+        
+        layout = QVBoxLayout(self)
+        top_layout = QHBoxLayout()
+        now_btn = QPushButton("Now")
+        now_btn.clicked.connect(self.scroll_to_now)
+        top_layout.addWidget(now_btn)
+        self.status_label = QLabel()
+        top_layout.addWidget(self.status_label, stretch=1)
+        layout.addLayout(top_layout)
+        
+        self.grid = EPGGridView(store, channels)
+        self.grid.record_requested.connect(self.schedule_recording)
+        layout.addWidget(self.grid)
+        
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+        
+        # Redraw as the guide downloads and changes
+        self.store.updated.connect(self.on_store_updated)
+        self.finished.connect(lambda result: self.store.updated.disconnect(self.on_store_updated))
+        self.update_status()
+
+    def scroll_to_now(self):
+        self.grid.scroll_to_time(time.time() - 1800)
+
+    def on_store_updated(self):
+        self.grid.reload()
+        self.update_status()
+
+    def update_status(self):
+        if self.store.refreshing:
+            self.status_label.setText("Downloading guide...")
+        elif not self.store.refreshed:
+            self.status_label.setText("Guide not downloaded yet")
+        else:
+            self.status_label.setText(
+                f"{len(self.grid.channels)} channels - double-click a programme to record it")
+
+class EPGListModel(QAbstractListModel):
+    """Upcoming events of one channel, loaded a page at a time as the view scrolls.
+
+    Each event is kept as a tuple of the fields shown and needed to
+    schedule it, rather than the whole EPG entry.
+    """
+
+    PAGE_SIZE = 50
+
+    more_requested = pyqtSignal()
+
+    def __init__(self, channel_uuid, parent=None):
+        super().__init__(parent)
+        self.channel_uuid = channel_uuid
+        self.events = []  # (event id, start, stop, title, subtitle, description)
+        self.pending = False  # a page request is running
+        self.complete = False  # every event has been loaded
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.events)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        event = self.events[index.row()]
+        if role == Qt.DisplayRole:
+            return event[3]
+        if role == Qt.ToolTipRole:
+            return event[5] or None
+        if role == Qt.UserRole:
+            return event
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.pending and not self.complete
+
+    def fetchMore(self, parent=QModelIndex()):
+        self.more_requested.emit()
+
+    def append_entries(self, entries, complete):
+        """Append a page of EPG entries; complete when there are no more"""
+        self.complete = complete
+        known = {event[0] for event in self.events[-len(entries):]} if entries else set()
+        events = [(entry.get('eventId'), int(entry.get('start', 0)), int(entry.get('stop', 0)),
+                   epg_text(entry.get('title'), 'No title'), epg_text(entry.get('subtitle')),
+                   epg_text(entry.get('description')))
+                  for entry in entries if entry.get('eventId') not in known]
+        if not events:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.events), len(self.events) + len(events) - 1)
+        self.events.extend(events)
+        self.endInsertRows()
+
+    def entry(self, row):
+        """Return the event at a row as an EPG entry dict"""
+        event_id, start, stop, title, subtitle, description = self.events[row]
+        return {'eventId': event_id, 'channelUuid': self.channel_uuid, 'start': start,
+                'stop': stop, 'title': title, 'subtitle': subtitle, 'description': description}
+
+class EPGEntryDelegate(QStyledItemDelegate):
+    """Paints an EPG event as two lines of text with a record button.
+
+    Nothing is created per row; clicks on the button are hit-tested and
+    reported through record_clicked.
+    """
+    record_clicked = pyqtSignal(QModelIndex)
+
+    BUTTON_SIZE = 28
+    MARGIN = 6
+
+    def sizeHint(self, option, index):
+        height = option.fontMetrics.height() * 2 + self.MARGIN * 2
+        return QSize(option.rect.width(), max(height, self.BUTTON_SIZE + self.MARGIN))
+
+    def button_rect(self, rect):
+        return QRect(rect.right() - self.MARGIN - self.BUTTON_SIZE,
+                     rect.center().y() - self.BUTTON_SIZE // 2,
+                     self.BUTTON_SIZE, self.BUTTON_SIZE)
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        option.text = ''
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+        
+        event_id, start, stop, title, subtitle, description = index.data(Qt.UserRole)
+        selected = option.state & QStyle.State_Selected
+        palette = option.palette
+        metrics = option.fontMetrics
+        button = self.button_rect(option.rect)
+        text_rect = option.rect.adjusted(self.MARGIN, self.MARGIN,
+                                         -(self.BUTTON_SIZE + self.MARGIN * 3), -self.MARGIN)
+        line_height = metrics.height()
+        
+        painter.save()
+        times = (f"{datetime.fromtimestamp(start).strftime('%a %H:%M')} - "
+                 f"{datetime.fromtimestamp(stop).strftime('%H:%M')}")
+        bold = QFont(option.font)
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(palette.highlightedText().color() if selected else palette.text().color())
+        first_line = QRect(text_rect.left(), text_rect.top(), text_rect.width(), line_height)
+        painter.drawText(first_line, Qt.AlignLeft | Qt.AlignVCenter,
+                         QFontMetrics(bold).elidedText(f"{times}  {title}", Qt.ElideRight,
+                                                       first_line.width()))
+        painter.setFont(option.font)
+        if not selected:
+            painter.setPen(palette.mid().color().darker(150))
+        second_line = first_line.translated(0, line_height)
+        painter.drawText(second_line, Qt.AlignLeft | Qt.AlignVCenter,
+                         metrics.elidedText(subtitle or description, Qt.ElideRight,
+                                            second_line.width()))
+        
+        # Record button
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QColor('#ccc'))
+        painter.setBrush(palette.base())
+        painter.drawEllipse(button.adjusted(0, 0, -1, -1))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(Qt.red))
+        dot = self.BUTTON_SIZE // 4
+        painter.drawEllipse(button.center(), dot, dot)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and self.button_rect(option.rect).contains(event.pos())):
+            self.record_clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if self.button_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "Schedule Recording", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+class EPGDialog(ScheduleRecordingDialog):
+    """Upcoming programmes of one channel.
+
+    Events are read a page at a time as the list is scrolled, from the
+    local EPG database when the guide has been downloaded and otherwise
+    from the server. A channel prefetched into the database while it was
+    in view starts with its first page from there.
+    """
+
+    def __init__(self, channel_name, channel_uuid, server, store=None, parent=None):
+        super().__init__(server, parent)
+        self.setWindowTitle(f"EPG Guide - {channel_name}")
+        self.setModal(False)
+        self.resize(800, 500)
+        self.channel_name = channel_name
+        self.store = store
+        self.since = int(time.time())  # page through events ending after this
+        self.seeded = False  # first page read from prefetched events
+        self.model = EPGListModel(channel_uuid, self)
+        self.model.more_requested.connect(self.load_more)
+        self.setup_ui()
+        self.load_more()
+        
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        # List of EPG entries, painted by a delegate
+        self.epg_list = QListView()
+        self.epg_list.setModel(self.model)
+        self.epg_list.setUniformItemSizes(True)
+        self.epg_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        delegate = EPGEntryDelegate(self.epg_list)
+        delegate.record_clicked.connect(
+            lambda index: self.schedule_recording(self.model.entry(index.row())))
+        self.epg_list.setItemDelegate(delegate)
+        layout.addWidget(self.epg_list)
+        
+        self.status_label = QLabel("Loading...")
+        layout.addWidget(self.status_label)
+
+        # Close button
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+
+    def load_more(self):
+        """Load the next page of events"""
+        model = self.model
+        if model.pending or model.complete:
+            return
+        offset = model.rowCount()
+        store = self.store
+        if store is not None and (store.refreshed or (
+                not self.seeded and store.has_channel(model.channel_uuid))):
+            self.seeded = True
+            entries = store.channel_events(model.channel_uuid, since=self.since,
+                                           limit=model.PAGE_SIZE, offset=offset)
+            # Only the whole guide tells that a channel has no more events
+            complete = bool(store.refreshed) and len(entries) < model.PAGE_SIZE
+            model.append_entries(entries, complete)
+            self.update_status()
+            if not complete and not entries:
+                self.load_more()
+            return
+        model.pending = True
+        run_in_background(
+            self.download_page, TVHeadendAPI.for_server(self.server), model.channel_uuid,
+            offset, model.PAGE_SIZE,
+            on_result=self.on_page_downloaded,
+            on_error=self.on_page_error,
+            on_finished=self.on_page_finished)
+
+    def download_page(self, api, channel_uuid, offset, limit):
+        """Download a page of upcoming EPG events for a channel (runs on a worker thread)"""
+        params = {'channel': channel_uuid, 'start': offset, 'limit': limit}
+        logger.debug("Fetching EPG data from: %s %s", api.url('api/epg/events/grid'), params)
+        response = api.get('api/epg/events/grid', params=params)
+        response.raise_for_status()
+        data = response.json()
+        entries = data.get('entries', [])
+        total = data.get('totalCount', data.get('total'))
+        complete = len(entries) < limit or (total is not None and offset + len(entries) >= total)
+        return entries, complete
+
+    def on_page_downloaded(self, result):
+        entries, complete = result
+        self.model.append_entries(entries, complete)
+        self.update_status()
+
+    def on_page_error(self, error):
+        logger.error(f"Error fetching EPG: {str(error)}")
+        self.status_label.setText(f"Error fetching EPG: {str(error)}")
+
+    def on_page_finished(self):
+        self.model.pending = False
+        # Keep loading until the view is filled
+        if self.model.canFetchMore():
+            self.epg_list.doItemsLayout()
+
+    def update_status(self):
+        count = self.model.rowCount()
+        if not count:
+            self.status_label.setText("No EPG data available" if self.model.complete
+                                      else "Loading...")
+        else:
+            more = "" if self.model.complete else "+"
+            self.status_label.setText(f"{count}{more} programmes")
+
 class RecordingStatusDialog(QDialog):
     def __init__(self, channel_name, file_path, parent=None):
         super().__init__(parent)
@@ -2831,8 +7098,114 @@ class RecordingStatusDialog(QDialog):
         """Signal that user wants to stop recording"""
         self.accept()
 
+class ZapHistogramWidget(QWidget):
+    """Bar chart of the buckets of a ZapStats"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buckets = [0] * (len(ZapStats.BUCKETS) + 1)
+        self.setMinimumHeight(140)
+
+    def set_buckets(self, buckets):
+        self.buckets = list(buckets)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        metrics = painter.fontMetrics()
+        label_height = metrics.height() + 4
+        width = self.width() / len(self.buckets)
+        height = self.height() - 2 * label_height
+        peak = max(self.buckets) or 1
+        color = self.palette().color(QPalette.Highlight)
+        for i, count in enumerate(self.buckets):
+            left = int(i * width)
+            bar = int(height * count / peak)
+            rect = QRect(left + 2, label_height + height - bar, int(width) - 4, bar)
+            painter.fillRect(rect, color)
+            if count:
+                painter.drawText(QRect(left, rect.top() - label_height, int(width), label_height),
+                                 Qt.AlignHCenter | Qt.AlignBottom, str(count))
+            painter.drawText(QRect(left, self.height() - label_height, int(width), label_height),
+                             Qt.AlignCenter, ZapStats.bucket_label(i))
+        painter.end()
+
+class ZapStatsDialog(QDialog):
+    """Time to first frame of every channel played, per server"""
+
+    COLUMNS = ('Server', 'Channel', 'Zaps', 'Failed', 'Median', 'p95', 'p99')
+
+    def __init__(self, tracker, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self.setWindowTitle("Zap Statistics")
+        self.resize(700, 500)
+        self.keys = []  # table row -> (server, channel), None for all channels
+        
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.itemSelectionChanged.connect(self.update_histogram)
+        layout.addWidget(self.table)
+        
+        layout.addWidget(QLabel("Time to first frame:"))
+        self.histogram = ZapHistogramWidget()
+        layout.addWidget(self.histogram)
+        
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+        
+        tracker.zap_finished.connect(self.refresh)
+        self.finished.connect(lambda: tracker.zap_finished.disconnect(self.refresh))
+        self.refresh()
+
+    def stats(self, key):
+        return self.tracker.total() if key is None else self.tracker.stats[key]
+
+    def refresh(self, *args):
+        selected = self.table.currentRow()
+        selected_key = self.keys[selected] if 0 <= selected < len(self.keys) else None
+        self.keys = [None] + sorted(self.tracker.stats, key=lambda key: (key[0].casefold(), key[1].casefold()))
+        self.table.setRowCount(len(self.keys))
+        for row, key in enumerate(self.keys):
+            stats = self.stats(key)
+            values = ["All", "All channels"] if key is None else list(key)
+            values += [str(stats.count + stats.failures), str(stats.failures)]
+            for p in (50, 95, 99):
+                ms = percentile(list(stats.samples), p)
+                values.append(f"{ms:.0f} ms" if ms is not None else "-")
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        self.table.setCurrentCell(self.keys.index(selected_key), 0)
+        self.update_histogram()
+
+    def update_histogram(self):
+        row = self.table.currentRow()
+        key = self.keys[row] if 0 <= row < len(self.keys) else None
+        self.histogram.set_buckets(self.stats(key).buckets)
+
+def option_value(option):
+    """Return the integer following an option on the command line, or None"""
+    try:
+        return int(sys.argv[sys.argv.index(option) + 1])
+    except (ValueError, IndexError):
+        return None
+
 def main():
     """Main entry point for the application"""
+    # Debug output is off unless asked for with --debug or TVHPLAYER_DEBUG=1
+    debug = '--debug' in sys.argv or os.environ.get('TVHPLAYER_DEBUG', '') not in ('', '0')
+    # --zap-benchmark N zaps through N channels, reports the time to first frame and quits
+    zap_count = option_value('--zap-benchmark')
+    network_caching = option_value('--network-caching')
+    log = Logger(debug=debug)
     try:
         # Force the application to use XCB instead of Wayland
         # This helps with VLC integration under Wayland
@@ -2840,13 +7213,20 @@ def main():
         os.environ["QT_QPA_PLATFORM"] = "xcb"
         
         app = QApplication(sys.argv)
-        player = TVHeadendClient()
+        player = TVHeadendClient(network_caching=network_caching)
         player.show()
-        sys.exit(app.exec_())
+        if zap_count is not None:
+            report_path = os.path.join(player.config_dir, f"zap_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+            benchmark = ZapBenchmark(player, zap_count, report_path, player)
+            benchmark.finished.connect(lambda report: app.quit())
+            benchmark.start()
+        status = app.exec_()
     except Exception as e:
-        print(f"Error starting application: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        sys.exit(1)
+        logger.exception(f"Error starting application: {str(e)}")
+        status = 1
+    finally:
+        log.stop()
+    sys.exit(status)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file